@@ -6,3 +6,7 @@ class AnalyticsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "analytics"
+
+    def ready(self):
+        """Подключение обработчиков сигналов для сводки по игрокам."""
+        import analytics.signals  # noqa: F401
@@ -1,18 +1,18 @@
 import datetime
 
+from analytics.models import PlayerRollup
 from django import forms
-from django.db.models.functions import ExtractYear
-from main.models import City, DisciplineName, Player
+from main.models import City, DisciplineName
 
 
 class AnalyticsFilterForm(forms.Form):
     """Класс-форма для фильтрации страницы с аналитикой."""
 
     birthday = forms.ModelChoiceField(
-        queryset=Player.objects.dates("birthday", "year").values_list(
-            ExtractYear("birthday"),
-            flat=True,
-        ),
+        queryset=PlayerRollup.objects.filter(players_count__gt=0)
+        .values_list("birth_year", flat=True)
+        .distinct()
+        .order_by("birth_year"),
         required=False,
         label="Год рождения",
         widget=forms.Select(attrs={"class": "form-control arrow-before"}),
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.13 on 2026-10-18 09:35
+
+import core.constants
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_rollup(apps, schema_editor):
+    from analytics.rollup import rebuild_rollup
+
+    Player = apps.get_model('main', 'Player')
+    PlayerRollup = apps.get_model('analytics', 'PlayerRollup')
+    rebuild_rollup(Player.objects.all(), rollup_model=PlayerRollup)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('main', '0004_delete_gamedataplayer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('birth_year', models.PositiveSmallIntegerField(verbose_name='Год рождения')),
+                ('gender', models.CharField(choices=[('Мужской', 'Мужской'), ('Женский', 'Женский')], max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], verbose_name='Пол')),
+                ('addition_month', models.DateField(verbose_name='Месяц добавления')),
+                ('is_primary', models.BooleanField(default=True, verbose_name='Основная строка игрока')),
+                ('players_count', models.IntegerField(default=0, verbose_name='Количество игроков')),
+                ('city', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.city', verbose_name='Город')),
+                ('discipline', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='main.disciplinename', verbose_name='Дисциплина')),
+                ('nosology', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='main.nosology', verbose_name='Нозология')),
+            ],
+            options={
+                'verbose_name': 'Сводка по игрокам',
+                'verbose_name_plural': 'Сводка по игрокам',
+            },
+        ),
+        migrations.RunPython(build_rollup, migrations.RunPython.noop),
+    ]
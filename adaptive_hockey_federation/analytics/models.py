@@ -0,0 +1,71 @@
+from core.constants import GENDER_CHOICES, MainConstantsInt
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from main.models import City, DisciplineName, Nosology
+
+
+class PlayerRollup(models.Model):
+    """
+    Предрасчитанное количество игроков в разрезе аналитики.
+
+    Игрок, состоящий в командах из нескольких городов, учитывается в
+    строке каждого города, но основной (is_primary) является только одна
+    из них. Общие итоги считаются по основным строкам, итоги по городу -
+    по всем строкам этого города.
+
+    Строки обновляются инкрементально (см. analytics.rollup), поэтому
+    при параллельных изменениях одна группа может оказаться в нескольких
+    строках - итоги всегда считаются суммой.
+    """
+
+    discipline = models.ForeignKey(
+        DisciplineName,
+        on_delete=models.SET_NULL,
+        null=True,
+        verbose_name=_("Дисциплина"),
+        related_name="+",
+    )
+    city = models.ForeignKey(
+        City,
+        on_delete=models.CASCADE,
+        null=True,
+        verbose_name=_("Город"),
+        related_name="+",
+    )
+    nosology = models.ForeignKey(
+        Nosology,
+        on_delete=models.CASCADE,
+        null=True,
+        verbose_name=_("Нозология"),
+        related_name="+",
+    )
+    birth_year = models.PositiveSmallIntegerField(
+        verbose_name=_("Год рождения"),
+    )
+    gender = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        choices=GENDER_CHOICES,
+        verbose_name=_("Пол"),
+    )
+    addition_month = models.DateField(
+        verbose_name=_("Месяц добавления"),
+    )
+    is_primary = models.BooleanField(
+        verbose_name=_("Основная строка игрока"),
+        default=True,
+    )
+    players_count = models.IntegerField(
+        verbose_name=_("Количество игроков"),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = "Сводка по игрокам"
+        verbose_name_plural = "Сводка по игрокам"
+
+    def __str__(self) -> str:
+        """Строковое представление группы."""
+        return (
+            f"{self.birth_year}, {self.gender}, {self.addition_month}: "
+            f"{self.players_count}"
+        )
@@ -0,0 +1,195 @@
+from collections import Counter
+from itertools import groupby
+from typing import Iterable
+
+from analytics.models import PlayerRollup
+from core.constants import AnalyticsConstants
+from django.db import transaction
+from django.db.models import (
+    Case,
+    F,
+    IntegerField,
+    Model,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from main.models import Player
+
+ROLLUP_DIMENSIONS = (
+    "discipline_id",
+    "city_id",
+    "nosology_id",
+    "birth_year",
+    "gender",
+    "addition_month",
+    "is_primary",
+)
+PLAYER_ROLLUP_VALUES = (
+    "pk",
+    "discipline_name_id",
+    "diagnosis__nosology_id",
+    "birthday",
+    "gender",
+    "addition_date",
+    "team__city_id",
+)
+PLAYER_ROLLUP_FIELDS = frozenset(
+    (
+        "discipline_name",
+        "discipline_name_id",
+        "diagnosis",
+        "diagnosis_id",
+        "birthday",
+        "gender",
+        "addition_date",
+    ),
+)
+
+RollupKey = tuple
+RollupCounter = Counter[RollupKey]
+
+
+def get_rollup_lookup(key: RollupKey) -> dict:
+    """Значения измерений сводки по ключу в виде именованных полей."""
+    return dict(zip(ROLLUP_DIMENSIONS, key, strict=True))
+
+
+def collect_rollup(players: QuerySet) -> RollupCounter:
+    """
+    Вклад игроков выборки в сводку.
+
+    Возвращает Counter, где ключ - значения измерений ROLLUP_DIMENSIONS,
+    а значение - количество игроков. Строки читаются потоком и
+    группируются по игроку, поэтому выборка может быть любого размера.
+    Функция работает и с историческими моделями из миграций.
+    """
+    counter: RollupCounter = Counter()
+    rows = (
+        players.order_by("pk")
+        .values_list(*PLAYER_ROLLUP_VALUES)
+        .iterator(chunk_size=AnalyticsConstants.ROLLUP_CHUNK_SIZE)
+    )
+    for _, player_rows in groupby(rows, key=lambda row: row[0]):
+        player_rows = list(player_rows)
+        _, discipline, nosology, birthday, gender, added, _ = player_rows[0]
+        cities = sorted({row[-1] for row in player_rows if row[-1]}) or [None]
+        for index, city in enumerate(cities):
+            key = (
+                discipline,
+                city,
+                nosology,
+                birthday.year,
+                gender,
+                added.replace(day=1),
+                index == 0,
+            )
+            counter[key] += 1
+    return counter
+
+
+def apply_rollup_delta(
+    before: RollupCounter,
+    after: RollupCounter,
+    rollup_model: type[Model] = PlayerRollup,
+) -> None:
+    """
+    Перенести в сводку разницу между двумя состояниями игроков.
+
+    Группы обрабатываются пачками по ROLLUP_DELTA_BATCH_SIZE: строки
+    пачки читаются одним запросом, изменяются одним UPDATE, новые
+    создаются через bulk_create, поэтому число запросов не зависит от
+    числа групп в пачке. Уменьшение группы, для которой строки уже нет
+    (например, она удалена каскадно вместе с городом), пропускается.
+    """
+    delta = Counter(after)
+    delta.subtract(before)
+    keys = [key for key, value in delta.items() if value]
+    size = AnalyticsConstants.ROLLUP_DELTA_BATCH_SIZE
+    with transaction.atomic():
+        for start in range(0, len(keys), size):
+            apply_rollup_batch(
+                {key: delta[key] for key in keys[start : start + size]},
+                rollup_model,
+            )
+
+
+def apply_rollup_batch(
+    delta: dict[RollupKey, int],
+    rollup_model: type[Model],
+) -> None:
+    """Изменить строки сводки для пачки групп."""
+    condition = Q()
+    for key in delta:
+        condition |= Q(**get_rollup_lookup(key))
+    rows: dict[RollupKey, int] = {}
+    for row_pk, *key in (
+        rollup_model.objects.filter(condition)
+        .order_by("pk")
+        .values_list("pk", *ROLLUP_DIMENSIONS)
+    ):
+        rows.setdefault(tuple(key), row_pk)
+    touched = {rows[key]: value for key, value in delta.items() if key in rows}
+    if touched:
+        rollup_model.objects.filter(pk__in=touched).update(
+            players_count=F("players_count")
+            + Case(
+                *(
+                    When(pk=row_pk, then=Value(value))
+                    for row_pk, value in touched.items()
+                ),
+                output_field=IntegerField(),
+            ),
+        )
+        rollup_model.objects.filter(
+            pk__in=touched,
+            players_count=0,
+        ).delete()
+    rollup_model.objects.bulk_create(
+        rollup_model(players_count=value, **get_rollup_lookup(key))
+        for key, value in delta.items()
+        if key not in rows and value > 0
+    )
+
+
+def rebuild_rollup(
+    players: QuerySet,
+    rollup_model: type[Model] = PlayerRollup,
+) -> int:
+    """Полностью пересчитать сводку. Возвращает число строк сводки."""
+    counter = collect_rollup(players)
+    with transaction.atomic():
+        rollup_model.objects.all().delete()
+        rollup_model.objects.bulk_create(
+            (
+                rollup_model(players_count=value, **get_rollup_lookup(key))
+                for key, value in counter.items()
+            ),
+            batch_size=AnalyticsConstants.ROLLUP_CHUNK_SIZE,
+        )
+    return len(counter)
+
+
+def remember_rollup(instance: Model, player_ids: Iterable[int]) -> None:
+    """Запомнить вклад игроков в сводку до изменения данных."""
+    instance._rollup_players = list(player_ids)
+    instance._rollup_before = collect_rollup(
+        Player.objects.filter(pk__in=instance._rollup_players),
+    )
+
+
+def remember_created(instance: Model, player_ids: Iterable[int]) -> None:
+    """Запомнить новых игроков, которых еще нет в сводке."""
+    instance._rollup_players = list(player_ids)
+    instance._rollup_before = Counter()
+
+
+def flush_rollup(instance: Model) -> None:
+    """Применить к сводке изменения, запомненные remember_rollup."""
+    player_ids = instance.__dict__.pop("_rollup_players", None)
+    before = instance.__dict__.pop("_rollup_before", None)
+    if player_ids is None:
+        return
+    after = collect_rollup(Player.objects.filter(pk__in=player_ids))
+    apply_rollup_delta(before, after)
@@ -4,3 +4,10 @@ ANALYTICS_SEARCH_FIELDS: dict = {
     "discipline": "discipline_name__id",
     "city": "team__city",
 }
+
+ROLLUP_SEARCH_FIELDS: dict = {
+    "timespan": "addition_month__gte",
+    "birthday": "birth_year",
+    "discipline": "discipline_id",
+    "city": "city_id",
+}
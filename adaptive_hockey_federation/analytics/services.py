@@ -0,0 +1,165 @@
+from datetime import datetime
+
+from analytics.models import PlayerRollup
+from analytics.schema import ROLLUP_SEARCH_FIELDS
+from core.constants import AgeLimits, Gender
+from dateutil.relativedelta import relativedelta
+from django.db.models import Count, Q, QuerySet, Sum
+from django.db.models.functions import Coalesce
+from main.models import Player, Team
+
+
+def get_players_subset(queryset: QuerySet) -> QuerySet:
+    """
+    Игроки выборки без ее сортировки и присоединенных таблиц.
+
+    Фильтры выборки переносятся в подзапрос по id, поэтому агрегаты по
+    связям (команды, города) считаются по всем командам игроков, а не
+    только по тем, что попали под условия поиска.
+    """
+    return Player.objects.filter(pk__in=queryset.order_by().values("pk"))
+
+
+def get_dashboard_counts(queryset: QuerySet) -> dict[str, int]:
+    """Основные показатели по игрокам выборки одним запросом."""
+    date_adult = datetime.now() - relativedelta(years=AgeLimits.ADULT_AGE)
+    return get_players_subset(queryset).aggregate(
+        players=Count("pk", distinct=True),
+        teams=Count("team", distinct=True),
+        cities=Count("team__city", distinct=True),
+        boys=Count("pk", filter=Q(gender=Gender.MAN), distinct=True),
+        girls=Count("pk", filter=Q(gender=Gender.WOMAN), distinct=True),
+        under_adult=Count(
+            "pk",
+            filter=Q(birthday__gte=date_adult),
+            distinct=True,
+        ),
+        over_adult=Count(
+            "pk",
+            filter=Q(birthday__lt=date_adult),
+            distinct=True,
+        ),
+    )
+
+
+def get_nosology_counts(queryset: QuerySet) -> list[tuple[str, int]]:
+    """Количество игроков выборки по нозологиям одним запросом."""
+    return list(
+        get_players_subset(queryset)
+        .filter(diagnosis__nosology__isnull=False)
+        .values("diagnosis__nosology__name")
+        .annotate(players=Count("pk"))
+        .order_by("diagnosis__nosology__name")
+        .values_list("diagnosis__nosology__name", "players"),
+    )
+
+
+def get_dashboard(queryset: QuerySet) -> dict[str, list[tuple[str, int]]]:
+    """
+    Данные дашборда страницы аналитики.
+
+    Все показатели считаются двумя запросами (условная агрегация и
+    группировка по нозологиям) независимо от числа нозологий.
+    """
+    return format_dashboard(
+        get_dashboard_counts(queryset),
+        get_nosology_counts(queryset),
+    )
+
+
+def can_use_rollup(dict_param: dict) -> bool:
+    """Можно ли посчитать дашборд по сводке для заданных фильтров."""
+    return set(dict_param).issubset(ROLLUP_SEARCH_FIELDS)
+
+
+def get_rollup_dashboard(
+    dict_param: dict,
+    queryset: QuerySet,
+) -> dict[str, list[tuple[str, int]]]:
+    """
+    Данные дашборда страницы аналитики по сводке PlayerRollup.
+
+    Показатели читаются из сводки, размер которой зависит от числа
+    групп, а не игроков. queryset - игроки с теми же фильтрами,
+    dict_param - параметры фильтров страницы.
+
+    По таблице игроков остаются два запроса:
+
+    - количество команд и городов. Это число различных значений, его
+      нельзя сложить из строк сводки: одна команда входит в группы
+      многих игроков. Кроме того, при фильтре по городу учитываются все
+      команды отобранных игроков, в том числе из других городов, а для
+      этого нужно знать, какие строки относятся к одному игроку.
+      Запрос идет по индексу связи игроков с командами;
+    - уточнение возраста для одного года рождения, в котором проходит
+      граница совершеннолетия. Граница сдвигается каждый день, а хранить
+      в сводке дату рождения значит умножить число групп на число дней
+      в году. Запрос читает по индексу player_birthday_idx только
+      игроков этого года.
+    """
+    lookup = {
+        ROLLUP_SEARCH_FIELDS[key]: values[0]
+        for key, values in dict_param.items()
+    }
+    rows = PlayerRollup.objects.filter(**lookup)
+    date_adult = datetime.now() - relativedelta(years=AgeLimits.ADULT_AGE)
+    counted = Q() if "city" in dict_param else Q(is_primary=True)
+
+    def total(condition: Q | None = None) -> Coalesce:
+        condition = counted & condition if condition else counted
+        return Coalesce(Sum("players_count", filter=condition), 0)
+
+    counts = rows.aggregate(
+        players=total(),
+        boys=total(Q(gender=Gender.MAN)),
+        girls=total(Q(gender=Gender.WOMAN)),
+        under_adult=total(Q(birth_year__gt=date_adult.year)),
+        over_adult=total(Q(birth_year__lt=date_adult.year)),
+    )
+    counts.update(
+        Team.objects.filter(
+            team_players__in=get_players_subset(queryset).values("pk"),
+        ).aggregate(
+            teams=Count("pk", distinct=True),
+            cities=Count("city", distinct=True),
+        ),
+    )
+    boundary_year = get_players_subset(queryset).filter(
+        birthday__year=date_adult.year,
+    )
+    boundary = boundary_year.aggregate(
+        under_adult=Count("pk", filter=Q(birthday__gte=date_adult)),
+        over_adult=Count("pk", filter=Q(birthday__lt=date_adult)),
+    )
+    counts["under_adult"] += boundary["under_adult"]
+    counts["over_adult"] += boundary["over_adult"]
+    nosology = list(
+        rows.filter(counted, nosology__isnull=False)
+        .values("nosology__name")
+        .annotate(total=Sum("players_count"))
+        .filter(total__gt=0)
+        .order_by("nosology__name")
+        .values_list("nosology__name", "total"),
+    )
+    return format_dashboard(counts, nosology)
+
+
+def format_dashboard(
+    counts: dict[str, int],
+    nosology: list[tuple[str, int]],
+) -> dict[str, list[tuple[str, int]]]:
+    """Разложить показатели по блокам дашборда."""
+    return {
+        "primary": [
+            ("игроков", counts["players"]),
+            ("команд", counts["teams"]),
+            ("городов", counts["cities"]),
+        ],
+        "secondary": [
+            ("мальчиков", counts["boys"]),
+            ("девочек", counts["girls"]),
+            (f"младше {AgeLimits.ADULT_AGE}", counts["under_adult"]),
+            (f"старше {AgeLimits.ADULT_AGE}", counts["over_adult"]),
+        ],
+        "nosology": nosology,
+    }
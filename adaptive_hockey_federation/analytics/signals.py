@@ -0,0 +1,119 @@
+from analytics.rollup import (
+    PLAYER_ROLLUP_FIELDS,
+    flush_rollup,
+    remember_created,
+    remember_rollup,
+)
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from main.models import Diagnosis, Player, Team
+
+PLAYER_LOOKUPS = {
+    Team: ("city_id", "team"),
+    Diagnosis: ("nosology_id", "diagnosis"),
+}
+
+
+def affects_rollup(update_fields) -> bool:
+    """Затрагивает ли сохранение игрока поля, входящие в сводку."""
+    return update_fields is None or bool(
+        PLAYER_ROLLUP_FIELDS.intersection(update_fields),
+    )
+
+
+@receiver(pre_save, sender=Player)
+def player_rollup_pre_save(sender, instance, raw, update_fields, **kwargs):
+    if instance.pk and not raw and affects_rollup(update_fields):
+        remember_rollup(instance, [instance.pk])
+
+
+@receiver(post_save, sender=Player)
+def player_rollup_post_save(
+    sender,
+    instance,
+    created,
+    raw,
+    update_fields,
+    **kwargs,
+):
+    if raw or not affects_rollup(update_fields):
+        return
+    if created:
+        remember_created(instance, [instance.pk])
+    flush_rollup(instance)
+
+
+@receiver(pre_delete, sender=Player)
+def player_rollup_pre_delete(sender, instance, **kwargs):
+    remember_rollup(instance, [instance.pk])
+
+
+@receiver(m2m_changed, sender=Player.team.through)
+def player_team_rollup_changed(
+    sender,
+    instance,
+    action,
+    reverse,
+    pk_set,
+    **kwargs,
+):
+    if action.startswith("pre_"):
+        if not reverse:
+            player_ids = [instance.pk]
+        elif pk_set is not None:
+            player_ids = list(pk_set)
+        else:
+            player_ids = instance.team_players.values_list("pk", flat=True)
+        remember_rollup(instance, player_ids)
+    else:
+        flush_rollup(instance)
+
+
+@receiver(pre_save, sender=Team)
+@receiver(pre_save, sender=Diagnosis)
+def related_rollup_pre_save(sender, instance, raw, **kwargs):
+    """Смена города команды или нозологии диагноза меняет группы игроков."""
+    field, lookup = PLAYER_LOOKUPS[sender]
+    if raw or not instance.pk:
+        return
+    old_value = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list(field, flat=True)
+        .first()
+    )
+    if old_value != getattr(instance, field):
+        remember_rollup(
+            instance,
+            Player.objects.filter(**{lookup: instance.pk}).values_list(
+                "pk",
+                flat=True,
+            ),
+        )
+
+
+@receiver(pre_delete, sender=Team)
+@receiver(pre_delete, sender=Diagnosis)
+def related_rollup_pre_delete(sender, instance, **kwargs):
+    _, lookup = PLAYER_LOOKUPS[sender]
+    remember_rollup(
+        instance,
+        Player.objects.filter(**{lookup: instance.pk}).values_list(
+            "pk",
+            flat=True,
+        ),
+    )
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Diagnosis)
+@receiver(post_delete, sender=Player)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Diagnosis)
+def rollup_flush(sender, instance, **kwargs):
+    flush_rollup(instance)
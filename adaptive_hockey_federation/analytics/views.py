@@ -1,11 +1,21 @@
-from datetime import datetime
-
 from analytics.forms import AnalyticsFilterForm
-from core.constants import GENDER_CHOICES
+from analytics.services import (
+    can_use_rollup,
+    get_dashboard,
+    get_rollup_dashboard,
+)
 from core.permissions import AdminRequiredMixin
-from dateutil.relativedelta import relativedelta
+from django.utils import timezone
 from main.controllers.player_views import PlayersListView
-from main.models import Nosology, Player, Team
+from main.models import (
+    City,
+    Diagnosis,
+    DisciplineLevel,
+    DisciplineName,
+    Nosology,
+    Player,
+    Team,
+)
 from unloads.utils import model_get_queryset
 
 
@@ -15,13 +25,33 @@ class AnalyticsListView(
 ):
     """View-класс для отображения страницы с аналитикой."""
 
+    watermark_models = (
+        Player,
+        Team,
+        City,
+        Diagnosis,
+        Nosology,
+        DisciplineName,
+        DisciplineLevel,
+    )
     template_name = "analytics/analytics.html"
 
+    def get_watermark_extra(self) -> str:
+        """Деление игроков по совершеннолетию зависит от текущей даты."""
+        return timezone.localdate().isoformat()
+
+    def get_filter_params(self) -> dict[str, list[str]]:
+        """Непустые параметры фильтрации страницы (без номера страницы)."""
+        return {
+            key: value
+            for key, value in self.request.GET.lists()
+            if value != [""] and key != self.page_kwarg
+        }
+
     def get_queryset(self):
         """Метод для получения QuerySet с заданными параметрами."""
         queryset = super().get_queryset()
-        dict_param = dict(self.request.GET)
-        dict_param = {k: v for k, v in dict_param.items() if v != [""]}
+        dict_param = self.get_filter_params()
         if len(dict_param) > 0:
             queryset = model_get_queryset(
                 "analytics",
@@ -29,70 +59,18 @@ class AnalyticsListView(
                 dict_param,
                 queryset,
             )
-        return (
-            queryset.select_related("diagnosis")
-            .select_related("discipline_name")
-            .order_by("surname")
-        )
+        return queryset.order_by("surname")
 
     def get_context_data(self, *, object_list=None, **kwargs):
         """Метод для получения словаря context в шаблоне страницы."""
         context = super().get_context_data(**kwargs)
-        date_18_years_ago = datetime.now() - relativedelta(years=18)
         context["form"] = AnalyticsFilterForm(self.request.GET or None)
-        context["dashboard"] = {
-            "primary": [
-                ("игроков", self.get_queryset().count()),
-                (
-                    "команд",
-                    teams_count := Team.objects.filter(
-                        id__in=self.get_queryset()
-                        .values_list("team", flat=True)
-                        .distinct(),
-                    ).count(),
-                ),
-                ("городов", teams_count),
-            ],
-            "secondary": [
-                (
-                    "мальчиков",
-                    self.get_queryset()
-                    .filter(gender=GENDER_CHOICES[0][1])
-                    .count(),
-                ),
-                (
-                    "девочек",
-                    self.get_queryset()
-                    .filter(gender=GENDER_CHOICES[1][1])
-                    .count(),
-                ),
-                (
-                    "младше 18",
-                    self.get_queryset()
-                    .filter(birthday__gte=date_18_years_ago)
-                    .count(),
-                ),
-                (
-                    "старше 18",
-                    self.get_queryset()
-                    .filter(birthday__lt=date_18_years_ago)
-                    .count(),
-                ),
-            ],
-            "nosology": [
-                (
-                    f"{nosology.name}",
-                    self.get_queryset()
-                    .filter(diagnosis__nosology=nosology)
-                    .count(),
-                )
-                for i, nosology in enumerate(
-                    Nosology.objects.filter(
-                        diagnosis__in=self.get_queryset()
-                        .values_list("diagnosis", flat=True)
-                        .distinct(),
-                    ).distinct(),
-                )
-            ],
-        }
+        dict_param = self.get_filter_params()
+        if can_use_rollup(dict_param):
+            context["dashboard"] = get_rollup_dashboard(
+                dict_param,
+                self.object_list,
+            )
+        else:
+            context["dashboard"] = get_dashboard(self.object_list)
         return context
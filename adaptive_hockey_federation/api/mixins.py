@@ -0,0 +1,105 @@
+from typing import Iterable
+
+from core.watermarks import conditional_get
+from django.db.models import Model, Prefetch
+from rest_framework.exceptions import ValidationError
+
+
+class SparseFieldsetMixin:
+    """
+    Миксин представления с выбором полей через параметр ?fields=.
+
+    select_related_fields и prefetch_fields - связи, которые нужно
+    загрузить для поля сериализатора. Загружаются только связи
+    запрошенных полей, поэтому узкий запрос не тянет лишние таблицы.
+    """
+
+    fields_query_param = "fields"
+    select_related_fields: dict[str, tuple[str, ...]] = {}
+    prefetch_fields: dict[str, tuple[str | Prefetch, ...]] = {}
+
+    def get_requested_fields(self) -> tuple[str, ...] | None:
+        """Запрошенные поля или None, если выводятся все поля."""
+        if not hasattr(self, "_requested_fields"):
+            self._requested_fields = self.parse_fields(
+                self.request.query_params.get(self.fields_query_param),
+            )
+        return self._requested_fields
+
+    def parse_fields(self, value: str | None) -> tuple[str, ...] | None:
+        """Разобрать список полей через запятую."""
+        if not value:
+            return None
+        fields = tuple(
+            dict.fromkeys(
+                name for name in map(str.strip, value.split(",")) if name
+            ),
+        )
+        unknown = set(fields) - set(self.get_serializer_class().Meta.fields)
+        if unknown:
+            raise ValidationError(
+                {
+                    self.fields_query_param: (
+                        f"Неизвестные поля: {', '.join(sorted(unknown))}"
+                    ),
+                },
+            )
+        return fields
+
+    def get_serializer(self, *args, **kwargs):
+        """Сериализатор только с запрошенными полями."""
+        kwargs.setdefault("fields", self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        """Выборка с загрузкой связей, нужных запрошенным полям."""
+        queryset = super().get_queryset()
+        fields = (
+            self.get_requested_fields()
+            or self.get_serializer_class().Meta.fields
+        )
+        select_related = sorted(
+            {
+                lookup
+                for name in fields
+                for lookup in self.select_related_fields.get(name, ())
+            },
+        )
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        prefetch = [
+            lookup
+            for name in fields
+            for lookup in self.prefetch_fields.get(name, ())
+        ]
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+
+class WatermarkViewSetMixin:
+    """
+    Миксин набора представлений с ETag по отметкам изменений моделей.
+
+    watermark_models - модели, данные которых попадают в ответ. ETag
+    учитывает формат ответа (JSON или страница browsable API).
+    """
+
+    watermark_models: Iterable[type[Model]] = ()
+
+    def conditional(self, request, handler, *args, **kwargs):
+        """Ответ handler с проверкой условных заголовков."""
+        return conditional_get(
+            request,
+            self.watermark_models,
+            lambda: handler(request, *args, **kwargs),
+            request.accepted_renderer.format,
+        )
+
+    def list(self, request, *args, **kwargs):
+        """Список записей."""
+        return self.conditional(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Отдельная запись."""
+        return self.conditional(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,20 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class RegistryCursorPagination(CursorPagination):
+    """
+    Курсорная пагинация выгрузки реестра.
+
+    Записи идут по возрастанию первичного ключа, поэтому страницы не
+    сдвигаются при добавлении записей во время синхронизации, а запрос
+    страницы не зависит от ее номера.
+    """
+
+    ordering = "pk"
+    page_size_query_param = "page_size"
+
+    def __init__(self):
+        """Размеры страниц из настроек API_PAGE_SIZE, API_MAX_PAGE_SIZE."""
+        self.page_size = settings.API_PAGE_SIZE
+        self.max_page_size = settings.API_MAX_PAGE_SIZE
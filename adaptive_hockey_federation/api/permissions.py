@@ -0,0 +1,22 @@
+from rest_framework.permissions import BasePermission
+
+
+class RegistryPermission(BasePermission):
+    """
+    Доступ к данным реестра по разрешениям пользователя.
+
+    Для списка требуется то же разрешение, что и для страницы списка
+    на сайте (list_permission представления), для отдельной записи -
+    разрешение на просмотр модели.
+    """
+
+    def has_permission(self, request, view):
+        """Проверить разрешение на действие представления."""
+        if not request.user or not request.user.is_authenticated:
+            return False
+        if view.action == "list":
+            return request.user.has_perm(view.list_permission)
+        opts = view.queryset.model._meta
+        return request.user.has_perm(
+            f"{opts.app_label}.view_{opts.model_name}",
+        )
@@ -0,0 +1,159 @@
+from competitions.models import Competition
+from core.models import ChangeLogEntry
+from main.models import Player, StaffTeamMember, Team
+from rest_framework import serializers
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """
+    Сериализатор с выбором выводимых полей.
+
+    Параметр fields - имена полей, которые останутся в ответе
+    (None - все поля).
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        """Убрать поля, не вошедшие в fields."""
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class PlayerSerializer(SparseFieldsetSerializer):
+    """Игрок."""
+
+    diagnosis_name = serializers.CharField(
+        source="diagnosis.name",
+        read_only=True,
+    )
+    discipline_name_name = serializers.CharField(
+        source="discipline_name.name",
+        read_only=True,
+    )
+    discipline_level_name = serializers.CharField(
+        source="discipline_level.name",
+        read_only=True,
+    )
+    teams = serializers.PrimaryKeyRelatedField(
+        source="team",
+        many=True,
+        read_only=True,
+    )
+
+    class Meta:
+        model = Player
+        fields = (
+            "id",
+            "surname",
+            "name",
+            "patronymic",
+            "birthday",
+            "gender",
+            "addition_date",
+            "diagnosis",
+            "diagnosis_name",
+            "discipline_name",
+            "discipline_name_name",
+            "discipline_level",
+            "discipline_level_name",
+            "level_revision",
+            "position",
+            "number",
+            "is_captain",
+            "is_assistent",
+            "identity_document",
+            "teams",
+        )
+        read_only_fields = fields
+
+
+class TeamSerializer(SparseFieldsetSerializer):
+    """Команда."""
+
+    city_name = serializers.CharField(source="city.name", read_only=True)
+    discipline_name_name = serializers.CharField(
+        source="discipline_name.name",
+        read_only=True,
+    )
+
+    class Meta:
+        model = Team
+        fields = (
+            "id",
+            "name",
+            "city",
+            "city_name",
+            "discipline_name",
+            "discipline_name_name",
+            "curator",
+        )
+        read_only_fields = fields
+
+
+class StaffTeamMemberSerializer(SparseFieldsetSerializer):
+    """Сотрудник команды."""
+
+    surname = serializers.CharField(
+        source="staff_member.surname",
+        read_only=True,
+    )
+    name = serializers.CharField(source="staff_member.name", read_only=True)
+    patronymic = serializers.CharField(
+        source="staff_member.patronymic",
+        read_only=True,
+    )
+    phone = serializers.CharField(source="staff_member.phone", read_only=True)
+    teams = serializers.PrimaryKeyRelatedField(
+        source="team",
+        many=True,
+        read_only=True,
+    )
+
+    class Meta:
+        model = StaffTeamMember
+        fields = (
+            "id",
+            "staff_member",
+            "surname",
+            "name",
+            "patronymic",
+            "phone",
+            "staff_position",
+            "qualification",
+            "notes",
+            "teams",
+        )
+        read_only_fields = fields
+
+
+class CompetitionSerializer(SparseFieldsetSerializer):
+    """Соревнование."""
+
+    city_name = serializers.CharField(source="city.name", read_only=True)
+
+    class Meta:
+        model = Competition
+        fields = (
+            "id",
+            "title",
+            "date_start",
+            "date_end",
+            "city",
+            "city_name",
+            "location",
+            "teams",
+            "disciplines",
+        )
+        read_only_fields = fields
+
+
+class ChangeLogEntrySerializer(serializers.ModelSerializer):
+    """Запись ленты изменений."""
+
+    seq = serializers.IntegerField(source="pk")
+
+    class Meta:
+        model = ChangeLogEntry
+        fields = ("seq", "model", "object_id", "action", "changed_at")
+        read_only_fields = fields
@@ -0,0 +1,28 @@
+from api import views
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+app_name = "api"
+
+router = DefaultRouter()
+router.register("players", views.PlayerViewSet, basename="players")
+router.register("teams", views.TeamViewSet, basename="teams")
+router.register(
+    "staff-team-members",
+    views.StaffTeamMemberViewSet,
+    basename="staff_team_members",
+)
+router.register(
+    "competitions",
+    views.CompetitionViewSet,
+    basename="competitions",
+)
+
+urlpatterns = [
+    path(
+        "<str:version>/changes/",
+        views.ChangeFeedView.as_view(),
+        name="changes",
+    ),
+    path("<str:version>/", include(router.urls)),
+]
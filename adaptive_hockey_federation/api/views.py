@@ -0,0 +1,209 @@
+from api.mixins import SparseFieldsetMixin, WatermarkViewSetMixin
+from api.pagination import RegistryCursorPagination
+from api.permissions import RegistryPermission
+from api.serializers import (
+    ChangeLogEntrySerializer,
+    CompetitionSerializer,
+    PlayerSerializer,
+    StaffTeamMemberSerializer,
+    TeamSerializer,
+)
+from competitions.models import Competition
+from core.changelog import CHANGE_LOG_MODELS, get_change_feed
+from django.conf import settings
+from django.db.models import Prefetch
+from main.models import (
+    City,
+    Diagnosis,
+    DisciplineLevel,
+    DisciplineName,
+    Player,
+    StaffMember,
+    StaffTeamMember,
+    Team,
+)
+from rest_framework.authentication import (
+    BasicAuthentication,
+    SessionAuthentication,
+)
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.viewsets import ReadOnlyModelViewSet
+
+AUTHENTICATION_CLASSES = (SessionAuthentication, BasicAuthentication)
+
+
+def parse_number(value: str, param: str) -> int:
+    """Неотрицательное целое из параметра запроса."""
+    if not value.isdigit():
+        raise ValidationError({param: "Ожидается неотрицательное целое."})
+    return int(value)
+
+
+def prefetch_ids(lookup: str, model) -> Prefetch:
+    """Загрузка связи "многие ко многим" только с первичными ключами."""
+    return Prefetch(lookup, queryset=model.objects.only("pk").order_by())
+
+
+class RegistryViewSet(
+    WatermarkViewSetMixin,
+    SparseFieldsetMixin,
+    ReadOnlyModelViewSet,
+):
+    """
+    Базовый набор представлений API реестра (только чтение).
+
+    list_permission - разрешение, требующееся для получения списка.
+    Параметр ?ids= ограничивает список записями с указанными номерами,
+    например изменившимися по ленте изменений.
+    """
+
+    authentication_classes = AUTHENTICATION_CLASSES
+    permission_classes = (RegistryPermission,)
+    pagination_class = RegistryCursorPagination
+    list_permission = ""
+    ids_query_param = "ids"
+
+    def get_queryset(self):
+        """Выборка с фильтром по номерам записей."""
+        queryset = super().get_queryset()
+        value = self.request.query_params.get(self.ids_query_param)
+        if value:
+            queryset = queryset.filter(
+                pk__in=[
+                    parse_number(item.strip(), self.ids_query_param)
+                    for item in value.split(",")
+                    if item.strip()
+                ],
+            )
+        return queryset
+
+
+class PlayerViewSet(RegistryViewSet):
+    """Игроки."""
+
+    queryset = Player.objects.defer("search_vector")
+    serializer_class = PlayerSerializer
+    list_permission = "main.list_view_player"
+    watermark_models = (
+        Player,
+        Team,
+        Diagnosis,
+        DisciplineName,
+        DisciplineLevel,
+    )
+    select_related_fields = {
+        "diagnosis_name": ("diagnosis",),
+        "discipline_name_name": ("discipline_name",),
+        "discipline_level_name": ("discipline_level",),
+    }
+    prefetch_fields = {"teams": (prefetch_ids("team", Team),)}
+
+
+class TeamViewSet(RegistryViewSet):
+    """Команды."""
+
+    queryset = Team.objects.defer("search_vector")
+    serializer_class = TeamSerializer
+    list_permission = "main.list_view_team"
+    watermark_models = (Team, City, DisciplineName)
+    select_related_fields = {
+        "city_name": ("city",),
+        "discipline_name_name": ("discipline_name",),
+    }
+
+
+class StaffTeamMemberViewSet(RegistryViewSet):
+    """Сотрудники команд."""
+
+    queryset = StaffTeamMember.objects.all()
+    serializer_class = StaffTeamMemberSerializer
+    list_permission = "main.list_view_staff"
+    watermark_models = (StaffTeamMember, StaffMember, Team)
+    select_related_fields = {
+        "surname": ("staff_member",),
+        "name": ("staff_member",),
+        "patronymic": ("staff_member",),
+        "phone": ("staff_member",),
+    }
+    prefetch_fields = {"teams": (prefetch_ids("team", Team),)}
+
+
+class CompetitionViewSet(RegistryViewSet):
+    """Соревнования."""
+
+    queryset = Competition.objects.all()
+    serializer_class = CompetitionSerializer
+    list_permission = "competitions.list_view_competition"
+    watermark_models = (Competition, City, Team, DisciplineName)
+    select_related_fields = {"city_name": ("city",)}
+    prefetch_fields = {
+        "teams": (prefetch_ids("teams", Team),),
+        "disciplines": (prefetch_ids("disciplines", DisciplineName),),
+    }
+
+
+class ChangeFeedView(APIView):
+    """
+    Лента изменений реестра.
+
+    Параметры: since - номер последнего полученного изменения (0 - с
+    начала журнала), models - метки моделей через запятую, page_size -
+    количество записей. Удаленные записи приходят с действием "deleted".
+    Следующий запрос делается с since=next_since, пока more истинно.
+    """
+
+    authentication_classes = AUTHENTICATION_CLASSES
+    permission_classes = (IsAuthenticated,)
+
+    def get_labels(self, request) -> list[str]:
+        """Метки моделей ленты, доступных пользователю для просмотра."""
+        value = request.query_params.get("models")
+        labels = CHANGE_LOG_MODELS
+        if value:
+            labels = {label.strip().lower() for label in value.split(",")}
+            unknown = labels - CHANGE_LOG_MODELS
+            if unknown:
+                raise ValidationError(
+                    {
+                        "models": (
+                            "Журнал не ведется для: "
+                            f"{', '.join(sorted(unknown))}"
+                        ),
+                    },
+                )
+        return sorted(
+            label
+            for label in labels
+            if request.user.has_perm(label.replace(".", ".view_", 1))
+        )
+
+    def get(self, request, *args, **kwargs):
+        """Записи журнала после номера since."""
+        since = parse_number(request.query_params.get("since", "0"), "since")
+        limit = min(
+            parse_number(
+                request.query_params.get(
+                    "page_size",
+                    str(settings.API_PAGE_SIZE),
+                ),
+                "page_size",
+            )
+            or settings.API_PAGE_SIZE,
+            settings.API_MAX_PAGE_SIZE,
+        )
+        entries = list(
+            get_change_feed(since, self.get_labels(request), limit + 1),
+        )
+        more = len(entries) > limit
+        entries = entries[:limit]
+        return Response(
+            {
+                "since": since,
+                "next_since": entries[-1].pk if entries else since,
+                "more": more,
+                "results": ChangeLogEntrySerializer(entries, many=True).data,
+            },
+        )
@@ -8,6 +8,7 @@ from competitions.schema import (
     get_competitions_table_data,
     get_competitions_table_head,
 )
+from core.watermarks import ConditionalGetMixin
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
@@ -30,20 +31,23 @@ from django.views.generic.edit import (
     DeletionMixin,
     UpdateView,
 )
+from django.utils import timezone
 from django.views.generic.list import ListView
-from main.controllers.team_views import CityListMixin
 from main.controllers.utils import get_team_href
+from main.models import City, DisciplineName
 from users.utilits.send_mails import send_welcome_mail
 
 
 class CompetitionListView(
     LoginRequiredMixin,
     UserPassesTestMixin,
+    ConditionalGetMixin,
     ListView,
 ):
     """Представление списка соревнований."""
 
     model = Competition
+    watermark_models = (Competition, City, Team, DisciplineName)
     template_name = "main/competitions/competitions.html"
     context_object_name = "competitions"
     paginate_by = 10
@@ -60,6 +64,10 @@ class CompetitionListView(
         """Сообщение об отказе в доступе."""
         return "Отсутствует разрешение на просмотр списка соревнований."
 
+    def get_watermark_extra(self) -> str:
+        """Активность соревнований зависит от текущей даты."""
+        return timezone.localdate().isoformat()
+
     def handle_no_permission(self):
         """Обработка ситуации, когда у пользователя нет прав."""
         if not self.request.user.is_authenticated:
@@ -147,7 +155,6 @@ class UpdateCompetitionView(
     LoginRequiredMixin,
     PermissionRequiredMixin,
     UpdateView,
-    CityListMixin,
 ):
     """Обновление информации о соревновании."""
 
@@ -182,7 +189,6 @@ class UpdateCompetitionView(
     def get_context_data(self, **kwargs):
         """Метод для получения словаря context в шаблоне страницы."""
         context = super().get_context_data(**kwargs)
-        context["cities"] = self.get_cities()
         context["page_title"] = "Редактирование соревнования"
         return context
 
@@ -287,7 +293,6 @@ class CreateCompetitionView(
     LoginRequiredMixin,
     PermissionRequiredMixin,
     CreateView,
-    CityListMixin,
 ):
     """Представление создания соревнования."""
 
@@ -310,7 +315,6 @@ class CreateCompetitionView(
     def get_context_data(self, **kwargs):
         """Метод для получения словаря context в шаблоне страницы."""
         context = super(CreateCompetitionView, self).get_context_data(**kwargs)
-        context["cities"] = self.get_cities()
         context["page_title"] = "Создать соревнование"
         return context
 
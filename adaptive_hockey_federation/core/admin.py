@@ -0,0 +1,22 @@
+from core.models import OutgoingEmail
+from django.contrib import admin
+
+
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    """Админка для очереди исходящих писем."""
+
+    list_display = (
+        "subject",
+        "to",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("subject",)
+    ordering = ["-created_at"]
+    readonly_fields = ("created_at", "sent_at", "locked_at", "error")
+
+
+admin.site.register(OutgoingEmail, OutgoingEmailAdmin)
@@ -6,3 +6,7 @@ class CoreConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        """Подключение обработчиков отметок и журнала изменений."""
+        import core.signals  # noqa: F401
@@ -0,0 +1,163 @@
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Callable
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+BASELINE_FORMAT = 1
+LATENCY_METRICS = ("p50_ms", "p90_ms")
+
+
+@dataclass
+class BenchmarkCase:
+    """Замеряемое действие: запрос к представлению или фоновая задача."""
+
+    name: str
+    run: Callable[[], Any]
+
+
+@dataclass
+class BenchmarkResult:
+    """Результат замера: задержки, число запросов к БД и пик памяти."""
+
+    name: str
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    queries: int
+    peak_memory_kb: int
+
+
+def request_case(
+    client: Client,
+    name: str,
+    url: str,
+    **headers: str,
+) -> BenchmarkCase:
+    """Замер GET-запроса. Ответ с кодом ошибки прерывает замер."""
+
+    def run():
+        response = client.get(url, headers=headers)
+        if response.status_code >= HTTPStatus.BAD_REQUEST:
+            raise RuntimeError(f"{name}: {url} - {response.status_code}")
+        return response
+
+    return BenchmarkCase(name, run)
+
+
+def get_percentile(values: list[float], percent: int) -> float:
+    """Перцентиль выборки (для одного значения - само значение)."""
+    if len(values) < 2:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def measure_case(
+    case: BenchmarkCase,
+    repeat: int,
+    warmup: int,
+    using: str = DEFAULT_DB_ALIAS,
+) -> BenchmarkResult:
+    """
+    Замерить действие.
+
+    После warmup прогонов без замера действие выполняется repeat раз
+    для задержек и числа запросов (берется максимум - кеши уже
+    прогреты), затем еще раз под tracemalloc для пика памяти: трассировка
+    сильно замедляет код и не должна влиять на задержки.
+    """
+    for _ in range(warmup):
+        case.run()
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        with CaptureQueriesContext(connections[using]) as context:
+            started = time.perf_counter()
+            case.run()
+            timings.append((time.perf_counter() - started) * 1000)
+        queries = max(queries, len(context.captured_queries))
+    tracemalloc.start()
+    try:
+        case.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(
+        name=case.name,
+        p50_ms=round(get_percentile(timings, 50), 3),
+        p90_ms=round(get_percentile(timings, 90), 3),
+        p99_ms=round(get_percentile(timings, 99), 3),
+        queries=queries,
+        peak_memory_kb=peak // 1024,
+    )
+
+
+def save_baseline(
+    path: Path,
+    results: list[BenchmarkResult],
+    params: dict,
+) -> None:
+    """Сохранить результаты как эталон для следующих замеров."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "format": BASELINE_FORMAT,
+                "params": params,
+                "results": {result.name: asdict(result) for result in results},
+            },
+            file,
+            ensure_ascii=False,
+            indent=2,
+        )
+
+
+def load_baseline(path: Path) -> dict | None:
+    """Эталон замеров или None, если он еще не сохранен."""
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"Неподдерживаемый формат эталона {path}")
+    return baseline
+
+
+def find_regressions(
+    baseline: dict,
+    results: list[BenchmarkResult],
+    threshold: float,
+) -> list[str]:
+    """
+    Ухудшения относительно эталона.
+
+    Задержки и пик памяти сравниваются с допуском threshold (доля,
+    0.2 - на 20% хуже эталона), число запросов к БД - точно: оно не
+    зависит от нагрузки машины.
+    """
+    regressions = []
+    for result in results:
+        expected = baseline["results"].get(result.name)
+        if expected is None:
+            continue
+        for metric in (*LATENCY_METRICS, "peak_memory_kb"):
+            limit = expected[metric] * (1 + threshold)
+            actual = getattr(result, metric)
+            if actual > limit:
+                regressions.append(
+                    f"{result.name}: {metric} {actual} > {limit:.3f} "
+                    f"(эталон {expected[metric]})",
+                )
+        if result.queries > expected["queries"]:
+            regressions.append(
+                f"{result.name}: queries {result.queries} > "
+                f"{expected['queries']}",
+            )
+    return regressions
@@ -0,0 +1,144 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.db.models import Model
+
+MISSING = object()
+NOT_FOUND = "__not_found__"
+
+
+class DictionaryCache:
+    """
+    Кеш справочников (городов, дисциплин, нозологий, диагнозов и т.п.).
+
+    Два уровня: LRU-словарь процесса перед общим кешем Django
+    (DICTIONARY_CACHE_ALIAS). Ключи включают номер версии модели; при
+    изменении справочника версия увеличивается, и старые значения
+    перестают читаться на обоих уровнях. Номер версии процесс
+    перепроверяет в общем кеше не чаще раза в DICTIONARY_CACHE_VERSION_TTL
+    секунд, поэтому изменения из других процессов видны с такой
+    задержкой, а изменения текущего процесса - сразу.
+
+    Поэтому общий кеш должен быть общим и для всех процессов сервера
+    (gunicorn запускает несколько): по умолчанию это таблица БД
+    django_cache, ее создает миграция core.0004_cache_table. С кешем в
+    памяти процесса (locmemcache://) изменения из других процессов не
+    видны до истечения DICTIONARY_CACHE_TIMEOUT.
+    """
+
+    def __init__(self):
+        """Создает пустой локальный кеш процесса."""
+        self._local: OrderedDict[str, Any] = OrderedDict()
+        self._versions: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self):
+        """Общий для всех процессов кеш Django."""
+        return caches[settings.DICTIONARY_CACHE_ALIAS]
+
+    @staticmethod
+    def get_label(model: type[Model]) -> str:
+        """Метка модели для ключей кеша."""
+        return f"dictionary:{model._meta.label_lower}"
+
+    def get_version(self, model: type[Model]) -> int:
+        """Текущая версия справочника."""
+        label = self.get_label(model)
+        now = time.monotonic()
+        cached = self._versions.get(label)
+        if cached and now - cached[1] < settings.DICTIONARY_CACHE_VERSION_TTL:
+            return cached[0]
+        version_key = f"{label}:version"
+        version = self.shared.get(version_key)
+        if version is None:
+            self.shared.add(version_key, 1, timeout=None)
+            version = self.shared.get(version_key, 1)
+        self._versions[label] = (version, now)
+        return version
+
+    def bump_version(self, model: type[Model]) -> None:
+        """Увеличить версию справочника, сделав его кеш устаревшим."""
+        label = self.get_label(model)
+        version_key = f"{label}:version"
+        try:
+            version = self.shared.incr(version_key)
+        except ValueError:
+            version = 2
+            self.shared.set(version_key, version, timeout=None)
+        self._versions[label] = (version, time.monotonic())
+
+    def invalidate(self, model: type[Model]) -> None:
+        """
+        Сбросить кеш справочника после его изменения.
+
+        Внутри транзакции версия увеличивается еще раз после коммита,
+        чтобы другие процессы не закешировали данные, прочитанные до него.
+        """
+        self.bump_version(model)
+        if connection.in_atomic_block:
+            transaction.on_commit(lambda: self.bump_version(model))
+
+    def get_key(self, model: type[Model], key: str) -> str:
+        """Ключ значения с учетом текущей версии справочника."""
+        digest = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+        return f"{self.get_label(model)}:{self.get_version(model)}:{digest}"
+
+    def get_local(self, key: str) -> Any:
+        """Значение из LRU-кеша процесса или MISSING."""
+        with self._lock:
+            value = self._local.get(key, MISSING)
+            if value is not MISSING:
+                self._local.move_to_end(key)
+            return value
+
+    def set_local(self, key: str, value: Any) -> None:
+        """Сохранить значение в LRU-кеше процесса."""
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > settings.DICTIONARY_CACHE_LOCAL_SIZE:
+                self._local.popitem(last=False)
+
+    def get_or_set(
+        self,
+        model: type[Model],
+        key: str,
+        loader: Callable[[], Any],
+    ) -> Any:
+        """
+        Значение справочника по ключу.
+
+        Ищется в кеше процесса, затем в общем кеше, и только потом
+        загружается функцией loader. Результат None тоже кешируется.
+        """
+        full_key = self.get_key(model, key)
+        value = self.get_local(full_key)
+        if value is MISSING:
+            value = self.shared.get(full_key, MISSING)
+            if value is MISSING:
+                value = loader()
+                self.shared.set(
+                    full_key,
+                    NOT_FOUND if value is None else value,
+                    timeout=settings.DICTIONARY_CACHE_TIMEOUT,
+                )
+            elif value == NOT_FOUND:
+                value = None
+            self.set_local(full_key, value)
+        return value
+
+    def clear_local(self) -> None:
+        """Очистить кеш процесса (версии и значения)."""
+        with self._lock:
+            self._local.clear()
+            self._versions.clear()
+
+
+dictionary_cache = DictionaryCache()
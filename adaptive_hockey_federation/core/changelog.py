@@ -0,0 +1,83 @@
+from datetime import timedelta
+from typing import Iterable
+
+from core.constants import ChangeAction
+from core.models import ChangeLogEntry
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+
+CHANGE_LOG_MODELS = frozenset(
+    (
+        "main.player",
+        "main.team",
+        "main.staffteammember",
+        "main.document",
+        "competitions.competition",
+    ),
+)
+
+
+def is_logged(model: type[Model]) -> bool:
+    """Ведется ли журнал изменений модели (кроме моделей миграций)."""
+    return (
+        model._meta.apps is global_apps
+        and model._meta.label_lower in CHANGE_LOG_MODELS
+    )
+
+
+def record_changes(
+    model: type[Model],
+    object_ids: Iterable[int],
+    action: ChangeAction,
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """
+    Добавить записи в журнал изменений.
+
+    Записи сохраняются одним запросом в той же транзакции, что и
+    изменение: журнал не теряет закоммиченных изменений, а откат (в
+    том числе до точки сохранения) убирает и записи. Номера выдаются
+    при вставке, поэтому запись с меньшим номером может стать видна
+    позже записи с большим; такие записи не пропадают из ленты, пока
+    транзакция короче CHANGE_FEED_LAG (см. get_change_feed).
+    """
+    object_ids = list(object_ids)
+    if not object_ids:
+        return
+    label = model._meta.label_lower
+    now = timezone.now()
+    ChangeLogEntry.objects.using(using).bulk_create(
+        ChangeLogEntry(
+            model=label,
+            object_id=object_id,
+            action=action,
+            changed_at=now,
+        )
+        for object_id in object_ids
+    )
+
+
+def get_change_feed(
+    since: int,
+    labels: Iterable[str],
+    limit: int,
+) -> QuerySet:
+    """
+    Записи журнала после номера since по возрастанию номера.
+
+    Записи моложе CHANGE_FEED_LAG секунд не выдаются: за это время
+    успевают закоммититься транзакции, добавившие записи с меньшими
+    номерами, и клиент, продолжающий ленту с последнего полученного
+    номера, их не пропустит.
+    """
+    visible_before = timezone.now() - timedelta(
+        seconds=settings.CHANGE_FEED_LAG,
+    )
+    return ChangeLogEntry.objects.filter(
+        pk__gt=since,
+        model__in=list(labels),
+        changed_at__lte=visible_before,
+    ).order_by("pk")[:limit]
@@ -25,6 +25,7 @@ DEFAULT_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 EXTERNAL_APPS = [
@@ -39,6 +40,7 @@ LOCAL_APPS = [
     "competitions.apps.CompetitionsConfig",
     "analytics.apps.AnalyticsConfig",
     "unloads.apps.UnloadsConfig",
+    "api.apps.ApiConfig",
 ]
 
 INSTALLED_APPS = EXTERNAL_APPS + DEFAULT_APPS + LOCAL_APPS
@@ -153,6 +155,8 @@ REST_FRAMEWORK = {
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ),
+    "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
+    "ALLOWED_VERSIONS": ("v1",),
 }
 
 PROCESSING_SERVICE_BASE_URL = env('PROCESSING_SERVICE_BASE_URL', default='http://127.0.0.1:8010/')
@@ -161,6 +165,14 @@ API_DOCS_KEY = env("API_DOCS_KEY", default="8f2d9e1b2c4e6f")
 
 YANDEX_DISK_OAUTH_TOKEN = env("YANDEX_DISK_OAUTH_TOKEN", default="ya_oauth_token")
 
+UNLOADS_RUN_IN_PROCESS = env.bool("UNLOADS_RUN_IN_PROCESS", default=True)
+
+UNLOADS_WORKERS = env.int("UNLOADS_WORKERS", default=2)
+
+UNLOADS_POLL_INTERVAL = env.float("UNLOADS_POLL_INTERVAL", default=2.0)
+
+UNLOADS_LOCK_TIMEOUT = env.float("UNLOADS_LOCK_TIMEOUT", default=600.0)
+
 MESSAGE_TAGS = {
     messages.DEBUG: "alert-secondary",
     messages.INFO: "alert-info",
@@ -168,3 +180,55 @@ MESSAGE_TAGS = {
     messages.WARNING: "alert-warning",
     messages.ERROR: "alert-danger",
 }
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="dbcache://django_cache"),
+}
+
+DICTIONARY_CACHE_ALIAS = env("DICTIONARY_CACHE_ALIAS", default="default")
+
+DICTIONARY_CACHE_TIMEOUT = env.int("DICTIONARY_CACHE_TIMEOUT", default=86400)
+
+DICTIONARY_CACHE_LOCAL_SIZE = env.int(
+    "DICTIONARY_CACHE_LOCAL_SIZE",
+    default=1024,
+)
+
+DICTIONARY_CACHE_VERSION_TTL = env.float(
+    "DICTIONARY_CACHE_VERSION_TTL",
+    default=5.0,
+)
+
+WATERMARK_ETAG_SALT = env("WATERMARK_ETAG_SALT", default="1")
+
+MAIL_OUTBOX_RUN_IN_PROCESS = env.bool(
+    "MAIL_OUTBOX_RUN_IN_PROCESS",
+    default=True,
+)
+
+MAIL_OUTBOX_BATCH_SIZE = env.int("MAIL_OUTBOX_BATCH_SIZE", default=50)
+
+MAIL_OUTBOX_MAX_ATTEMPTS = env.int("MAIL_OUTBOX_MAX_ATTEMPTS", default=5)
+
+MAIL_OUTBOX_RETRY_DELAY = env.float("MAIL_OUTBOX_RETRY_DELAY", default=60.0)
+
+MAIL_OUTBOX_MAX_RETRY_DELAY = env.float(
+    "MAIL_OUTBOX_MAX_RETRY_DELAY",
+    default=3600.0,
+)
+
+MAIL_OUTBOX_LOCK_TIMEOUT = env.float(
+    "MAIL_OUTBOX_LOCK_TIMEOUT",
+    default=600.0,
+)
+
+MAIL_OUTBOX_POLL_INTERVAL = env.float(
+    "MAIL_OUTBOX_POLL_INTERVAL",
+    default=5.0,
+)
+
+API_PAGE_SIZE = env.int("API_PAGE_SIZE", default=500)
+
+API_MAX_PAGE_SIZE = env.int("API_MAX_PAGE_SIZE", default=5000)
+
+CHANGE_FEED_LAG = env.float("CHANGE_FEED_LAG", default=1.0)
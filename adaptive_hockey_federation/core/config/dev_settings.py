@@ -37,7 +37,7 @@ DJANGO_SUPERUSER_PASSWORD = env("DJANGO_SUPERUSER_PASSWORD", default="admin")
 FIXSTURES_DIR = BASE_DIR / "core" / "fixtures"
 JSON_PARSER_FILE = "data.json"
 FIXSTURES_FILE = FIXSTURES_DIR / JSON_PARSER_FILE
-DB_DUMP_FILE = FIXSTURES_DIR / "db_dump.json"
+DB_DUMP_DIR = FIXSTURES_DIR / "db_dump"
 RESOURSES_ROOT = BASE_DIR / "resourses"
 
 # Важен порядок ключей для вставки/удаления
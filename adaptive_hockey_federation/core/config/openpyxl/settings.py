@@ -36,4 +36,6 @@ ALIGNMENT_CENTER: Alignment = Alignment(
     indent=0,
 )
 
+COLUMN_WIDTH_PADDING: int = 2
+
 ROWS_FILL: PatternFill = PatternFill(patternType="solid", fgColor="dee6ef")
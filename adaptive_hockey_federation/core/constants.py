@@ -127,6 +127,7 @@ class AgeLimits(IntEnum):
 
     MIN_AGE_PLAYER = 6
     MAX_AGE_PLAYER = 25
+    ADULT_AGE = 18
 
 
 FORM_HELP_TEXTS = {
@@ -177,6 +178,156 @@ SEARCH_ALIAS = {
 }
 
 
+class ExportConstants(IntEnum):
+    """Константы выгрузки данных в excel."""
+
+    CHUNK_SIZE = 2000
+    PROGRESS_DONE = 100
+
+
+PLAYER_FLAG_FIELDS = ("is_captain", "is_assistent")
+
+
+class FixtureConstants(IntEnum):
+    """Константы загрузки данных из JSON-файлов."""
+
+    BATCH_SIZE = 2000
+    READ_SIZE = 65536
+
+
+class ScaleConstants(IntEnum):
+    """
+    Константы массовой генерации тестовых данных.
+
+    Количество записей на единицу масштаба fill-test-db --scale.
+    """
+
+    PLAYERS = 1000
+    TEAMS = 50
+    STAFF = 100
+    DOCUMENTS = 500
+    COMPETITIONS = 10
+    CITIES = 5
+    DIAGNOSES = 10
+    BATCH_SIZE = 2000
+    SEED = 0
+
+
+class BenchmarkConstants(IntEnum):
+    """Константы замера скорости представлений."""
+
+    SCALE = 10
+    SEED = 0
+    REPEAT = 20
+    WARMUP = 2
+    THRESHOLD_PERCENT = 20
+    SEARCH_TERM_LENGTH = 3
+
+
+class DumpConstants(IntEnum):
+    """Константы дампа и восстановления БД."""
+
+    CHUNK_ROWS = 50000
+    READ_CHUNK_SIZE = 5000
+    INSERT_BATCH_SIZE = 2000
+    COMPRESS_LEVEL = 6
+    WORKERS = 4
+
+
+class ImportConstants(IntEnum):
+    """Константы импорта игроков из файла."""
+
+    BATCH_SIZE = 1000
+    HEADER_SEARCH_ROWS = 10
+    CSV_SAMPLE_SIZE = 8192
+    REPORT_PREVIEW = 20
+
+
+class AnalyticsConstants(IntEnum):
+    """Константы сводки для страницы аналитики."""
+
+    ROLLUP_CHUNK_SIZE = 2000
+    ROLLUP_DELTA_BATCH_SIZE = 100
+
+
+class TypeaheadConstants(IntEnum):
+    """Константы автодополнения справочников."""
+
+    PAGE_SIZE = 20
+
+
+class UnloadStatus(StrEnum):
+    """Статусы задач выгрузки."""
+
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    READY = "ready"
+    FAILED = "failed"
+
+
+UNLOAD_STATUS_CHOICES = (
+    (UnloadStatus.PENDING, "В очереди"),
+    (UnloadStatus.IN_PROGRESS, "Формируется"),
+    (UnloadStatus.READY, "Готово"),
+    (UnloadStatus.FAILED, "Ошибка"),
+)
+
+UNLOAD_ACTIVE_STATUSES = (UnloadStatus.PENDING, UnloadStatus.IN_PROGRESS)
+
+
+class MailStatus(StrEnum):
+    """Статусы писем в очереди отправки."""
+
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+MAIL_STATUS_CHOICES = (
+    (MailStatus.PENDING, "В очереди"),
+    (MailStatus.SENDING, "Отправляется"),
+    (MailStatus.SENT, "Отправлено"),
+    (MailStatus.FAILED, "Ошибка"),
+)
+
+
+class ChangeAction(StrEnum):
+    """Действия в журнале изменений."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+CHANGE_ACTION_CHOICES = (
+    (ChangeAction.CREATED, "Создание"),
+    (ChangeAction.UPDATED, "Изменение"),
+    (ChangeAction.DELETED, "Удаление"),
+)
+
+
+class MailConstants(IntEnum):
+    """Константы рассылки писем."""
+
+    BENCHMARK_RECIPIENTS = 1000
+    BENCHMARK_REPEAT = 3
+
+
+class VideoConstants(IntEnum):
+    """Константы замера нарезки видео."""
+
+    BENCHMARK_FRAMES = 3000
+    BENCHMARK_WIDTH = 640
+    BENCHMARK_HEIGHT = 360
+    BENCHMARK_FPS = 25
+    BENCHMARK_HITS = 60
+    BENCHMARK_PLAYERS = 40
+    BENCHMARK_PLAYER_HITS = 10
+    BENCHMARK_REPEAT = 3
+    BENCHMARK_SEED = 0
+
+
 class Directory:
     """Директории."""
 
@@ -0,0 +1,379 @@
+import gzip
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import django
+from core.constants import DumpConstants
+from django.apps import apps
+from django.contrib.postgres.search import SearchVectorField
+from django.core.management.color import no_style
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Model
+from django.utils import timezone
+
+MANIFEST_FILE = "manifest.json"
+RESTORE_STATE_FILE = "restore_state.json"
+CHUNK_SUFFIX = ".ndjson.gz"
+DUMP_FORMAT = 1
+
+Progress = Callable[[str], None]
+
+
+def get_dump_models() -> list[type[Model]]:
+    """
+    Модели для дампа в порядке зависимостей по внешним ключам.
+
+    Берутся все таблицы проекта, включая промежуточные таблицы связей
+    "многие ко многим", типы содержимого и разрешения (их id нужны
+    ссылающимся на них записям). Модели без взаимных ссылок идут по
+    алфавиту, при циклических ссылках оставшиеся модели добавляются по
+    алфавиту.
+    """
+    models = {
+        model
+        for model in apps.get_models(include_auto_created=True)
+        if model._meta.managed and not model._meta.proxy
+    }
+    dependencies = {
+        model: {
+            field.related_model
+            for field in model._meta.concrete_fields
+            if field.is_relation
+            and field.related_model in models
+            and field.related_model is not model
+        }
+        for model in models
+    }
+    ordered: list[type[Model]] = []
+    done: set[type[Model]] = set()
+    remaining = sorted(models, key=get_label)
+    while remaining:
+        ready = [model for model in remaining if dependencies[model] <= done]
+        if not ready:
+            ready = remaining
+        ordered.extend(ready)
+        done.update(ready)
+        remaining = [model for model in remaining if model not in done]
+    return ordered
+
+
+def get_label(model: type[Model]) -> str:
+    """Метка модели в манифесте дампа."""
+    return model._meta.label_lower
+
+
+def get_dump_fields(model: type[Model]) -> list[str]:
+    """
+    Колонки модели в дампе.
+
+    Индекс полнотекстового поиска не сохраняется: он пересчитывается
+    после восстановления.
+    """
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if not isinstance(field, SearchVectorField)
+    ]
+
+
+def get_chunk_name(label: str, index: int) -> str:
+    """Имя файла части дампа модели."""
+    return f"{label}.{index:05d}{CHUNK_SUFFIX}"
+
+
+def write_chunk(directory: Path, name: str, lines: list[str]) -> None:
+    """Записать часть дампа (через временный файл)."""
+    path = directory / name
+    temporary = path.with_name(path.name + ".tmp")
+    with gzip.open(
+        temporary,
+        "wt",
+        encoding="utf-8",
+        compresslevel=DumpConstants.COMPRESS_LEVEL,
+    ) as file:
+        file.writelines(lines)
+    os.replace(temporary, path)
+
+
+def dump_model(
+    label: str,
+    directory: str,
+    chunk_rows: int,
+    snapshot: str | None = None,
+) -> dict:
+    """
+    Выгрузить таблицу модели в сжатые части NDJSON.
+
+    Каждая строка части - JSON-массив значений колонок в порядке
+    fields манифеста. Значения проходят get_prep_value своих полей,
+    поэтому типы вроде PhoneNumber пишутся так же, как в БД. snapshot -
+    снимок PostgreSQL, в котором читаются данные, чтобы все процессы
+    видели одно и то же состояние БД. Возвращает описание модели для
+    манифеста.
+    """
+    model = apps.get_model(label)
+    fields = get_dump_fields(model)
+    prepare = [model._meta.get_field(name).get_prep_value for name in fields]
+    chunks: list[str] = []
+    rows = 0
+    directory = Path(directory)
+    with transaction.atomic():
+        if snapshot is not None:
+            with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+                cursor.execute(
+                    "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ",
+                )
+                cursor.execute("SET TRANSACTION SNAPSHOT %s", [snapshot])
+        values = (
+            model._base_manager.order_by("pk")
+            .values_list(*fields)
+            .iterator(chunk_size=DumpConstants.READ_CHUNK_SIZE)
+        )
+        lines: list[str] = []
+        for row in values:
+            row = [
+                prep(value) for prep, value in zip(prepare, row, strict=True)
+            ]
+            lines.append(
+                json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False)
+                + "\n",
+            )
+            if len(lines) >= chunk_rows:
+                chunks.append(get_chunk_name(label, len(chunks)))
+                write_chunk(directory, chunks[-1], lines)
+                rows += len(lines)
+                lines = []
+        if lines:
+            chunks.append(get_chunk_name(label, len(chunks)))
+            write_chunk(directory, chunks[-1], lines)
+            rows += len(lines)
+    return {"model": label, "fields": fields, "rows": rows, "chunks": chunks}
+
+
+def init_worker() -> None:
+    """Настройка Django в процессе-исполнителе."""
+    django.setup()
+
+
+def export_snapshot() -> str | None:
+    """
+    Снимок данных текущей транзакции для других процессов.
+
+    Только PostgreSQL: снимок действует, пока открыта транзакция, в
+    которой он создан.
+    """
+    connection = connections[DEFAULT_DB_ALIAS]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        cursor.execute("SELECT pg_export_snapshot()")
+        return cursor.fetchone()[0]
+
+
+def dump_database(
+    directory: str,
+    workers: int,
+    chunk_rows: int = DumpConstants.CHUNK_ROWS,
+    progress: Progress | None = None,
+) -> dict:
+    """
+    Дамп БД в каталог: части по моделям и манифест.
+
+    Модели выгружаются параллельно в workers процессах. Манифест
+    пишется последним, поэтому каталог без манифеста - незавершенный
+    дамп. Возвращает манифест.
+    """
+    os.makedirs(directory, exist_ok=True)
+    labels = [get_label(model) for model in get_dump_models()]
+    entries = {}
+    if workers > 1:
+        with transaction.atomic():
+            snapshot = export_snapshot()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context("spawn"),
+                initializer=init_worker,
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        dump_model,
+                        label,
+                        directory,
+                        chunk_rows,
+                        snapshot,
+                    )
+                    for label in labels
+                ]
+                for future in futures:
+                    entry = future.result()
+                    entries[entry["model"]] = entry
+                    report(progress, entry)
+    else:
+        for label in labels:
+            entry = dump_model(label, directory, chunk_rows)
+            entries[label] = entry
+            report(progress, entry)
+    manifest = {
+        "format": DUMP_FORMAT,
+        "created_at": timezone.now().isoformat(),
+        "models": [entries[label] for label in labels],
+    }
+    with open(Path(directory) / MANIFEST_FILE, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def report(progress: Progress | None, entry: dict) -> None:
+    """Сообщить о выгруженной модели."""
+    if progress is not None:
+        progress(
+            f"{entry['model']}: {entry['rows']} записей, "
+            f"частей: {len(entry['chunks'])}",
+        )
+
+
+def read_manifest(directory: str) -> dict:
+    """Манифест дампа с проверкой совместимости с текущими моделями."""
+    path = Path(directory) / MANIFEST_FILE
+    if not path.exists():
+        raise ValueError(f"В каталоге {directory} нет манифеста дампа")
+    with open(path, encoding="utf-8") as file:
+        manifest = json.load(file)
+    if manifest.get("format") != DUMP_FORMAT:
+        raise ValueError("Неподдерживаемый формат дампа")
+    for entry in manifest["models"]:
+        model = apps.get_model(entry["model"])
+        missing = set(entry["fields"]) - set(get_dump_fields(model))
+        if missing:
+            raise ValueError(
+                f"У модели {entry['model']} нет полей: "
+                f"{', '.join(sorted(missing))}",
+            )
+    return manifest
+
+
+def iter_chunk(path: Path, fields: list[str]) -> Iterator[dict]:
+    """Записи части дампа в виде {колонка: значение}."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            yield dict(zip(fields, json.loads(line), strict=True))
+
+
+def load_restore_state(directory: str) -> set[str]:
+    """Части дампа, уже загруженные прерванным восстановлением."""
+    path = Path(directory) / RESTORE_STATE_FILE
+    if not path.exists():
+        return set()
+    with open(path, encoding="utf-8") as file:
+        return set(json.load(file)["completed"])
+
+
+def save_restore_state(directory: str, completed: Iterable[str]) -> None:
+    """Сохранить список загруженных частей дампа."""
+    path = Path(directory) / RESTORE_STATE_FILE
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "w", encoding="utf-8") as file:
+        json.dump({"completed": sorted(completed)}, file)
+    os.replace(temporary, path)
+
+
+def flush_tables(models: Iterable[type[Model]]) -> None:
+    """Очистить таблицы моделей перед восстановлением."""
+    connection = connections[DEFAULT_DB_ALIAS]
+    sql_list = connection.ops.sql_flush(
+        no_style(),
+        [model._meta.db_table for model in models],
+        allow_cascade=True,
+    )
+    connection.ops.execute_sql_flush(sql_list)
+
+
+@contextmanager
+def raw_timestamps(model: type[Model]) -> Iterator[None]:
+    """
+    Отключить auto_now и auto_now_add у полей модели.
+
+    Иначе bulk_create заменит сохраненные в дампе даты текущим
+    временем. Флаги меняются у класса модели, поэтому восстановление
+    не должно идти параллельно с сохранением этих моделей в том же
+    процессе.
+    """
+    fields = [
+        (field, field.auto_now, field.auto_now_add)
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False)
+        or getattr(field, "auto_now_add", False)
+    ]
+    for field, _, _ in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now = auto_now
+            field.auto_now_add = auto_now_add
+
+
+def restore_database(
+    directory: str,
+    resume: bool = False,
+    batch_size: int = DumpConstants.INSERT_BATCH_SIZE,
+    progress: Progress | None = None,
+) -> list[type[Model]]:
+    """
+    Восстановить БД из дампа.
+
+    Модели загружаются в порядке манифеста (сначала те, на кого
+    ссылаются), каждая часть - в своей транзакции через bulk_create с
+    сохраненными значениями дат (см. raw_timestamps).
+    Загруженные части отмечаются в файле состояния, и при resume
+    восстановление продолжается с первой незагруженной части без
+    очистки таблиц (строки, успевшие сохраниться, пропускаются).
+    Возвращает восстановленные модели.
+    """
+    manifest = read_manifest(directory)
+    models = [apps.get_model(entry["model"]) for entry in manifest["models"]]
+    completed = load_restore_state(directory) if resume else set()
+    if not resume:
+        flush_tables(models)
+        save_restore_state(directory, completed)
+    for model, entry in zip(models, manifest["models"], strict=True):
+        loaded = 0
+        for name in entry["chunks"]:
+            if name in completed:
+                continue
+            with transaction.atomic(), raw_timestamps(model):
+                for batch in iter_batches(
+                    iter_chunk(Path(directory) / name, entry["fields"]),
+                    batch_size,
+                ):
+                    model._base_manager.bulk_create(
+                        [model(**row) for row in batch],
+                        ignore_conflicts=resume,
+                    )
+                    loaded += len(batch)
+            completed.add(name)
+            save_restore_state(directory, completed)
+            if progress is not None:
+                progress(f"{entry['model']}: {loaded} из {entry['rows']}")
+    (Path(directory) / RESTORE_STATE_FILE).unlink(missing_ok=True)
+    return models
+
+
+def iter_batches(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    """Записи пачками по size штук."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
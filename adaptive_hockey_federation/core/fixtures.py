@@ -0,0 +1,87 @@
+import json
+import re
+from typing import IO, Any, Iterable, Iterator
+
+from core.constants import FixtureConstants
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+
+SEPARATORS = re.compile(r"[\s,]*")
+WHITESPACE = re.compile(r"\s*")
+
+
+def iter_json_array(
+    file: IO[str],
+    read_size: int = FixtureConstants.READ_SIZE,
+) -> Iterator[Any]:
+    """
+    Элементы JSON-массива из файла по одному.
+
+    Файл читается порциями по read_size символов, в памяти держится
+    только текущая порция, поэтому размер файла не ограничен памятью.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    while not buffer:
+        chunk = file.read(read_size)
+        if not chunk:
+            break
+        buffer = chunk.lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Ожидается JSON-массив")
+    position = 1
+    eof = False
+    while True:
+        position = SEPARATORS.match(buffer, position).end()
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        item, end = decode_item(decoder, buffer, position)
+        if end is None:
+            if eof:
+                raise ValueError("Неожиданный конец JSON-массива")
+            chunk = file.read(read_size)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+        yield item
+        position = end
+
+
+def decode_item(
+    decoder: json.JSONDecoder,
+    buffer: str,
+    position: int,
+) -> tuple[Any, int | None]:
+    """
+    Элемент массива с позиции position и позиция за ним.
+
+    Если элемент не помещается в буфер целиком (за ним нет запятой или
+    закрывающей скобки), возвращает (None, None): буфер нужно дополнить.
+    """
+    try:
+        item, end = decoder.raw_decode(buffer, position)
+    except json.JSONDecodeError:
+        return None, None
+    after = WHITESPACE.match(buffer, end).end()
+    if after == len(buffer) or buffer[after] not in ",]":
+        return None, None
+    return item, end
+
+
+def reset_sequences(
+    models: Iterable[type[Model]],
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """
+    Сдвинуть счетчики первичных ключей за максимальные значения.
+
+    Нужно после вставки записей с явными id, иначе следующие записи,
+    созданные через приложение, получат уже занятые номера.
+    """
+    connection = connections[using]
+    statements = connection.ops.sequence_reset_sql(no_style(), list(models))
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
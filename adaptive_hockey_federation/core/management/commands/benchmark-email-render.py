@@ -0,0 +1,105 @@
+import time
+from typing import Callable
+
+from core.constants import MailConstants
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from users.utilits.render import build_email_message, render_email_messages
+
+TEMPLATE = "emailing/welcome_letter.html"
+SUBJECT = "Пригласительное письмо"
+FROM_EMAIL = "noreply@example.com"
+
+
+def get_recipients(amount: int) -> list:
+    """Получатели со своим контекстом пригласительного письма."""
+    return [
+        (
+            [f"curator{index}@example.com"],
+            {
+                "instance": f"Команда {index}",
+                "link_to_info": f"http://127.0.0.1:8000/competitions/{index}/",
+            },
+        )
+        for index in range(amount)
+    ]
+
+
+def measure(func: Callable[[], list], repeat: int) -> float:
+    """Лучшее время выполнения из repeat запусков, сек."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class Command(BaseCommand):
+    """Замер визуализации писем для массовой рассылки."""
+
+    help = (
+        "Сравнение визуализации писем по одному и пачкой "
+        "по шаблону пригласительного письма"
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--recipients",
+            type=int,
+            default=MailConstants.BENCHMARK_RECIPIENTS,
+            help="Количество получателей",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=MailConstants.BENCHMARK_REPEAT,
+            help="Количество повторов замера",
+        )
+
+    def handle(self, *args, **options):
+        """Выводит время визуализации и стоимость одного письма."""
+        amount = options["recipients"]
+        recipients = get_recipients(amount)
+        common_context = {
+            "competition": {
+                "title": "Кубок федерации",
+                "city": "Москва",
+                "location": "Ледовая арена",
+                "date_start": "01.12.2024",
+            },
+        }
+
+        def render_one_by_one() -> list:
+            return [
+                build_email_message(
+                    SUBJECT,
+                    render_to_string(TEMPLATE, {**common_context, **context}),
+                    FROM_EMAIL,
+                    to,
+                )
+                for to, context in recipients
+            ]
+
+        def render_bulk() -> list:
+            return render_email_messages(
+                SUBJECT,
+                recipients,
+                FROM_EMAIL,
+                TEMPLATE,
+                common_context,
+            )
+
+        for title, func in (
+            ("По одному", render_one_by_one),
+            ("Пачкой", render_bulk),
+        ):
+            elapsed = measure(func, options["repeat"])
+            per_message = elapsed / amount * 1000 if amount else 0
+            self.stdout.write(
+                f"{title}: {amount} писем за {elapsed:.3f} с, "
+                f"{per_message:.3f} мс на письмо",
+            )
+        return self.stdout.write(self.style.SUCCESS("Замер завершен"))
@@ -0,0 +1,323 @@
+import os
+import random
+import tempfile
+import time
+from functools import partial
+from typing import Callable
+
+import cv2
+from core.constants import VideoConstants
+from django.core.management.base import BaseCommand
+from service.video_processing import (
+    CLIP_FRAMES,
+    KEYFRAME_DISTANCE,
+    get_frame_size,
+    make_synthetic_clip,
+    open_writer,
+    QUEUE_SIZE,
+    slicing_game_video,
+    slicing_video_with_player_frames,
+    write_clips,
+)
+
+
+def slice_with_seeks(
+    input_file: str,
+    output_file: str,
+    frames: list[int],
+    fps: float,
+) -> int:
+    """Прежняя нарезка: перемотка к каждому кадру с игроком."""
+    cap = cv2.VideoCapture(input_file)
+    output = open_writer(output_file, get_frame_size(cap), fps)
+    written = 0
+    for frame_number in frames:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        for _ in range(CLIP_FRAMES):
+            ret, frame = cap.read()
+            if ret:
+                output.write(frame)
+                written += 1
+    output.release()
+    cap.release()
+    return written
+
+
+def get_frame_sets(total: int, hits: int, seed: int) -> dict:
+    """
+    Наборы кадров с игроком.
+
+    Плотный - подряд идущие окна, как при непрерывном появлении игрока
+    в кадре, редкий - случайные кадры по всему видео.
+    """
+    last = total - CLIP_FRAMES
+    dense_start = max(0, last - hits * CLIP_FRAMES) // 2
+    return {
+        "Плотные кадры": list(
+            range(dense_start, dense_start + hits * CLIP_FRAMES, CLIP_FRAMES),
+        ),
+        "Редкие кадры": sorted(
+            random.Random(seed).sample(range(last), min(hits, last)),
+        ),
+    }
+
+
+def get_players(total: int, players: int, hits: int, seed: int) -> list:
+    """Ответ DS сервера: случайные кадры для каждого игрока игры."""
+    generator = random.Random(seed)
+    last = total - CLIP_FRAMES
+    return [
+        {
+            "number": number,
+            "team": number % 2,
+            "frames": sorted(generator.sample(range(last), min(hits, last))),
+        }
+        for number in range(players)
+    ]
+
+
+def slice_by_player(
+    input_file: str,
+    players: list,
+    output_dir: str,
+    fps: float,
+) -> int:
+    """Нарезка каждого игрока отдельным проходом по видео."""
+    return sum(
+        slicing_video_with_player_frames(
+            input_file,
+            os.path.join(output_dir, f"{player['number']}.mp4"),
+            player["frames"],
+            fps,
+        )
+        for player in players
+    )
+
+
+def slice_game(*args) -> int:
+    """Нарезка всех игроков игры за одно декодирование видео."""
+    return sum(slicing_game_video(*args).values())
+
+
+def slice_clips(input_file: str, clips: dict, **options) -> int:
+    """Нарезка нескольких видео с параметрами write_clips."""
+    return sum(write_clips(input_file, clips, **options).values())
+
+
+def measure(func: Callable[[], int], repeat: int) -> tuple[float, int]:
+    """Лучшее время из repeat запусков, сек, и число записанных кадров."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        written = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, written
+
+
+class Command(BaseCommand):
+    """Замер нарезки видео с игроком."""
+
+    help = (
+        "Сравнение нарезки видео с перемоткой к каждому кадру и "
+        "последовательного декодирования, по одному игроку, всех игроков "
+        "игры за один проход и параллельно, декодирования и кодирования "
+        "в одном потоке и конвейером на синтетическом видео"
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--frames",
+            type=int,
+            default=VideoConstants.BENCHMARK_FRAMES,
+            help="Количество кадров синтетического видео",
+        )
+        parser.add_argument(
+            "--width",
+            type=int,
+            default=VideoConstants.BENCHMARK_WIDTH,
+            help="Ширина кадра",
+        )
+        parser.add_argument(
+            "--height",
+            type=int,
+            default=VideoConstants.BENCHMARK_HEIGHT,
+            help="Высота кадра",
+        )
+        parser.add_argument(
+            "--hits",
+            type=int,
+            default=VideoConstants.BENCHMARK_HITS,
+            help="Количество кадров с игроком",
+        )
+        parser.add_argument(
+            "--players",
+            type=int,
+            default=VideoConstants.BENCHMARK_PLAYERS,
+            help="Количество игроков в игре",
+        )
+        parser.add_argument(
+            "--player-hits",
+            type=int,
+            default=VideoConstants.BENCHMARK_PLAYER_HITS,
+            help="Количество кадров с каждым игроком",
+        )
+        parser.add_argument(
+            "--keyframe-distance",
+            type=int,
+            default=KEYFRAME_DISTANCE,
+            help="Расстояние, начиная с которого выполняется перемотка",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="Количество процессов параллельной нарезки",
+        )
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Масштаб кадров при замере конвейера",
+        )
+        parser.add_argument(
+            "--step",
+            type=int,
+            default=1,
+            help="Шаг кадров при замере конвейера",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=VideoConstants.BENCHMARK_REPEAT,
+            help="Количество повторов замера",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=VideoConstants.BENCHMARK_SEED,
+            help="Начальное значение генератора редких кадров",
+        )
+
+    def handle(self, *args, **options):
+        """Выводит время нарезки для каждого набора кадров."""
+        fps = VideoConstants.BENCHMARK_FPS
+        with tempfile.TemporaryDirectory() as directory:
+            input_file = os.path.join(directory, "game.mp4")
+            output_file = os.path.join(directory, "player.mp4")
+            make_synthetic_clip(
+                input_file,
+                options["frames"],
+                options["width"],
+                options["height"],
+                fps,
+            )
+            frame_sets = get_frame_sets(
+                options["frames"],
+                options["hits"],
+                options["seed"],
+            )
+            for title, frames in frame_sets.items():
+                for method, func in (
+                    (
+                        "перемотка",
+                        partial(
+                            slice_with_seeks,
+                            input_file,
+                            output_file,
+                            frames,
+                            fps,
+                        ),
+                    ),
+                    (
+                        "последовательно",
+                        partial(
+                            slicing_video_with_player_frames,
+                            input_file,
+                            output_file,
+                            frames,
+                            fps,
+                            options["keyframe_distance"],
+                        ),
+                    ),
+                ):
+                    elapsed, written = measure(func, options["repeat"])
+                    self.stdout.write(
+                        f"{title}, {method}: {written} кадров "
+                        f"за {elapsed:.3f} с",
+                    )
+            players = get_players(
+                options["frames"],
+                options["players"],
+                options["player_hits"],
+                options["seed"],
+            )
+            for method, func in (
+                (
+                    "по одному",
+                    partial(
+                        slice_by_player,
+                        input_file,
+                        players,
+                        directory,
+                        fps,
+                    ),
+                ),
+                (
+                    "за один проход",
+                    partial(
+                        slice_game,
+                        input_file,
+                        players,
+                        directory,
+                        fps,
+                        options["keyframe_distance"],
+                    ),
+                ),
+                (
+                    f"параллельно в {options['workers']} процессах",
+                    partial(
+                        slice_game,
+                        input_file,
+                        players,
+                        directory,
+                        fps,
+                        options["keyframe_distance"],
+                        options["workers"],
+                    ),
+                ),
+            ):
+                elapsed, written = measure(func, options["repeat"])
+                self.stdout.write(
+                    f"{len(players)} игроков, {method}: {written} кадров "
+                    f"за {elapsed:.3f} с",
+                )
+            clips = {
+                os.path.join(directory, f"{player['number']}.mp4"): player[
+                    "frames"
+                ]
+                for player in players
+            }
+            for method, queue_size in (
+                ("в одном потоке", 0),
+                ("в двух потоках через очередь", QUEUE_SIZE),
+            ):
+                elapsed, written = measure(
+                    partial(
+                        slice_clips,
+                        input_file,
+                        clips,
+                        fps=fps / options["step"],
+                        keyframe_distance=options["keyframe_distance"],
+                        scale=options["scale"],
+                        step=options["step"],
+                        queue_size=queue_size,
+                    ),
+                    options["repeat"],
+                )
+                self.stdout.write(
+                    f"Декодирование и кодирование {method}: {written} "
+                    f"кадров за {elapsed:.3f} с",
+                )
+        return self.stdout.write(self.style.SUCCESS("Замер завершен"))
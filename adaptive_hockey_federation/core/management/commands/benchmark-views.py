@@ -0,0 +1,265 @@
+import io
+import tempfile
+from pathlib import Path
+from urllib.parse import urlencode
+
+from competitions.models import Competition
+from core.benchmark import (
+    BenchmarkCase,
+    find_regressions,
+    load_baseline,
+    measure_case,
+    request_case,
+    save_baseline,
+)
+from core.constants import BenchmarkConstants
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.test.utils import (
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+from main.models import DisciplineName, Player, Team
+from unloads.jobs import process_unload
+from unloads.models import Unload
+from users.models import User
+
+BENCHMARK_EMAIL = "benchmark@example.com"
+BENCHMARK_PASSWORD = "benchmark"
+AJAX_HEADERS = {"X-Requested-With": "XMLHttpRequest"}
+
+
+def get_user() -> User:
+    """Суперпользователь, от имени которого выполняются запросы."""
+    user = User.objects.filter(email=BENCHMARK_EMAIL).first()
+    if user is None:
+        user = User.objects.create_superuser(
+            email=BENCHMARK_EMAIL,
+            password=BENCHMARK_PASSWORD,
+        )
+    return user
+
+
+def with_query(url: str, **params) -> str:
+    """Адрес с параметрами запроса."""
+    return f"{url}?{urlencode(params)}"
+
+
+def get_cases(client: Client, user: User) -> list[BenchmarkCase]:
+    """Замеряемые страницы, AJAX-запросы и формирование выгрузки."""
+    player = Player.objects.order_by("pk").first()
+    team = Team.objects.annotate(players=Count("team_players")).latest(
+        "players",
+    )
+    competition = Competition.objects.order_by("pk").first()
+    discipline = DisciplineName.objects.order_by("pk").first()
+    term = player.surname[: BenchmarkConstants.SEARCH_TERM_LENGTH]
+    players_url = reverse("main:players")
+
+    def export_players():
+        return process_unload(
+            Unload.objects.create(
+                unload_name="players_all.xlsx",
+                user=user,
+                page_name="players",
+                query_params={},
+            ),
+        )
+
+    return [
+        request_case(client, "players", players_url),
+        request_case(
+            client,
+            "players_search",
+            with_query(players_url, search_column="all", search=term),
+        ),
+        request_case(client, "analytics", reverse("analytics:analytics")),
+        request_case(
+            client,
+            "team",
+            reverse("main:teams_id", kwargs={"team_id": team.pk}),
+        ),
+        request_case(
+            client,
+            "competition_team_manage",
+            reverse(
+                "competitions:competition_id",
+                kwargs={"pk": competition.pk},
+            ),
+        ),
+        request_case(
+            client,
+            "data_export",
+            reverse("unloads:data_unloads", kwargs={"page_name": "players"}),
+        ),
+        BenchmarkCase("export_players_job", export_players),
+        request_case(
+            client,
+            "ajax_discipline_levels",
+            with_query(
+                reverse("main:ajax_load_discipline_levels"),
+                discipline_level_id=discipline.pk,
+            ),
+            **AJAX_HEADERS,
+        ),
+        request_case(
+            client,
+            "ajax_disciplines",
+            reverse("main:ajax_filter_discipline_search"),
+            **AJAX_HEADERS,
+        ),
+        *(
+            request_case(
+                client,
+                f"ajax_typeahead_{name}",
+                with_query(reverse(f"main:ajax_typeahead_{name}"), q=term),
+                **AJAX_HEADERS,
+            )
+            for name in ("diagnoses", "cities", "teams")
+        ),
+    ]
+
+
+class Command(BaseCommand):
+    """Замер скорости основных представлений."""
+
+    help = (
+        "Замер задержек, числа запросов к БД и пика памяти основных "
+        "страниц на сгенерированных данных в тестовой БД со сравнением "
+        "с сохраненным эталоном"
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=BenchmarkConstants.SCALE,
+            help="Масштаб тестовых данных (см. fill-test-db --scale)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=BenchmarkConstants.SEED,
+            help="Начальное значение генератора тестовых данных",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=BenchmarkConstants.REPEAT,
+            help="Количество замеров каждого запроса",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=BenchmarkConstants.WARMUP,
+            help="Количество прогревочных запросов без замера",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=int,
+            default=BenchmarkConstants.THRESHOLD_PERCENT,
+            help="Допустимое ухудшение задержек и памяти, %%",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=str(
+                Path(settings.BASE_DIR) / "benchmarks" / "views.json",
+            ),
+            help="Файл эталона",
+        )
+        parser.add_argument(
+            "--save",
+            action="store_true",
+            help="Сохранить результаты как новый эталон",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Не удалять тестовую БД (данные переиспользуются)",
+        )
+
+    def run_benchmark(self, options: dict) -> list:
+        """Заполнить тестовую БД и выполнить замеры."""
+        if not Player.objects.exists():
+            get_user()
+            call_command(
+                "fill-test-db",
+                scale=options["scale"],
+                seed=options["seed"],
+                stdout=io.StringIO(),
+            )
+        user = get_user()
+        client = Client()
+        client.force_login(user)
+        results = []
+        for case in get_cases(client, user):
+            result = measure_case(case, options["repeat"], options["warmup"])
+            results.append(result)
+            self.stdout.write(
+                f"{result.name}: p50 {result.p50_ms} мс, "
+                f"p90 {result.p90_ms} мс, p99 {result.p99_ms} мс, "
+                f"запросов {result.queries}, "
+                f"память {result.peak_memory_kb} КБ",
+            )
+        return results
+
+    def handle(self, *args, **options):
+        """Выполняет замеры в отдельной тестовой БД."""
+        params = {"scale": options["scale"], "seed": options["seed"]}
+        path = Path(options["baseline"])
+        baseline = None if options["save"] else load_baseline(path)
+        if baseline is not None and baseline["params"] != params:
+            raise CommandError(
+                f"Эталон снят с параметрами {baseline['params']}, "
+                f"замер - с {params}",
+            )
+
+        connection = connections[DEFAULT_DB_ALIAS]
+        old_name = connection.settings_dict["NAME"]
+        setup_test_environment()
+        connection.creation.create_test_db(
+            verbosity=0,
+            autoclobber=True,
+            serialize=False,
+            keepdb=options["keepdb"],
+        )
+        try:
+            with (
+                tempfile.TemporaryDirectory() as media_root,
+                override_settings(
+                    MEDIA_ROOT=media_root,
+                    UNLOADS_RUN_IN_PROCESS=False,
+                ),
+            ):
+                results = self.run_benchmark(options)
+        finally:
+            connection.creation.destroy_test_db(
+                old_name,
+                verbosity=0,
+                keepdb=options["keepdb"],
+            )
+            teardown_test_environment()
+
+        if baseline is None:
+            save_baseline(path, results, params)
+            return self.stdout.write(
+                self.style.SUCCESS(f"Эталон сохранен в {path}"),
+            )
+        regressions = find_regressions(
+            baseline,
+            results,
+            options["threshold"] / 100,
+        )
+        if regressions:
+            raise CommandError(
+                "Ухудшение относительно эталона:\n" + "\n".join(regressions),
+            )
+        return self.stdout.write(
+            self.style.SUCCESS("Замер завершен, ухудшений нет"),
+        )
@@ -1,32 +1,59 @@
-from django.core.management import call_command
+import time
+
+from core.constants import DumpConstants
+from core.dump import dump_database
 from django.core.management.base import BaseCommand
 
-from core.config.dev_settings import DB_DUMP_FILE
+from core.config.dev_settings import DB_DUMP_DIR
 
 
 class Command(BaseCommand):
     """Класс экспорта данных из БД."""
 
-    help = "Экспорт данных из базы данных в JSON-файл"
+    help = (
+        "Экспорт данных из базы данных в каталог дампа: сжатые части "
+        "NDJSON по моделям и манифест"
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы."""
+        parser.add_argument(
+            "-o",
+            "--output",
+            default=str(DB_DUMP_DIR),
+            help="Каталог дампа.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=DumpConstants.WORKERS,
+            help="Количество процессов выгрузки (1 - без процессов).",
+        )
+        parser.add_argument(
+            "--chunk-rows",
+            type=int,
+            default=DumpConstants.CHUNK_ROWS,
+            help="Количество записей в одной части дампа.",
+        )
 
     def handle(self, *args, **options):
         """Экспортирует данные из БД."""
+        started = time.monotonic()
         try:
-            call_command(
-                "dumpdata",
-                exclude=["contenttypes", "auth.permission"],
-                natural_foreign=True,
-                natural_primary=True,
-                indent=2,
-                output=DB_DUMP_FILE,
-            )
-
-            return self.stdout.write(
-                self.style.SUCCESS(
-                    f"База данных экспортирована в {DB_DUMP_FILE}",
-                ),
+            manifest = dump_database(
+                options["output"],
+                max(options["workers"], 1),
+                options["chunk_rows"],
+                progress=self.stdout.write,
             )
         except Exception as e:
             return self.stdout.write(
                 self.style.ERROR(f"Ошибка при экспорте данных: {str(e)}"),
             )
+        rows = sum(entry["rows"] for entry in manifest["models"])
+        return self.stdout.write(
+            self.style.SUCCESS(
+                f"База данных экспортирована в {options['output']}: "
+                f"{rows} записей за {time.monotonic() - started:.1f} с",
+            ),
+        )
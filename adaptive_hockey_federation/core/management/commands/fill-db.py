@@ -1,9 +1,16 @@
-import json
+import os
+import time
 
+from analytics.rollup import rebuild_rollup
+from core.cache import dictionary_cache
+from core.constants import FixtureConstants
+from core.fixtures import iter_json_array, reset_sequences
+from core.watermarks import touch_watermarks
 from django.apps import apps
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.db import connection, transaction
-from main.models import Diagnosis
+from main.models import BaseUniqueName, Player
 
 from core.config.dev_settings import (
     FILE_MODEL_MAP,
@@ -24,117 +31,177 @@ class Command(BaseCommand):
             action="store_true",
             help="Фикстуры с реальными данными для таблиц.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=FixtureConstants.BATCH_SIZE,
+            help="Количество записей в одном INSERT.",
+        )
 
-    @transaction.atomic
-    def load_real_data(self) -> None:  # noqa: C901
-        """Загрузка реальных данных из JSON."""
-        with connection.cursor() as cursor:
-            for table_name in FILE_MODEL_MAP.keys():
-                try:
-                    cursor.execute(f"TRUNCATE TABLE {table_name} CASCADE")
-                except Exception as e:
-                    return self.stdout.write(
-                        self.style.WARNING(
-                            f"Не удалось очистить таблицу {table_name}: {str(e)}",  # noqa: E501
-                        ),
-                    )
+    def load_real_data(self, batch_size: int) -> None:
+        """
+        Загрузка реальных данных из JSON.
 
-        items = list(FILE_MODEL_MAP.items())
-        items.reverse()
-        for table_name, model_class in items:
-            file_path = FIXSTURES_DIR / f"{table_name}.json"
-            app_label, model_name = table_name.split("_", 1)
-            model = apps.get_model(app_label, model_name)
+        Таблицы заполняются в порядке зависимостей, каждая - в своей
+        транзакции через bulk_create. Файлы читаются потоково, ссылки
+        на дисциплины и диагнозы игроков разрешаются по словарям в
+        памяти. bulk_create не отправляет сигналы, поэтому после
+        загрузки сбрасываются счетчики id и пересчитываются индекс
+        поиска, сводка аналитики, отметки изменений и кеш справочников.
+        """
+        models = {
+            table_name: apps.get_model(*table_name.split("_", 1))
+            for table_name in FILE_MODEL_MAP
+        }
+        tables = ", ".join(model._meta.db_table for model in models.values())
+        with connection.cursor() as cursor:
             try:
-                with open(file_path, "r", encoding="utf-8") as file:
-                    data = json.load(file)
-
-                for item in data:
-                    if table_name == "main_team":
-                        team_data = {
-                            "id": item["id"],
-                            "name": item["name"],
-                            "city_id": item["city_id"],
-                            "discipline_name_id": item["discipline_name_id"],
-                            "curator_id": None,
-                        }
-                        instance = model(**team_data)
-                    elif table_name == "main_player":
-                        disciplines = self.get_disciplines()
-                        diagnosis = None
-                        if item.get("diagnosis_id"):
-                            try:
-                                diagnosis = Diagnosis.objects.get(
-                                    pk=item["diagnosis_id"],
-                                )
-                            except Diagnosis.DoesNotExist:
-                                print(
-                                    f"Диагноз с id {item.get('diagnosis_id')} отсутсвует.",  # noqa: E501
-                                )
-                        player_data = {
-                            "id": item["id"],
-                            "surname": item["surname"],
-                            "name": item["name"],
-                            "patronymic": item["patronymic"],
-                            "birthday": item["birthday"],
-                            "gender": item["gender"],
-                            "level_revision": item["level_revision"],
-                            "position": item["position"],
-                            "number": item["number"],
-                            "is_captain": item["is_captain"],
-                            "is_assistent": item["is_assistent"],
-                            "identity_document": item["identity_document"],
-                            "diagnosis": diagnosis,
-                            "diagnosis_id": item["diagnosis_id"],
-                            "discipline_name_id": disciplines[
-                                item["discipline_id"]
-                            ]["discipline_name_id"],
-                            "discipline_level_id": disciplines[
-                                item["discipline_id"]
-                            ]["discipline_level_id"],
-                        }
-                        instance = model(**player_data)
-                    else:
-                        instance = model(**item)
-                    instance.save()
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Данные из {table_name}.json успешно загружены в модель {model_class}",  # noqa: E501
+                cursor.execute(f"TRUNCATE TABLE {tables} CASCADE")
+            except Exception as e:
+                return self.stdout.write(
+                    self.style.WARNING(
+                        f"Не удалось очистить таблицы {tables}: {str(e)}",
                     ),
                 )
 
-            except FileNotFoundError:
+        loaded_ids: dict[str, set] = {}
+        disciplines = None
+        for table_name, model_class in reversed(FILE_MODEL_MAP.items()):
+            model = models[table_name]
+            started = time.monotonic()
+            try:
+                if table_name == "main_player" and disciplines is None:
+                    disciplines = self.get_disciplines()
+                with transaction.atomic():
+                    loaded_ids[table_name] = self.load_table(
+                        table_name,
+                        model,
+                        batch_size,
+                        disciplines,
+                        loaded_ids.get("main_diagnosis", set()),
+                    )
+            except FileNotFoundError as e:
                 self.stdout.write(
-                    self.style.WARNING(f"Файл {table_name}.json не найден"),
+                    self.style.WARNING(
+                        f"Файл {os.path.basename(e.filename)} не найден",
+                    ),
                 )
+                continue
             except Exception as e:
                 self.stdout.write(
                     self.style.ERROR(
                         f"Ошибка при загрузке данных из {table_name}.json: {str(e)}",  # noqa: E501
                     ),
                 )
+                continue
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Данные из {table_name}.json успешно загружены в модель "
+                    f"{model_class}: {len(loaded_ids[table_name])} записей "
+                    f"за {time.monotonic() - started:.1f} с",
+                ),
+            )
+
+        reset_sequences(models.values())
+        self.rebuild_derived_data(list(models.values()))
+
+    def load_table(
+        self,
+        table_name: str,
+        model,
+        batch_size: int,
+        disciplines: dict | None,
+        diagnosis_ids: set,
+    ) -> set:
+        """Загрузить JSON-файл таблицы. Возвращает id загруженных записей."""
+        ids = set()
+        batch = []
+        with open(
+            FIXSTURES_DIR / f"{table_name}.json",
+            "r",
+            encoding="utf-8",
+        ) as file:
+            for item in iter_json_array(file):
+                if table_name == "main_team":
+                    item = {
+                        "id": item["id"],
+                        "name": item["name"],
+                        "city_id": item["city_id"],
+                        "discipline_name_id": item["discipline_name_id"],
+                        "curator_id": None,
+                    }
+                elif table_name == "main_player":
+                    item = self.get_player_data(
+                        item,
+                        disciplines,
+                        diagnosis_ids,
+                    )
+                batch.append(model(**item))
+                ids.add(item.get("id"))
+                if len(batch) >= batch_size:
+                    model.objects.bulk_create(batch)
+                    batch = []
+        model.objects.bulk_create(batch)
+        return ids
+
+    def get_player_data(
+        self,
+        item: dict,
+        disciplines: dict,
+        diagnosis_ids: set,
+    ) -> dict:
+        """Поля игрока из записи JSON."""
+        diagnosis_id = item.get("diagnosis_id")
+        if diagnosis_id and diagnosis_id not in diagnosis_ids:
+            self.stdout.write(f"Диагноз с id {diagnosis_id} отсутсвует.")
+            diagnosis_id = None
+        discipline = disciplines[item["discipline_id"]]
+        return {
+            "id": item["id"],
+            "surname": item["surname"],
+            "name": item["name"],
+            "patronymic": item["patronymic"],
+            "birthday": item["birthday"],
+            "gender": item["gender"],
+            "level_revision": item["level_revision"],
+            "position": item["position"],
+            "number": item["number"],
+            "is_captain": item["is_captain"],
+            "is_assistent": item["is_assistent"],
+            "identity_document": item["identity_document"],
+            "diagnosis_id": diagnosis_id,
+            "discipline_name_id": discipline["discipline_name_id"],
+            "discipline_level_id": discipline["discipline_level_id"],
+        }
+
+    def rebuild_derived_data(self, models: list) -> None:
+        """Пересчитать данные, которые обычно обновляют сигналы."""
+        call_command("rebuild-search-index", stdout=self.stdout)
+        rebuild_rollup(Player.objects.all())
+        touch_watermarks(models)
+        for model in models:
+            if issubclass(model, BaseUniqueName):
+                dictionary_cache.invalidate(model)
 
     def handle(self, *args, **options):
         """Запись данных в БД."""
         fixtures = options.get("fixtures")
         if fixtures:
-            self.load_real_data()
+            self.load_real_data(options["batch_size"])
 
     def get_disciplines(self) -> dict:
         """Получение диспциплин."""
+        disciplines = {
+            None: {"discipline_level_id": None, "discipline_name_id": None},
+        }
         with open(
             FIXSTURES_DIR / "main_discipline.json",
             "r",
             encoding="utf-8",
         ) as file:
-            data = json.load(file)
-        disciplines = {
-            None: {"discipline_level_id": None, "discipline_name_id": None},
-        }
-        for item in data:
-            disciplines[item["id"]] = {
-                "discipline_level_id": item["discipline_level_id"],
-                "discipline_name_id": item["discipline_name_id"],
-            }
+            for item in iter_json_array(file):
+                disciplines[item["id"]] = {
+                    "discipline_level_id": item["discipline_level_id"],
+                    "discipline_name_id": item["discipline_name_id"],
+                }
         return disciplines
@@ -1,19 +1,33 @@
+import time
 from random import randint
 
-from core.constants import STAFF_POSITION_CHOICES, Role
+from analytics.rollup import rebuild_rollup
+from competitions.models import Competition
+from core.cache import dictionary_cache
+from core.constants import STAFF_POSITION_CHOICES, Role, ScaleConstants
+from core.watermarks import touch_watermarks
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
+from main.data_factories.bulk import MassDataGenerator
 from main.data_factories.factories import (
     CompetitionFactory,
     DiagnosisFactory,
     DocumentFactory,
-    GameFactory,
     PlayerFactory,
     StaffTeamMemberFactory,
     TeamFactory,
-    GameDataPlayerFactory,
 )
 from main.data_factories.utils import updates_for_players
-from main.models import Player
+from main.models import (
+    City,
+    Diagnosis,
+    Document,
+    Nosology,
+    Player,
+    StaffMember,
+    StaffTeamMember,
+    Team,
+)
 from unloads.factories import UnloadFactory
 from users.factories import UserFactory
 
@@ -83,24 +97,12 @@ class Command(BaseCommand):
             action="store_true",
             help="Фикстуры для таблицы Competition",
         )
-        parser.add_argument(
-            "-g",
-            "--game",
-            action="store_true",
-            help="Фикстуры для таблицы Game",
-        )
         parser.add_argument(
             "-un",
             "--unload",
             action="store_true",
             help="Фикстуры для таблицы Unloads",
         )
-        parser.add_argument(
-            "-json",
-            "--json-player-data",
-            action="store_true",
-            help="Фикстуры для таблицы JSON Player Data",
-        )
         parser.add_argument(
             "-a",
             "--amount",
@@ -108,6 +110,66 @@ class Command(BaseCommand):
             default=10,
             help="Количество фикстур для создания",
         )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            help=(
+                "Массовая генерация: на единицу масштаба "
+                f"{ScaleConstants.PLAYERS} игроков, "
+                f"{ScaleConstants.TEAMS} команд, "
+                f"{ScaleConstants.STAFF} сотрудников, "
+                f"{ScaleConstants.DOCUMENTS} документов и "
+                f"{ScaleConstants.COMPETITIONS} соревнований"
+            ),
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=ScaleConstants.SEED,
+            help="Начальное значение генератора случайных чисел для --scale",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ScaleConstants.BATCH_SIZE,
+            help="Количество записей в одном INSERT для --scale",
+        )
+
+    def generate_scale(self, scale: int, seed: int, batch_size: int):
+        """
+        Массовая генерация данных для нагрузочного тестирования.
+
+        bulk_create не отправляет сигналы, поэтому после генерации
+        пересчитываются индекс поиска, сводка аналитики, отметки
+        изменений и кеш справочников.
+        """
+        started = time.monotonic()
+        created = MassDataGenerator(seed, batch_size).generate(scale)
+        for name, amount in created.items():
+            self.stdout.write(f"{name}: {amount}")
+        call_command("rebuild-search-index", stdout=self.stdout)
+        rebuild_rollup(Player.objects.all())
+        touch_watermarks(
+            [
+                City,
+                Diagnosis,
+                Nosology,
+                Team,
+                StaffMember,
+                StaffTeamMember,
+                Player,
+                Document,
+                Competition,
+            ],
+        )
+        for model in (City, Diagnosis, Nosology):
+            dictionary_cache.invalidate(model)
+        return self.stdout.write(
+            self.style.SUCCESS(
+                f"Тестовые данные масштаба {scale} созданы за "
+                f"{time.monotonic() - started:.1f} с",
+            ),
+        )
 
     def handle(self, *args, **options):  # noqa: C901
         """Метод для наполнения базы тестовыми данными."""
@@ -119,10 +181,14 @@ class Command(BaseCommand):
         document = options.get("document", False)
         competition = options.get("competition", False)
         unload = options.get("unload", False)
-        json_player_data = options.get("json_player_data", False)
-        game = options.get("game", False)
         amount = options.get("amount")
 
+        if options.get("scale"):
+            return self.generate_scale(
+                options["scale"],
+                options["seed"],
+                options["batch_size"],
+            )
         if test_users:
             users_amount = sum(USERS.values())
             for role, amount in USERS.items():
@@ -184,13 +250,6 @@ class Command(BaseCommand):
                     f"{amount} фикстур для таблицы Competition созданы!",
                 ),
             )
-        if game:
-            GameFactory.create_batch(amount)
-            return self.stdout.write(
-                self.style.SUCCESS(
-                    f"{amount} фикстур для таблицы Game созданы.",
-                ),
-            )
         if unload:
             UnloadFactory.create_batch(AMOUNT_UNLOADS)
             return self.stdout.write(
@@ -198,10 +257,3 @@ class Command(BaseCommand):
                     f"{AMOUNT_UNLOADS} фикстуры для Unloads созданы.",
                 ),
             )
-        if json_player_data:
-            GameDataPlayerFactory.create_batch(amount)
-            return self.stdout.write(
-                self.style.SUCCESS(
-                    f"{amount} фикстур для таблицы JSON Player Data созданы.",
-                ),
-            )
@@ -1,54 +1,74 @@
-import json
-import os
+import time
 
-from django.apps import apps
+from core.cache import dictionary_cache
+from core.constants import DumpConstants
+from core.dump import restore_database
+from core.fixtures import reset_sequences
+from core.watermarks import is_watched, touch_watermarks
+from django.contrib.contenttypes.models import ContentType
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
-from django.db import connection
+from main.models import BaseUniqueName
 
-from core.config.dev_settings import DB_DUMP_FILE
+from core.config.dev_settings import DB_DUMP_DIR
 
 
 class Command(BaseCommand):
     """Класс импорта данных в БД."""
 
-    help = "Импорт данных из JSON-файла в базу данных"
+    help = "Импорт данных из каталога дампа в базу данных"
+
+    def add_arguments(self, parser):
+        """Аргументы."""
+        parser.add_argument(
+            "-i",
+            "--input",
+            default=str(DB_DUMP_DIR),
+            help="Каталог дампа.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Продолжить прерванный импорт без очистки таблиц.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DumpConstants.INSERT_BATCH_SIZE,
+            help="Количество записей в одном INSERT.",
+        )
 
     def handle(self, *args, **options):
         """Импортирует данные в БД."""
-        if not os.path.exists(DB_DUMP_FILE):
-            return self.stdout.write(
-                self.style.ERROR(f"Файл {DB_DUMP_FILE} не найден"),
-            )
-
-        with open(DB_DUMP_FILE, "r") as f:
-            data = json.load(f)
-        models_to_clear = set(item["model"] for item in data)
-
-        # Очистка таблиц, в которые импортируются данные,
-        # для исключения ошибки unique constraint
-        with connection.cursor() as cursor:
-            for model_name in models_to_clear:
-                try:
-                    app_label, model = model_name.split(".")
-                    model_class = apps.get_model(app_label, model)
-                    table_name = model_class._meta.db_table
-                    cursor.execute(f"TRUNCATE TABLE {table_name} CASCADE")
-                except Exception as e:
-                    return self.stdout.write(
-                        self.style.WARNING(
-                            f"Не удалось очистить таблицу для модели {model_name}: {str(e)}",  # noqa: E501
-                        ),
-                    )
-
+        started = time.monotonic()
         try:
-            call_command("loaddata", DB_DUMP_FILE)
-            return self.stdout.write(
-                self.style.SUCCESS(
-                    f"Данные из {DB_DUMP_FILE} импортированы в базу данных",
-                ),
+            models = restore_database(
+                options["input"],
+                resume=options["resume"],
+                batch_size=options["batch_size"],
+                progress=self.stdout.write,
             )
         except Exception as e:
             return self.stdout.write(
-                self.style.ERROR(f"Ошибка при импорте данных: {str(e)}"),
+                self.style.ERROR(
+                    f"Ошибка при импорте данных: {str(e)}. Импорт можно "
+                    "продолжить с ключом --resume",
+                ),
             )
+        self.rebuild_derived_data(models)
+        return self.stdout.write(
+            self.style.SUCCESS(
+                f"Данные из {options['input']} импортированы в базу данных "
+                f"за {time.monotonic() - started:.1f} с",
+            ),
+        )
+
+    def rebuild_derived_data(self, models: list) -> None:
+        """Пересчитать данные, которые обычно обновляют сигналы."""
+        reset_sequences(models)
+        call_command("rebuild-search-index", stdout=self.stdout)
+        touch_watermarks(filter(is_watched, models))
+        ContentType.objects.clear_cache()
+        for model in models:
+            if issubclass(model, BaseUniqueName):
+                dictionary_cache.invalidate(model)
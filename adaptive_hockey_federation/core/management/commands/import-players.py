@@ -0,0 +1,67 @@
+import csv
+
+from core.constants import ImportConstants
+from django.core.management.base import BaseCommand, CommandError
+from main.player_import import PlayerImportError, import_players
+
+
+class Command(BaseCommand):
+    """Импорт игроков из файла excel или CSV."""
+
+    help = (
+        "Пакетный импорт игроков из файла .xlsx или .csv с отчетом "
+        "об ошибках по строкам"
+    )
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument("path", help="Путь к файлу .xlsx или .csv")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Только проверить файл, ничего не сохраняя",
+        )
+        parser.add_argument(
+            "--report",
+            help="Сохранить все ошибки в CSV-файл",
+        )
+
+    def handle(self, *args, **options):
+        """Импортирует игроков и выводит итог и ошибки."""
+        try:
+            result = import_players(options["path"], options["dry_run"])
+        except (OSError, PlayerImportError) as error:
+            raise CommandError(str(error)) from error
+        for error in result.errors[: ImportConstants.REPORT_PREVIEW]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Строка {error.row}, {error.column}: {error.message}",
+                ),
+            )
+        hidden = len(result.errors) - ImportConstants.REPORT_PREVIEW
+        if hidden > 0:
+            self.stdout.write(f"... и еще ошибок: {hidden}")
+        if options["report"]:
+            with open(
+                options["report"],
+                "w",
+                encoding="utf-8-sig",
+                newline="",
+            ) as file:
+                writer = csv.writer(file, delimiter=";")
+                writer.writerow(("Строка", "Колонка", "Ошибка"))
+                writer.writerows(
+                    (error.row, error.column, error.message)
+                    for error in result.errors
+                )
+        if result.dry_run:
+            summary = (
+                f"Проверено строк: {result.rows}, "
+                f"ошибок: {len(result.errors)}"
+            )
+        else:
+            summary = (
+                f"Строк: {result.rows}, добавлено игроков: "
+                f"{result.created}, ошибок: {len(result.errors)}"
+            )
+        return self.stdout.write(self.style.SUCCESS(summary))
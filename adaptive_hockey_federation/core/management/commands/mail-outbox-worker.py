@@ -0,0 +1,43 @@
+import time
+
+from core.outbox import drain_outbox
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """Исполнитель очереди исходящих писем."""
+
+    help = "Отправка писем из очереди пачками через одно соединение"
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Отправить текущую очередь и завершить работу",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.MAIL_OUTBOX_POLL_INTERVAL,
+            help="Пауза между опросами очереди, сек.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.MAIL_OUTBOX_BATCH_SIZE,
+            help="Количество писем на одно соединение",
+        )
+
+    def handle(self, *args, **options):
+        """Опрашивает очередь и отправляет готовые к отправке письма."""
+        while True:
+            sent = drain_outbox(options["batch_size"])
+            if sent:
+                self.stdout.write(
+                    self.style.SUCCESS(f"Отправлено писем: {sent}"),
+                )
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
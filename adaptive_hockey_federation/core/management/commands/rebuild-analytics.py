@@ -0,0 +1,16 @@
+from analytics.rollup import rebuild_rollup
+from django.core.management.base import BaseCommand
+from main.models import Player
+
+
+class Command(BaseCommand):
+    """Пересчет сводки для страницы аналитики."""
+
+    help = "Полный пересчет сводки по игрокам для страницы аналитики"
+
+    def handle(self, *args, **options):
+        """Пересчитывает сводку PlayerRollup по всем игрокам."""
+        rows = rebuild_rollup(Player.objects.all())
+        return self.stdout.write(
+            self.style.SUCCESS(f"Сводка пересчитана, групп: {rows}"),
+        )
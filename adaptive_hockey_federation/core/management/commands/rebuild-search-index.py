@@ -0,0 +1,50 @@
+from core.search import (
+    SEARCH_CHUNK_SIZE,
+    is_search_index_supported,
+    update_search_vectors,
+)
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+from main.models import Player, StaffMember, Team
+
+
+class Command(BaseCommand):
+    """Пересчет индекса полнотекстового поиска."""
+
+    help = (
+        "Пересчет индекса поиска игроков, сотрудников, команд и "
+        "пользователей (только PostgreSQL)"
+    )
+
+    def handle(self, *args, **options):
+        """Пересчитывает поле search_vector всех записей."""
+        if not is_search_index_supported(DEFAULT_DB_ALIAS):
+            return self.stdout.write(
+                self.style.WARNING(
+                    "Индекс поиска поддерживается только в PostgreSQL",
+                ),
+            )
+        querysets = (
+            Player.objects.select_related(
+                "discipline_name",
+                "discipline_level",
+            ).prefetch_related("team"),
+            StaffMember.objects.all(),
+            Team.objects.select_related("city", "discipline_name"),
+            get_user_model().objects.all(),
+        )
+        for queryset in querysets:
+            with transaction.atomic():
+                update_search_vectors(
+                    queryset.order_by("pk").iterator(
+                        chunk_size=SEARCH_CHUNK_SIZE,
+                    ),
+                )
+            self.stdout.write(
+                f"{queryset.model._meta.verbose_name_plural}: "
+                f"{queryset.count()}",
+            )
+        return self.stdout.write(
+            self.style.SUCCESS("Индекс поиска пересчитан"),
+        )
@@ -0,0 +1,45 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from unloads.jobs import get_pending_unload_ids, run_unload
+
+
+class Command(BaseCommand):
+    """Исполнитель фоновых задач выгрузки."""
+
+    help = "Формирование файлов выгрузок, стоящих в очереди"
+
+    def add_arguments(self, parser):
+        """Аргументы команды."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Обработать текущую очередь и завершить работу",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.UNLOADS_POLL_INTERVAL,
+            help="Пауза между опросами очереди, сек.",
+        )
+
+    def handle(self, *args, **options):
+        """Опрашивает очередь выгрузок и выполняет задачи по одной."""
+        while True:
+            pending = get_pending_unload_ids(settings.UNLOADS_WORKERS)
+            for pk in pending:
+                unload = run_unload(pk)
+                if unload is not None:
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Выгрузка {unload.pk}: "
+                            f"{unload.get_status_display()} "
+                            f"({unload.rows_count or 0} строк, "
+                            f"{unload.duration})",
+                        ),
+                    )
+            if not pending:
+                if options["once"]:
+                    return
+                time.sleep(options["interval"])
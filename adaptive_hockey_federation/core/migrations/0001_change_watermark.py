@@ -0,0 +1,28 @@
+# Generated by Django 4.2.13 on 2026-10-18 09:57
+
+import core.constants
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], unique=True, verbose_name='Модель')),
+                ('version', models.PositiveBigIntegerField(default=1, verbose_name='Версия')),
+                ('changed_at', models.DateTimeField(verbose_name='Дата изменения')),
+            ],
+            options={
+                'verbose_name': 'Отметка изменения',
+                'verbose_name_plural': 'Отметки изменений',
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.13 on 2026-10-18 10:03
+
+import core.constants
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_change_watermark'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], verbose_name='Тема')),
+                ('from_email', models.CharField(max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], verbose_name='Отправитель')),
+                ('to', models.JSONField(default=list, verbose_name='Получатели')),
+                ('body', models.TextField(blank=True, verbose_name='Текст письма')),
+                ('html_body', models.TextField(blank=True, verbose_name='HTML письма')),
+                ('status', models.CharField(choices=[(core.constants.MailStatus['PENDING'], 'В очереди'), (core.constants.MailStatus['SENDING'], 'Отправляется'), (core.constants.MailStatus['SENT'], 'Отправлено'), (core.constants.MailStatus['FAILED'], 'Ошибка')], default=core.constants.MailStatus['PENDING'], max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], verbose_name='Статус')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Попыток отправки')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Следующая попытка')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='Взято в отправку')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Дата создания')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Дата отправки')),
+                ('error', models.TextField(blank=True, verbose_name='Ошибка')),
+            ],
+            options={
+                'verbose_name': 'Исходящее письмо',
+                'verbose_name_plural': 'Исходящие письма',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outgoing_email_queue_idx')],
+            },
+        ),
+    ]
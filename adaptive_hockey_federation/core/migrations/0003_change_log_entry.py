@@ -0,0 +1,30 @@
+# Generated by Django 4.2.13 on 2026-10-18 10:14
+
+import core.constants
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_outgoing_email'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], verbose_name='Модель')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='Идентификатор записи')),
+                ('action', models.CharField(choices=[(core.constants.ChangeAction['CREATED'], 'Создание'), (core.constants.ChangeAction['UPDATED'], 'Изменение'), (core.constants.ChangeAction['DELETED'], 'Удаление')], max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], verbose_name='Действие')),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Дата изменения')),
+            ],
+            options={
+                'verbose_name': 'Запись журнала изменений',
+                'verbose_name_plural': 'Журнал изменений',
+                'indexes': [models.Index(fields=['model', 'id'], name='change_log_model_id_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,158 @@
+from core.constants import (
+    CHANGE_ACTION_CHOICES,
+    MAIL_STATUS_CHOICES,
+    MailStatus,
+    MainConstantsInt,
+)
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class ChangeWatermark(models.Model):
+    """
+    Отметка последнего изменения данных модели.
+
+    Номер версии увеличивается при каждом сохранении и удалении записей
+    модели, из отметок строятся ETag и Last-Modified страниц.
+    """
+
+    model = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        unique=True,
+        verbose_name=_("Модель"),
+    )
+    version = models.PositiveBigIntegerField(
+        default=1,
+        verbose_name=_("Версия"),
+    )
+    changed_at = models.DateTimeField(
+        verbose_name=_("Дата изменения"),
+    )
+
+    class Meta:
+        verbose_name = "Отметка изменения"
+        verbose_name_plural = "Отметки изменений"
+
+    def __str__(self):
+        """Метод, использующий модель и версию для представления."""
+        return f"{self.model} ({self.version})"
+
+
+class ChangeLogEntry(models.Model):
+    """
+    Запись журнала изменений.
+
+    Журнал только дополняется: каждое создание, изменение и удаление
+    записи отслеживаемой модели добавляет строку. Первичный ключ служит
+    монотонным номером изменения для ленты ?since=, удаление оставляет
+    запись-надгробие с действием "deleted".
+    """
+
+    model = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        verbose_name=_("Модель"),
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name=_("Идентификатор записи"),
+    )
+    action = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        choices=CHANGE_ACTION_CHOICES,
+        verbose_name=_("Действие"),
+    )
+    changed_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("Дата изменения"),
+    )
+
+    class Meta:
+        verbose_name = "Запись журнала изменений"
+        verbose_name_plural = "Журнал изменений"
+        indexes = [
+            models.Index(
+                fields=["model", "id"],
+                name="change_log_model_id_idx",
+            ),
+        ]
+
+    def __str__(self):
+        """Метод, использующий модель, запись и действие."""
+        return f"{self.model}:{self.object_id} {self.action}"
+
+
+class OutgoingEmail(models.Model):
+    """
+    Письмо в очереди отправки.
+
+    Письма сохраняются уже отрисованными и отправляются командой
+    mail-outbox-worker (или пулом потоков веб-процесса) пачками через
+    одно соединение с почтовым сервером.
+    """
+
+    subject = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        verbose_name=_("Тема"),
+    )
+    from_email = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        verbose_name=_("Отправитель"),
+    )
+    to = models.JSONField(
+        default=list,
+        verbose_name=_("Получатели"),
+    )
+    body = models.TextField(
+        blank=True,
+        verbose_name=_("Текст письма"),
+    )
+    html_body = models.TextField(
+        blank=True,
+        verbose_name=_("HTML письма"),
+    )
+    status = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        choices=MAIL_STATUS_CHOICES,
+        default=MailStatus.PENDING,
+        verbose_name=_("Статус"),
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Попыток отправки"),
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("Следующая попытка"),
+    )
+    locked_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Взято в отправку"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Дата создания"),
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Дата отправки"),
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name=_("Ошибка"),
+    )
+
+    class Meta:
+        verbose_name = "Исходящее письмо"
+        verbose_name_plural = "Исходящие письма"
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="outgoing_email_queue_idx",
+            ),
+        ]
+
+    def __str__(self):
+        """Метод, использующий тему и получателей для представления."""
+        return f"{self.subject} ({', '.join(self.to)})"
@@ -0,0 +1,201 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Iterable
+
+from core.constants import MailStatus
+from core.models import OutgoingEmail
+from django.conf import settings
+from django.core.mail import (
+    EmailMessage,
+    EmailMultiAlternatives,
+    get_connection,
+)
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_html_body(message: EmailMessage) -> str:
+    """HTML-версия письма, если она есть."""
+    if message.content_subtype == "html":
+        return message.body
+    for content, mimetype in getattr(message, "alternatives", ()):
+        if mimetype == "text/html":
+            return content
+    return ""
+
+
+def queue_emails(messages: Iterable[EmailMessage]) -> list[OutgoingEmail]:
+    """
+    Поставить письма в очередь отправки.
+
+    Письма сохраняются одним запросом. Если MAIL_OUTBOX_RUN_IN_PROCESS
+    включен, очередь разбирается пулом потоков после коммита, иначе -
+    командой mail-outbox-worker.
+    """
+    emails = OutgoingEmail.objects.bulk_create(
+        OutgoingEmail(
+            subject=message.subject,
+            from_email=message.from_email or settings.DEFAULT_FROM_EMAIL,
+            to=list(message.to),
+            body="" if message.content_subtype == "html" else message.body,
+            html_body=get_html_body(message),
+        )
+        for message in messages
+    )
+    if emails and settings.MAIL_OUTBOX_RUN_IN_PROCESS:
+        transaction.on_commit(lambda: get_executor().submit(drain_outbox))
+    return emails
+
+
+def queue_email(message: EmailMessage) -> OutgoingEmail:
+    """Поставить одно письмо в очередь отправки."""
+    return queue_emails([message])[0]
+
+
+def build_message(email: OutgoingEmail, connection) -> EmailMultiAlternatives:
+    """Письмо для отправки из записи очереди."""
+    message = EmailMultiAlternatives(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email,
+        to=email.to,
+        connection=connection,
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, "text/html")
+    return message
+
+
+def claim_batch(limit: int) -> list[OutgoingEmail]:
+    """
+    Взять в отправку пачку писем, срок отправки которых наступил.
+
+    Строки блокируются с SKIP LOCKED (где поддерживается), поэтому
+    несколько исполнителей не возьмут одно письмо. Письма, зависшие в
+    отправке дольше MAIL_OUTBOX_LOCK_TIMEOUT, берутся повторно.
+    """
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.MAIL_OUTBOX_LOCK_TIMEOUT)
+    with transaction.atomic():
+        ids = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=MailStatus.PENDING, next_attempt_at__lte=now)
+                | Q(status=MailStatus.SENDING, locked_at__lt=stale),
+            )
+            .order_by("next_attempt_at", "pk")
+            .values_list("pk", flat=True)[:limit],
+        )
+        OutgoingEmail.objects.filter(pk__in=ids).update(
+            status=MailStatus.SENDING,
+            locked_at=now,
+        )
+    return list(OutgoingEmail.objects.filter(pk__in=ids).order_by("pk"))
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    """Пауза перед следующей попыткой: экспоненциальный рост."""
+    delay = settings.MAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(
+        seconds=min(delay, settings.MAIL_OUTBOX_MAX_RETRY_DELAY),
+    )
+
+
+def mark_failed(email: OutgoingEmail, error: Exception) -> None:
+    """Запланировать повтор или окончательно отметить ошибку."""
+    email.attempts += 1
+    email.error = str(error)
+    email.locked_at = None
+    if email.attempts >= settings.MAIL_OUTBOX_MAX_ATTEMPTS:
+        email.status = MailStatus.FAILED
+    else:
+        email.status = MailStatus.PENDING
+        email.next_attempt_at = timezone.now() + get_retry_delay(
+            email.attempts,
+        )
+    email.save(
+        update_fields=[
+            "attempts",
+            "error",
+            "locked_at",
+            "status",
+            "next_attempt_at",
+        ],
+    )
+
+
+def send_batch(emails: list[OutgoingEmail]) -> int:
+    """
+    Отправить пачку писем через одно соединение.
+
+    Ошибка отдельного письма не прерывает пачку: письмо уходит на
+    повтор. Если не удалось открыть соединение, на повтор уходит вся
+    пачка. Возвращает число отправленных писем.
+    """
+    if not emails:
+        return 0
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as error:
+        logger.exception("Не удалось подключиться к почтовому серверу")
+        for email in emails:
+            mark_failed(email, error)
+        return 0
+    sent = []
+    try:
+        for email in emails:
+            try:
+                connection.send_messages([build_message(email, connection)])
+            except Exception as error:
+                logger.warning(
+                    "Ошибка отправки письма %s на %s: %s",
+                    email.pk,
+                    email.to,
+                    error,
+                )
+                mark_failed(email, error)
+            else:
+                sent.append(email.pk)
+    finally:
+        connection.close()
+    OutgoingEmail.objects.filter(pk__in=sent).update(
+        status=MailStatus.SENT,
+        sent_at=timezone.now(),
+        locked_at=None,
+        error="",
+    )
+    return len(sent)
+
+
+def drain_outbox(batch_size: int | None = None) -> int:
+    """Отправлять письма пачками, пока очередь не опустеет."""
+    batch_size = batch_size or settings.MAIL_OUTBOX_BATCH_SIZE
+    close_old_connections()
+    try:
+        total = 0
+        while batch := claim_batch(batch_size):
+            total += send_batch(batch)
+        return total
+    finally:
+        close_old_connections()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Пул процесса для фоновой отправки писем (один поток)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="mail-outbox",
+            )
+    return _executor
@@ -0,0 +1,246 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from functools import cached_property
+
+from core.search import SEARCH_RANK
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from django.http import Http404
+
+CURSOR_NEXT = "n"
+CURSOR_PREVIOUS = "p"
+
+
+def reverse_key(key: str) -> str:
+    """Ключ сортировки с обратным направлением."""
+    return key[1:] if key.startswith("-") else f"-{key}"
+
+
+def estimate_count(queryset: QuerySet) -> int:
+    """
+    Количество записей выборки.
+
+    На PostgreSQL - оценка планировщика из EXPLAIN (по статистике
+    таблиц, без прохода по данным), на остальных СУБД - точный COUNT.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPage(Sequence):
+    """Страница keyset-пагинации."""
+
+    def __init__(
+        self,
+        object_list: list,
+        paginator: "KeysetPaginator",
+        has_next: bool,
+        has_previous: bool,
+    ):
+        """Сохраняет записи страницы и наличие соседних страниц."""
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __len__(self):
+        """Количество записей на странице."""
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        """Запись страницы по индексу."""
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        """Есть ли следующая страница."""
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        """Есть ли предыдущая страница."""
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        """Есть ли другие страницы."""
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self) -> str | None:
+        """Курсор следующей страницы."""
+        if not self._has_next:
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1], CURSOR_NEXT)
+
+    @property
+    def previous_cursor(self) -> str | None:
+        """Курсор предыдущей страницы."""
+        if not self._has_previous:
+            return None
+        return self.paginator.encode_cursor(
+            self.object_list[0],
+            CURSOR_PREVIOUS,
+        )
+
+
+class KeysetPaginator:
+    """
+    Пагинация по ключу сортировки вместо OFFSET.
+
+    Записи упорядочиваются по полям ordering и первичному ключу, курсор
+    хранит значения этих полей у крайней записи страницы. Следующая
+    страница выбирается условием "после курсора" и LIMIT, поэтому
+    стоимость запроса не зависит от номера страницы. Поля сортировки
+    должны быть полями самой модели и не допускать NULL.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        per_page: int,
+        ordering: Sequence[str],
+    ):
+        """Сохраняет выборку и порядок сортировки."""
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        ordering = [key for key in ordering if key.lstrip("-") != "pk"]
+        descending = bool(ordering) and ordering[-1].startswith("-")
+        self.ordering = [*ordering, "-pk" if descending else "pk"]
+
+    @cached_property
+    def count(self) -> int:
+        """Количество записей (на PostgreSQL - оценка)."""
+        return estimate_count(self.queryset)
+
+    def get_field(self, key: str):
+        """Поле модели для ключа сортировки."""
+        meta = self.queryset.model._meta
+        name = key.lstrip("-")
+        return meta.pk if name == "pk" else meta.get_field(name)
+
+    def encode_cursor(self, instance: Model, direction: str) -> str:
+        """Курсор, указывающий на запись instance."""
+        values = [
+            self.get_field(key).value_from_object(instance)
+            for key in self.ordering
+        ]
+        payload = json.dumps([direction, values], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> tuple[str, list]:
+        """Направление и значения ключей сортировки из курсора."""
+        try:
+            direction, values = json.loads(base64.urlsafe_b64decode(cursor))
+            if direction not in (CURSOR_NEXT, CURSOR_PREVIOUS) or len(
+                values,
+            ) != len(self.ordering):
+                raise ValueError
+            return direction, [
+                self.get_field(key).to_python(value)
+                for key, value in zip(self.ordering, values, strict=True)
+            ]
+        except (ValueError, TypeError, binascii.Error) as error:
+            raise InvalidPage("Неверный курсор страницы.") from error
+
+    def get_filter(self, values: list, backward: bool) -> Q:
+        """Условие "после курсора" (или "до курсора" при backward)."""
+        condition = Q()
+        for index, key in enumerate(self.ordering):
+            name = key.lstrip("-")
+            lookup = "lt" if key.startswith("-") != backward else "gt"
+            term = Q(**{f"{name}__{lookup}": values[index]})
+            for previous, value in zip(
+                self.ordering[:index],
+                values[:index],
+                strict=True,
+            ):
+                term &= Q(**{previous.lstrip("-"): value})
+            condition |= term
+        return condition
+
+    def page(self, cursor: str | None) -> KeysetPage:
+        """Страница после (или перед) курсором; без курсора - первая."""
+        direction, values = CURSOR_NEXT, None
+        if cursor:
+            direction, values = self.decode_cursor(cursor)
+        backward = direction == CURSOR_PREVIOUS
+        ordering = (
+            [reverse_key(key) for key in self.ordering]
+            if backward
+            else self.ordering
+        )
+        queryset = self.queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self.get_filter(values, backward))
+        object_list = list(queryset[: self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if backward:
+            object_list.reverse()
+            return KeysetPage(object_list, self, True, has_more)
+        return KeysetPage(object_list, self, has_more, values is not None)
+
+
+class KeysetPaginationMixin:
+    """
+    Миксин ListView с keyset-пагинацией.
+
+    keyset_ordering - поля сортировки без первичного ключа. Выборки,
+    отсортированные по релевантности поиска, листаются по номерам
+    страниц, как раньше.
+    """
+
+    keyset_ordering: Sequence[str] = ()
+    cursor_kwarg = "cursor"
+
+    def get_keyset_ordering(self, queryset: QuerySet) -> Sequence[str] | None:
+        """Поля сортировки или None, если нужна обычная пагинация."""
+        if SEARCH_RANK in queryset.query.annotations:
+            return None
+        return self.keyset_ordering
+
+    def get_page_query(self, cursor: str | None) -> str | None:
+        """Строка запроса ссылки на страницу с курсором."""
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query.pop(self.page_kwarg, None)
+        query[self.cursor_kwarg] = cursor
+        return query.urlencode()
+
+    def paginate_queryset(self, queryset, page_size):
+        """Разбить выборку на страницы по курсору."""
+        ordering = self.get_keyset_ordering(queryset)
+        if ordering is None:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size, ordering)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidPage as error:
+            raise Http404(str(error)) from error
+        page.next_query = self.get_page_query(page.next_cursor)
+        page.previous_query = self.get_page_query(page.previous_cursor)
+        first = self.request.GET.copy()
+        first.pop(self.cursor_kwarg, None)
+        first.pop(self.page_kwarg, None)
+        page.first_query = first.urlencode()
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        """Добавить в контекст признак keyset-пагинации."""
+        context = super().get_context_data(**kwargs)
+        context["keyset_pagination"] = isinstance(
+            context.get("paginator"),
+            KeysetPaginator,
+        )
+        return context
@@ -0,0 +1,166 @@
+import re
+from typing import Iterable
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+)
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import (
+    Case,
+    F,
+    IntegerField,
+    Model,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+    When,
+)
+
+SEARCH_CONFIG = "russian"
+SEARCH_WEIGHTS = ("A", "B", "C", "D")
+SEARCH_RANK = "search_rank"
+SEARCH_TERM = re.compile(r"\w+")
+SEARCH_CHUNK_SIZE = 2000
+
+
+def is_search_index_supported(using: str) -> bool:
+    """Поддерживает ли БД полнотекстовый индекс (только PostgreSQL)."""
+    return connections[using].vendor == "postgresql"
+
+
+def build_search_vector(document: Iterable[Iterable[str]]) -> SearchVector:
+    """
+    Выражение tsvector для документа модели.
+
+    document - последовательность групп текстов в порядке убывания веса:
+    первая группа получает вес A, вторая - B и т.д.
+    """
+    vectors = [
+        SearchVector(
+            Value(" ".join(filter(None, texts)), output_field=TextField()),
+            weight=weight,
+            config=SEARCH_CONFIG,
+        )
+        for weight, texts in zip(SEARCH_WEIGHTS, document, strict=False)
+    ]
+    vector = vectors[0]
+    for item in vectors[1:]:
+        vector += item
+    return vector
+
+
+def update_search_vectors(
+    instances: Iterable[Model],
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """
+    Пересчитать поле search_vector объектов.
+
+    У моделей с индексом поиска есть метод get_search_document,
+    возвращающий группы текстов для build_search_vector. На СУБД без
+    полнотекстового поиска ничего не делает (и не читает instances).
+    """
+    if not is_search_index_supported(using):
+        return
+    for instance in instances:
+        type(instance)._default_manager.using(using).filter(
+            pk=instance.pk,
+        ).update(
+            search_vector=build_search_vector(
+                instance.get_search_document(),
+            ),
+        )
+
+
+def get_phone_search_terms(phone) -> list[str]:
+    """Номер телефона целиком и без кода страны для поиска по префиксу."""
+    if not phone:
+        return []
+    if not phone.is_valid():
+        return [str(phone)]
+    return [phone.as_e164.lstrip("+"), str(phone.national_number)]
+
+
+def build_search_query(search: str, weights: str = "") -> SearchQuery | None:
+    """
+    Запрос tsquery по строке поиска.
+
+    Каждое слово ищется как префикс, все слова должны присутствовать в
+    документе. weights ограничивает поиск группами текстов с этими
+    весами (например, "A" - только первая группа). Возвращает None, если
+    в строке нет ни одного слова.
+    """
+    terms = SEARCH_TERM.findall(search)
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{term}:*{weights}" for term in terms),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+def search_queryset(
+    queryset: QuerySet,
+    search: str,
+    weights: str = "",
+) -> QuerySet | None:
+    """
+    Отфильтровать выборку по индексу поиска с ранжированием.
+
+    Добавляет аннотацию SEARCH_RANK, weights передается в
+    build_search_query. Возвращает None, если индекс на текущей СУБД
+    недоступен - тогда вызывающий код использует обычный поиск по
+    вхождению подстроки.
+    """
+    if not is_search_index_supported(queryset.db):
+        return None
+    query = build_search_query(search, weights)
+    if query is None:
+        return queryset.none()
+    return queryset.filter(search_vector=query).annotate(
+        **{SEARCH_RANK: SearchRank(F("search_vector"), query)},
+    )
+
+
+def order_by_rank(queryset: QuerySet, *ordering: str) -> QuerySet:
+    """Сортировка по релевантности, если выборка получена из поиска."""
+    if SEARCH_RANK in queryset.query.annotations:
+        return queryset.order_by(f"-{SEARCH_RANK}", *ordering)
+    return queryset.order_by(*ordering)
+
+
+def typeahead_queryset(
+    queryset: QuerySet,
+    term: str,
+    field: str = "name",
+) -> QuerySet:
+    """
+    Варианты автодополнения по введенному тексту.
+
+    Первыми идут значения, начинающиеся с текста, затем похожие на него
+    по триграммам (PostgreSQL, индексы gin_trgm_ops) или содержащие его
+    (остальные СУБД). Пустой текст возвращает все значения по алфавиту.
+    """
+    if not term:
+        return queryset.order_by(field, "pk")
+    prefix = Q(**{f"{field}__istartswith": term})
+    ordering = [
+        Case(
+            When(prefix, then=Value(0)),
+            default=Value(1),
+            output_field=IntegerField(),
+        ),
+    ]
+    if is_search_index_supported(queryset.db):
+        queryset = queryset.filter(
+            prefix | Q(**{f"{field}__trigram_similar": term}),
+        )
+        ordering.append(TrigramSimilarity(field, term).desc())
+    else:
+        queryset = queryset.filter(**{f"{field}__icontains": term})
+    return queryset.order_by(*ordering, field, "pk")
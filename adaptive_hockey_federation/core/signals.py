@@ -0,0 +1,55 @@
+from core.changelog import is_logged, record_changes
+from core.constants import ChangeAction
+from core.watermarks import is_watched, touch_watermarks
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def watermark_touch(sender, using, **kwargs):
+    if is_watched(sender):
+        touch_watermarks([sender], using)
+
+
+@receiver(m2m_changed)
+def watermark_touch_m2m(sender, instance, action, model, using, **kwargs):
+    if action.startswith("post_") and is_watched(sender):
+        touch_watermarks([type(instance), model], using)
+
+
+@receiver(post_save)
+def change_log_save(sender, instance, created, using, **kwargs):
+    if is_logged(sender):
+        action = ChangeAction.CREATED if created else ChangeAction.UPDATED
+        record_changes(sender, [instance.pk], action, using)
+
+
+@receiver(post_delete)
+def change_log_delete(sender, instance, using, **kwargs):
+    if is_logged(sender):
+        record_changes(sender, [instance.pk], ChangeAction.DELETED, using)
+
+
+@receiver(m2m_changed)
+def change_log_m2m(
+    sender,
+    instance,
+    action,
+    reverse,
+    model,
+    pk_set,
+    using,
+    **kwargs,
+):
+    if not action.startswith("post_"):
+        return
+    if not reverse and is_logged(type(instance)):
+        record_changes(
+            type(instance),
+            [instance.pk],
+            ChangeAction.UPDATED,
+            using,
+        )
+    elif reverse and pk_set and is_logged(model):
+        record_changes(model, pk_set, ChangeAction.UPDATED, using)
@@ -12,6 +12,7 @@ urlpatterns = [
     path("", include("analytics.urls", namespace="analytics")),
     path("", include("unloads.urls", namespace="unloads")),
     path("auth/", include("django.contrib.auth.urls")),
+    path("api/", include("api.urls", namespace="api")),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
 handler404 = "core.views.not_found"
@@ -1,11 +1,20 @@
+import csv
 import os
+import tempfile
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional
 
 
-from core.constants import AgeLimits, FileConstants, TimeFormat
+from core.constants import (
+    PLAYER_FLAG_FIELDS,
+    AgeLimits,
+    ExportConstants,
+    FileConstants,
+    TimeFormat,
+)
 from core.config.openpyxl.settings import (
     ALIGNMENT_CENTER,
+    COLUMN_WIDTH_PADDING,
     HEADERS_BORDER,
     HEADERS_FILL,
     HEADERS_FONT,
@@ -18,9 +27,12 @@ from core.config.openpyxl.settings import (
 from django.conf import settings
 from main.models import Player
 from django.core.files.uploadedfile import InMemoryUploadedFile
-from django.db.models import QuerySet
+from django.db.models import Field, QuerySet
 from openpyxl import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border, Font, PatternFill
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 
 
 def generate_file_name(filename: str, prefix: str) -> str:
@@ -54,52 +66,153 @@ def max_date():
     return f"{str(now.year - AgeLimits.MIN_AGE_PLAYER)}-{month_day}"
 
 
-def column_width(workbook: Worksheet) -> None:
-    for col in workbook.columns:
-        max_length = 0
-        column = col[0].column_letter
-        for cell in col:
-            if len(str(cell.value)) > max_length:
-                max_length = len(str(cell.value))
-        adjusted_width = max_length + 2
-        workbook.column_dimensions[column].width = adjusted_width
+def append_rows(
+    ws,
+    rows: Iterable[List[str]],
+    heartbeat: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Перенести строки данных в write-only лист, чередуя заливку.
+
+    heartbeat вызывается после каждой порции из CHUNK_SIZE строк.
+    """
+    for index, row in enumerate(rows, start=1):
+        if index % 2:
+            ws.append(styled_row(ws, row, fill=ROWS_FILL))
+        else:
+            ws.append(row)
+        if heartbeat and index % ExportConstants.CHUNK_SIZE == 0:
+            heartbeat()
 
 
 def export_excel(
-    queryset: QuerySet,
+    queryset: QuerySet | None,
     filename: str,
     title: str,
     excluded_fields: Optional[List[str]] = None,
     fields_order: Optional[List[str]] = None,
+    progress: Optional[Callable[[int], None]] = None,
+    heartbeat: Optional[Callable[[], None]] = None,
 ) -> str:
     """
-    Выгрузка данных в excel (формат xlsx).
+    Потоковая выгрузка данных в excel (формат xlsx).
+
+    Записи читаются из БД порциями (values_list + iterator), строки
+    сразу сбрасываются во временный файл, а ширина колонок считается в
+    том же проходе. Затем строки переносятся в write-only книгу openpyxl,
+    поэтому расход памяти не зависит от количества выгружаемых записей.
+
+    Если передан progress, он вызывается с числом уже выгруженных записей
+    после каждой порции и один раз по окончании чтения данных. heartbeat
+    вызывается после каждой порции строк, перенесенных в книгу, чтобы
+    вызывающий код мог отметить, что выгрузка еще формируется.
 
     После создания файла возвращает его имя.
     """
     if excluded_fields is None:
         excluded_fields = []
 
-    wb = Workbook()
-    del wb["Sheet"]
-    ws: Worksheet = wb.create_sheet("Лист1")
-    ws.append(["", title])
-
-    if queryset:
-        headers, fields = get_fields_and_headers(
-            queryset,
-            excluded_fields,
-            fields_order,
+    title_row = ["", title]
+    widths = ColumnWidths()
+    widths.update(title_row)
+
+    with tempfile.TemporaryFile(
+        mode="w+",
+        newline="",
+        encoding="utf-8",
+    ) as spool:
+        rows_count = 0
+        headers: List[str] = []
+        if queryset is not None:
+            headers, fields = get_fields_and_headers(
+                queryset,
+                excluded_fields,
+                fields_order,
+            )
+            writer = csv.writer(spool)
+            for row in iter_export_rows(queryset, fields):
+                writer.writerow(row)
+                widths.update(row)
+                rows_count += 1
+                if progress and rows_count % ExportConstants.CHUNK_SIZE == 0:
+                    progress(rows_count)
+            if rows_count:
+                widths.update(headers)
+
+        if progress:
+            progress(rows_count)
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Лист1")
+        widths.apply(ws)
+        ws.row_dimensions[1].height = TITLE_HEIGHT
+        ws.append(
+            styled_row(ws, title_row, fill=TITLE_FILL, font=TITLE_FONT),
         )
-        ws.append(headers)
-        add_data_to_worksheet(ws, queryset, fields)
-
-        apply_styles(ws)
 
-    file_path = save_workbook(wb, filename)
+        if rows_count:
+            ws.row_dimensions[2].height = HEADERS_HEIGHT
+            ws.append(
+                styled_row(
+                    ws,
+                    headers,
+                    fill=HEADERS_FILL,
+                    font=HEADERS_FONT,
+                    border=HEADERS_BORDER,
+                ),
+            )
+            spool.seek(0)
+            append_rows(ws, csv.reader(spool), heartbeat)
+
+        file_path = save_workbook(wb, filename)
     return file_path
 
 
+class ColumnWidths:
+    """Накопитель ширины колонок, обновляемый построчно."""
+
+    def __init__(self) -> None:
+        """Метод инициализации экземпляра класса."""
+        self.max_lengths: List[int] = []
+
+    def update(self, row: Iterable[Any]) -> None:
+        """Учесть длины значений очередной строки."""
+        for index, value in enumerate(row):
+            length = len(str(value))
+            if index == len(self.max_lengths):
+                self.max_lengths.append(length)
+            elif length > self.max_lengths[index]:
+                self.max_lengths[index] = length
+
+    def apply(self, ws: WriteOnlyWorksheet) -> None:
+        """Задать ширину колонок листа (до записи первой строки)."""
+        for index, length in enumerate(self.max_lengths, 1):
+            ws.column_dimensions[get_column_letter(index)].width = (
+                length + COLUMN_WIDTH_PADDING
+            )
+
+
+def styled_row(
+    ws: WriteOnlyWorksheet,
+    values: Iterable[Any],
+    fill: PatternFill,
+    font: Font | None = None,
+    border: Border | None = None,
+) -> List[WriteOnlyCell]:
+    """Подготовить строку оформленных ячеек для write-only листа."""
+    row = []
+    for value in values:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.fill = fill
+        if font is not None:
+            cell.font = font
+            cell.alignment = ALIGNMENT_CENTER
+        if border is not None:
+            cell.border = border
+        row.append(cell)
+    return row
+
+
 def get_fields_and_headers(queryset, excluded_fields, fields_order):
     model_fields = queryset.model._meta.fields
     fields_dict = {
@@ -122,51 +235,65 @@ def get_fields_and_headers(queryset, excluded_fields, fields_order):
     return headers, fields
 
 
-def add_data_to_worksheet(ws, queryset, fields):
-    for obj in queryset:
-        row: List[Any] = []
-        for field in fields:
-            value = getattr(obj, field)
-            if isinstance(value, datetime):
-                value = value.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                if hasattr(value, "__str__"):
-                    value = value.__str__()
-
-            if isinstance(obj, Player):
-                field_map = {
-                    "is_captain": "да" if obj.is_captain else "",
-                    "is_assistent": "да" if obj.is_assistent else "",
-                }
-                if field in field_map:
-                    value = field_map[field]
-
-            row.append(value)
-
-        ws.append(row)
-
-
-def apply_styles(ws):
-    column_width(ws)
-
-    ws.row_dimensions[1].height = TITLE_HEIGHT
-    ws.row_dimensions[2].height = HEADERS_HEIGHT
+def get_related_labels(queryset: QuerySet, field: Field) -> dict[Any, str]:
+    """
+    Строковые представления связанных объектов для поля ForeignKey.
 
-    for cell in ws[1]:
-        cell.fill = TITLE_FILL
-        cell.font = TITLE_FONT
-        cell.alignment = ALIGNMENT_CENTER
+    Загружаются одним запросом только те объекты, на которые ссылаются
+    выгружаемые записи.
+    """
+    related_ids = queryset.order_by().values(field.attname)
+    related = (
+        field.related_model._default_manager.filter(pk__in=related_ids)
+        .select_related()
+        .order_by()
+    )
+    return {
+        obj.pk: str(obj)
+        for obj in related.iterator(chunk_size=ExportConstants.CHUNK_SIZE)
+    }
 
-    for cell in ws[2]:
-        cell.fill = HEADERS_FILL
-        cell.font = HEADERS_FONT
-        cell.alignment = ALIGNMENT_CENTER
-        cell.border = HEADERS_BORDER
 
-    number_rows = int(ws.dimensions.split(":")[1][1:])
-    for i in range(3, number_rows + 1, 2):
-        for cell in ws[i]:
-            cell.fill = ROWS_FILL
+def get_value_converters(
+    queryset: QuerySet,
+    fields: List[str],
+) -> List[Callable[[Any], str]]:
+    """Функции преобразования значений полей в текст ячеек."""
+    model = queryset.model
+    converters: List[Callable[[Any], str]] = []
+    for name in fields:
+        field = model._meta.get_field(name)
+        if field.is_relation:
+            labels = get_related_labels(queryset, field)
+            converters.append(
+                lambda value, labels=labels: str(labels.get(value)),
+            )
+        elif issubclass(model, Player) and name in PLAYER_FLAG_FIELDS:
+            converters.append(lambda value: "да" if value else "")
+        else:
+            converters.append(format_export_value)
+    return converters
+
+
+def format_export_value(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value)
+
+
+def iter_export_rows(
+    queryset: QuerySet,
+    fields: List[str],
+    chunk_size: int = ExportConstants.CHUNK_SIZE,
+) -> Iterator[List[str]]:
+    """Построчно отдает данные выгрузки, читая БД порциями."""
+    converters = get_value_converters(queryset, fields)
+    values = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+    for values_row in values:
+        yield [
+            convert(value)
+            for convert, value in zip(converters, values_row, strict=True)
+        ]
 
 
 def save_workbook(wb, filename):
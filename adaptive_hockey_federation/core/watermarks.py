@@ -0,0 +1,206 @@
+import hashlib
+from datetime import datetime
+from functools import wraps
+from typing import Iterable
+
+from core.models import ChangeWatermark
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.contrib import messages
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import F, Model
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+WATERMARK_APPS = frozenset(("main", "competitions", "users"))
+
+
+def is_watched(model: type[Model]) -> bool:
+    """
+    Ведутся ли отметки изменений модели.
+
+    Исторические модели из миграций не учитываются: таблица отметок в
+    этот момент может быть еще не создана.
+    """
+    return (
+        model._meta.apps is global_apps
+        and model._meta.app_label in WATERMARK_APPS
+    )
+
+
+def get_labels(models: Iterable[type[Model]]) -> list[str]:
+    """Метки моделей для отметок изменений."""
+    return sorted({model._meta.label_lower for model in models})
+
+
+def touch_watermarks(
+    models: Iterable[type[Model]],
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """Увеличить версии моделей после изменения их данных."""
+    labels = get_labels(models)
+    now = timezone.now()
+    watermarks = ChangeWatermark.objects.using(using)
+    updated = watermarks.filter(model__in=labels).update(
+        version=F("version") + 1,
+        changed_at=now,
+    )
+    if updated < len(labels):
+        watermarks.bulk_create(
+            [ChangeWatermark(model=label, changed_at=now) for label in labels],
+            ignore_conflicts=True,
+        )
+
+
+def get_watermark(
+    models: Iterable[type[Model]],
+) -> tuple[str, datetime | None]:
+    """
+    Общая отметка изменений набора моделей.
+
+    Возвращает строку с версиями всех моделей и время последнего
+    изменения любой из них (None, если модели еще не менялись). Один
+    запрос к БД.
+    """
+    labels = get_labels(models)
+    rows = {
+        model: (version, changed_at)
+        for model, version, changed_at in ChangeWatermark.objects.filter(
+            model__in=labels,
+        ).values_list("model", "version", "changed_at")
+    }
+    versions = ";".join(
+        f"{label}:{rows.get(label, (0, None))[0]}" for label in labels
+    )
+    changes = [changed_at for _, changed_at in rows.values()]
+    return versions, max(changes, default=None)
+
+
+def get_access_fingerprint(user) -> str:
+    """
+    Отпечаток прав пользователя.
+
+    Роль, флаги и все права (в том числе через группы) определяют,
+    какие кнопки и ссылки выводятся на странице. Суперпользователю
+    доступно все, его права из БД не читаются.
+    """
+    if not user.is_authenticated:
+        return ""
+    permissions = () if user.is_superuser else user.get_all_permissions()
+    return ";".join(
+        (
+            str(getattr(user, "role", "")),
+            str(user.is_active),
+            str(user.is_staff),
+            str(user.is_superuser),
+            *sorted(permissions),
+        ),
+    )
+
+
+def get_etag(request, versions: str, extra: str = "") -> str:
+    """
+    ETag ответа по версиям моделей.
+
+    Учитывает пользователя, его сессию и CSRF-токен (страницы содержат
+    формы с токеном, который меняется при входе), права пользователя и
+    полный адрес запроса (фильтры, страницу), а также
+    WATERMARK_ETAG_SALT, который меняют при обновлении шаблонов.
+    extra - прочие данные, от которых зависит ответ.
+    """
+    session = getattr(request, "session", None)
+    source = ":".join(
+        (
+            settings.WATERMARK_ETAG_SALT,
+            str(request.user.pk),
+            str(session and session.session_key),
+            request.META.get("CSRF_COOKIE", ""),
+            get_access_fingerprint(request.user),
+            request.get_full_path(),
+            versions,
+            extra,
+        ),
+    )
+    digest = hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()
+    return quote_etag(digest)
+
+
+def conditional_get(
+    request,
+    models: Iterable[type[Model]],
+    get_response,
+    extra: str = "",
+):
+    """
+    Ответ на GET-запрос с проверкой If-None-Match/If-Modified-Since.
+
+    Если данные моделей не менялись, возвращает 304 без вызова
+    get_response. Страницы с непоказанными сообщениями отдаются всегда.
+    """
+    if request.method not in ("GET", "HEAD") or len(
+        messages.get_messages(request),
+    ):
+        return get_response()
+    versions, last_modified = get_watermark(models)
+    etag = get_etag(request, versions, extra)
+    timestamp = last_modified and int(last_modified.timestamp())
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=timestamp,
+    )
+    if response is None:
+        response = get_response()
+        if response.status_code != 200:
+            return response
+    response.headers.setdefault("ETag", etag)
+    if timestamp:
+        response.headers.setdefault("Last-Modified", http_date(timestamp))
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def condition_on(*models: type[Model]):
+    """Декоратор функции-представления: 304, пока модели не менялись."""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            return conditional_get(
+                request,
+                models,
+                lambda: view(request, *args, **kwargs),
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class ConditionalGetMixin:
+    """
+    Миксин представления с ETag/Last-Modified по отметкам изменений.
+
+    watermark_models - модели, данные которых выводятся на странице.
+    Указывается в базовых классах после миксинов проверки доступа.
+    """
+
+    watermark_models: tuple[type[Model], ...] = ()
+
+    def get_watermark_extra(self) -> str:
+        """Данные помимо моделей, от которых зависит страница."""
+        return ""
+
+    def get(self, request, *args, **kwargs):
+        """Обработать GET-запрос с учетом условных заголовков."""
+        return conditional_get(
+            request,
+            self.watermark_models,
+            lambda: super(ConditionalGetMixin, self).get(
+                request,
+                *args,
+                **kwargs,
+            ),
+            self.get_watermark_extra(),
+        )
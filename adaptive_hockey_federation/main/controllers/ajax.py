@@ -1,11 +1,18 @@
+from core.cache import dictionary_cache
+from core.constants import TypeaheadConstants
+from core.search import typeahead_queryset
+from core.watermarks import condition_on
+from django.contrib.auth.decorators import login_required
+from django.db.models import QuerySet
 from django.http import JsonResponse
 
-from main.models import DisciplineLevel, DisciplineName
+from main.models import City, Diagnosis, DisciplineLevel, DisciplineName, Team
 
 
+@condition_on(DisciplineLevel)
 def load_discipline_levels(request):
     """
-    Представление для получения списка уровней дисциплин по ID дисциплины.
+    Представление для получения списка уровней дисциплин по ID дисциплины.
 
     Используется в формах создания/редактирования данных игрока.
     """
@@ -18,12 +25,89 @@ def load_discipline_levels(request):
         return JsonResponse([], safe=False)
     else:
         return JsonResponse(
-            list(discipline_statuses.values("id", "name")),
+            dictionary_cache.get_or_set(
+                DisciplineLevel,
+                f"levels:{discipline_level_id}",
+                lambda: list(discipline_statuses.values("id", "name")),
+            ),
             safe=False,
         )
 
 
+@condition_on(DisciplineName)
 def filter_discipline_search(request):
     """Представления для поиска, получения списка дисциплин."""
     disciplines = DisciplineName.objects.all().values("name")
-    return JsonResponse(list(disciplines), safe=False)
+    return JsonResponse(
+        dictionary_cache.get_or_set(
+            DisciplineName,
+            "names",
+            lambda: list(disciplines),
+        ),
+        safe=False,
+    )
+
+
+def get_page_number(request) -> int:
+    """Номер запрошенной страницы автодополнения, начиная с 1."""
+    try:
+        return max(int(request.GET.get("page", 1)), 1)
+    except ValueError:
+        return 1
+
+
+def typeahead_response(request, queryset: QuerySet) -> JsonResponse:
+    """
+    Страница вариантов автодополнения.
+
+    Параметры запроса: q - введенный текст, page - номер страницы.
+    Ответ: {"results": [{"id": ..., "name": ...}], "more": bool}, где
+    more означает, что есть следующая страница.
+    """
+    size = TypeaheadConstants.PAGE_SIZE
+    offset = (get_page_number(request) - 1) * size
+    term = request.GET.get("q", "").strip()
+    queryset = typeahead_queryset(queryset, term)
+    items = list(queryset[offset : offset + size + 1])
+    return JsonResponse(
+        {
+            "results": [
+                {"id": item.pk, "name": str(item)} for item in items[:size]
+            ],
+            "more": len(items) > size,
+        },
+    )
+
+
+@login_required
+def typeahead_diagnoses(request):
+    """Автодополнение диагноза в формах игрока."""
+    return typeahead_response(request, Diagnosis.objects.only("id", "name"))
+
+
+@login_required
+def typeahead_cities(request):
+    """Автодополнение города в формах команд и соревнований."""
+    return typeahead_response(request, City.objects.only("id", "name"))
+
+
+@login_required
+def typeahead_teams(request):
+    """
+    Автодополнение команды в формах игрока и сотрудника команды.
+
+    Параметр exclude - идентификаторы уже выбранных команд через запятую.
+    """
+    queryset = Team.objects.select_related("city").only(
+        "id",
+        "name",
+        "city__name",
+    )
+    exclude = [
+        int(pk)
+        for pk in request.GET.get("exclude", "").split(",")
+        if pk.isdigit()
+    ]
+    if exclude:
+        queryset = queryset.exclude(pk__in=exclude)
+    return typeahead_response(request, queryset)
@@ -1,5 +1,6 @@
+from core.search import order_by_rank, search_queryset
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.contrib.postgres.search import SearchVector
+from django.db.models import Q
 from django.views.generic.list import ListView
 from main.models import Player
 from main.schemas.main_schema import get_main_table_data
@@ -29,16 +30,18 @@ class MainView(
     def get_queryset(self):
         """Получить набор QuerySet."""
         query = self.request.GET.get("search")
-        search_vector = SearchVector("surname", "name")
         queryset = None
         if query:
-            queryset = Player.objects.annotate(search=search_vector).filter(
-                search=query,
-            )
-            queryset = (
-                queryset.select_related("diagnosis")
-                .select_related("discipline_name")
-                .order_by("surname")
+            queryset = search_queryset(Player.objects.all(), query)
+            if queryset is None:
+                queryset = Player.objects.filter(
+                    Q(surname__icontains=query) | Q(name__icontains=query),
+                )
+            queryset = order_by_rank(
+                queryset.select_related("diagnosis").select_related(
+                    "discipline_name",
+                ),
+                "surname",
             )
 
         return queryset
@@ -1,5 +1,8 @@
 from core.constants import FileConstants
 from core.utils import is_uploaded_file_valid
+from core.pagination import KeysetPaginationMixin
+from core.search import order_by_rank
+from core.watermarks import ConditionalGetMixin
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
@@ -9,16 +12,22 @@ from django.urls import reverse, reverse_lazy
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from django.views.generic.list import ListView
-from main.controllers.mixins import DiagnosisListMixin
 from main.controllers.utils import errormessage
 from main.forms import PlayerForm, PlayerUpdateForm
 from main.mixins import FileUploadMixin
-from main.models import Player
+from main.models import (
+    Diagnosis,
+    DisciplineLevel,
+    DisciplineName,
+    Player,
+    Team,
+)
 from main.permissions import PlayerIdPermissionsMixin
 from main.schemas.player_schema import (
     get_player_fields,
     get_player_fields_personal,
     get_player_table_data,
+    get_players_list_queryset,
 )
 from unloads.utils import model_get_queryset
 
@@ -26,11 +35,20 @@ from unloads.utils import model_get_queryset
 class PlayersListView(
     LoginRequiredMixin,
     PermissionRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
     ListView,
 ):
     """Представление для работы со списком игроков."""
 
     model = Player
+    watermark_models = (
+        Player,
+        Team,
+        Diagnosis,
+        DisciplineName,
+        DisciplineLevel,
+    )
     template_name = "main/players/players.html"
     permission_required = "main.list_view_player"
     permission_denied_message = (
@@ -38,6 +56,7 @@ class PlayersListView(
     )
     context_object_name = "players"
     paginate_by = 10
+    keyset_ordering = ("surname",)
     fields = [
         "id",
         "surname",
@@ -63,11 +82,7 @@ class PlayersListView(
                 queryset,
             )
 
-        return (
-            queryset.select_related("diagnosis")
-            .select_related("discipline_name")
-            .order_by("surname")
-        )
+        return order_by_rank(get_players_list_queryset(queryset), "surname")
 
     def get_context_data(self, *, object_list=None, **kwargs):
         """Получить словарь context для шаблона страницы."""
@@ -85,7 +100,6 @@ class PlayerIDCreateView(
     LoginRequiredMixin,
     PlayerIdPermissionsMixin,
     CreateView,
-    DiagnosisListMixin,
     FileUploadMixin,
 ):
     """Представление для создания нового игрока."""
@@ -130,7 +144,6 @@ class PlayerIDCreateView(
         if self.team_id is not None:
             context["team_id"] = self.team_id
         context["page_title"] = "Создание профиля нового игрока"
-        context["diagnosis"] = self.get_diagnosis()
         context["file_resolution"] = ", ".join(
             ["." + res for res in FileConstants.FILE_RESOLUTION],
         )
@@ -196,13 +209,20 @@ class PlayerIdView(
 
     def get_object(self, queryset=None):
         """Получить объект по id или выбросить ошибку 404."""
-        return get_object_or_404(Player, id=self.kwargs["pk"])
+        return get_object_or_404(
+            Player.objects.select_related(
+                "diagnosis__nosology",
+                "discipline_name",
+                "discipline_level",
+            ).prefetch_related("team"),
+            id=self.kwargs["pk"],
+        )
 
     def get_context_data(self, **kwargs):
         """Получить словарь context для шаблона страницы."""
         context = super().get_context_data(**kwargs)
         player = context["player"]
-        player_documents = self.get_object().player_documemts.all()
+        player_documents = player.player_documemts.all()
         context["player_fields_personal"] = get_player_fields_personal(player)
         context["player_fields"] = get_player_fields(player)
         context["player_documents"] = player_documents
@@ -213,7 +233,6 @@ class PlayerIDEditView(
     LoginRequiredMixin,
     FileUploadMixin,
     PlayerIdPermissionsMixin,
-    DiagnosisListMixin,
     UpdateView,
 ):
     """Представление для обновления игрока."""
@@ -252,7 +271,6 @@ class PlayerIDEditView(
         player_documents = self.get_object().player_documemts.all()
         context["page_title"] = "Редактирование профиля игрока"
         context["player_documents"] = player_documents
-        context["diagnosis"] = self.get_diagnosis()
         context["file_resolution"] = ", ".join(
             ["." + res for res in FileConstants.FILE_RESOLUTION],
         )
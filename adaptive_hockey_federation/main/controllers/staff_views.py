@@ -1,3 +1,5 @@
+from core.search import order_by_rank, search_queryset
+from core.watermarks import ConditionalGetMixin
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
@@ -25,11 +27,13 @@ from main.schemas.staff_schema import (
 class StaffMemberListView(
     LoginRequiredMixin,
     PermissionRequiredMixin,
+    ConditionalGetMixin,
     ListView,
 ):
     """Представление для работы со списком сотрудников."""
 
     model = StaffMember
+    watermark_models = (StaffMember,)
     template_name = "main/staffs/staffs.html"
     permission_required = "main.list_view_staff"
     permission_denied_message = (
@@ -52,6 +56,14 @@ class StaffMemberListView(
         if search:
             search_column = self.request.GET.get("search_column")
             if not search_column or search_column.lower() in ["все", "all"]:
+                found = search_queryset(queryset, search)
+                if found is not None:
+                    return order_by_rank(
+                        found,
+                        "surname",
+                        "name",
+                        "patronymic",
+                    )
                 or_lookup = (
                     Q(surname__icontains=search)
                     | Q(name__icontains=search)
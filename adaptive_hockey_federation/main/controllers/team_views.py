@@ -1,4 +1,6 @@
 from core.constants import StaffPosition
+from core.pagination import KeysetPaginationMixin
+from core.watermarks import ConditionalGetMixin
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
@@ -11,7 +13,13 @@ from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from django.views.generic.list import ListView
 from main.forms import StaffTeamMemberAddToTeamForm, TeamFilterForm, TeamForm
-from main.models import City, Player, StaffTeamMember, Team
+from main.models import (
+    City,
+    DisciplineName,
+    Player,
+    StaffTeamMember,
+    Team,
+)
 from main.permissions import CustomPermissionMixin, TeamEditPermissionsMixin
 from main.schemas.team_schema import (
     TEAM_TABLE_HEAD,
@@ -20,6 +28,7 @@ from main.schemas.team_schema import (
     get_team_table_data,
 )
 from unloads.utils import model_get_queryset
+from users.models import User
 
 
 class StaffTeamMemberListMixin:
@@ -180,11 +189,14 @@ class TeamIdView(
 class TeamListView(
     LoginRequiredMixin,
     PermissionRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
     ListView,
 ):
     """Список спортивных команд."""
 
     model = Team
+    watermark_models = (Team, City, DisciplineName, User)
     template_name = "main/teams/teams.html"
     permission_required = "main.list_view_team"
     permission_denied_message = (
@@ -193,6 +205,7 @@ class TeamListView(
     context_object_name = "teams"
     paginate_by = 10
     ordering = ["name"]
+    keyset_ordering = ("name",)
 
     def get_queryset(self):
         """Получить набор QuerySet."""
@@ -215,20 +228,10 @@ class TeamListView(
         return context
 
 
-class CityListMixin:
-    """Миксин для использования в видах редактирования и создания команд."""
-
-    @staticmethod
-    def get_cities():
-        """Возвращает список имен всех городов из БД."""
-        return City.objects.values_list("name", flat=True)
-
-
 class UpdateTeamView(
     LoginRequiredMixin,
     TeamEditPermissionsMixin,
     UpdateView,
-    CityListMixin,
 ):
     """Вид с формой изменения основных данных спортивной команды."""
 
@@ -256,7 +259,6 @@ class UpdateTeamView(
     def get_context_data(self, **kwargs):
         """Получить словарь context для шаблона страницы."""
         context = super(UpdateTeamView, self).get_context_data(**kwargs)
-        context["cities"] = self.get_cities()
         context["page_title"] = "Редактирование данных команды"
         return context
 
@@ -280,7 +282,6 @@ class CreateTeamView(
     LoginRequiredMixin,
     PermissionRequiredMixin,
     CreateView,
-    CityListMixin,
 ):
     """Вид с формой создания новой спортивной команды."""
 
@@ -299,7 +300,6 @@ class CreateTeamView(
     def get_context_data(self, **kwargs):
         """Получить словарь context для шаблона страницы."""
         context = super(CreateTeamView, self).get_context_data(**kwargs)
-        context["cities"] = self.get_cities()
         context["page_title"] = "Создание команды"
         return context
 
@@ -0,0 +1,360 @@
+import random
+from collections import defaultdict
+from datetime import date, timedelta
+
+import factory.random
+from competitions.models import Competition
+from core.constants import STAFF_POSITION_CHOICES, ScaleConstants
+from django.db import transaction
+from faker import Faker
+from main.models import (
+    City,
+    Diagnosis,
+    DisciplineLevel,
+    DisciplineName,
+    Document,
+    Nosology,
+    Player,
+    StaffMember,
+    StaffTeamMember,
+    Team,
+)
+from users.models import User
+
+from .factories import (
+    CityFactory,
+    CompetitionFactory,
+    PlayerFactory,
+    StaffMemberFactory,
+    StaffTeamMemberFactory,
+    TeamFactory,
+)
+
+COMPETITION_TEAMS = 8
+COMPETITION_DISCIPLINES = 4
+
+fake = Faker(locale="ru_RU")
+
+
+class MassDataGenerator:
+    """
+    Генерация больших наборов тестовых данных.
+
+    Объекты строятся фабриками без сохранения (factory.build) и
+    записываются пачками через bulk_create. Внешние ключи выбираются из
+    заранее загруженных пулов id, а не запросом на каждый объект. При
+    одинаковом seed и исходной БД результат повторяется (даты рождения
+    и добавления отсчитываются от текущего дня, как в фабриках).
+    """
+
+    def __init__(self, seed: int, batch_size: int = ScaleConstants.BATCH_SIZE):
+        """Инициализация генераторов случайных чисел фабрик и пулов."""
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        random.seed(seed)
+        factory.random.reseed_random(seed)
+
+    def sample(self, pool: list, size: int) -> list:
+        """Случайные неповторяющиеся элементы пула."""
+        return self.random.sample(pool, min(size, len(pool)))
+
+    def generate(self, scale: int) -> dict[str, int]:
+        """
+        Сгенерировать данные для масштаба scale.
+
+        Единица масштаба - ScaleConstants.PLAYERS игроков, TEAMS команд
+        и т.д. Возвращает количество созданных записей по моделям.
+        """
+        with transaction.atomic():
+            cities = self.create_cities(scale * ScaleConstants.CITIES)
+            diagnoses = self.create_diagnoses(
+                scale * ScaleConstants.DIAGNOSES,
+            )
+            teams = self.create_teams(scale * ScaleConstants.TEAMS, cities)
+            staff = self.create_staff(scale * ScaleConstants.STAFF, teams)
+            players = self.create_players(
+                scale * ScaleConstants.PLAYERS,
+                teams,
+                diagnoses,
+            )
+            documents = self.create_documents(
+                scale * ScaleConstants.DOCUMENTS,
+                players,
+            )
+            competitions = self.create_competitions(
+                scale * ScaleConstants.COMPETITIONS,
+                cities,
+                teams,
+            )
+        return {
+            City._meta.verbose_name_plural: len(cities),
+            Diagnosis._meta.verbose_name_plural: len(diagnoses),
+            Team._meta.verbose_name_plural: len(teams),
+            StaffTeamMember._meta.verbose_name_plural: staff,
+            Player._meta.verbose_name_plural: len(players),
+            Document._meta.verbose_name_plural: documents,
+            Competition._meta.verbose_name_plural: competitions,
+        }
+
+    def create_cities(self, amount: int) -> list[int]:
+        """Города с уникальными названиями. Возвращает id всех городов."""
+        names = set(City.objects.values_list("name", flat=True))
+        cities = []
+        for index in range(amount):
+            name = CityFactory.build().name
+            if name in names:
+                name = f"{name} {index}"
+            names.add(name)
+            cities.append(City(name=name))
+        City.objects.bulk_create(cities, batch_size=self.batch_size)
+        return list(City.objects.order_by("pk").values_list("pk", flat=True))
+
+    def create_diagnoses(self, amount: int) -> list[int]:
+        """Нозологии и диагнозы. Возвращает id всех диагнозов."""
+        if Diagnosis.objects.count() >= amount:
+            return list(
+                Diagnosis.objects.order_by("pk").values_list("pk", flat=True),
+            )
+        start = Diagnosis.objects.count()
+        amount -= start
+        Nosology.objects.bulk_create(
+            (
+                Nosology(name=f"{fake.sentence(nb_words=3)} {start + index}")
+                for index in range(max(amount // 4, 1))
+            ),
+            ignore_conflicts=True,
+        )
+        nosologies = list(Nosology.objects.order_by("pk"))
+        Diagnosis.objects.bulk_create(
+            (
+                Diagnosis(
+                    name=f"{fake.sentence(nb_words=4)} {start + index}",
+                    nosology=self.random.choice(nosologies),
+                )
+                for index in range(amount)
+            ),
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        return list(
+            Diagnosis.objects.order_by("pk").values_list("pk", flat=True),
+        )
+
+    def create_teams(self, amount: int, cities: list[int]) -> list[Team]:
+        """Команды с кураторами из существующих пользователей."""
+        disciplines = list(
+            DisciplineName.objects.order_by("pk").values_list("pk", flat=True),
+        )
+        curators = list(
+            User.objects.order_by("pk").values_list("pk", flat=True),
+        ) or [None]
+        start = Team.objects.count()
+        teams = []
+        for index in range(amount):
+            team = TeamFactory.build(
+                city=None,
+                discipline_name=None,
+                curator=None,
+            )
+            team.name = f"{team.name.rstrip('.')} {start + index}"
+            team.city_id = self.random.choice(cities)
+            team.discipline_name_id = self.random.choice(disciplines)
+            team.curator_id = self.random.choice(curators)
+            teams.append(team)
+        return Team.objects.bulk_create(teams, batch_size=self.batch_size)
+
+    def build_people(
+        self,
+        person_factory,
+        amount: int,
+        keys: set,
+        **kwargs,
+    ) -> list:
+        """
+        Объекты фабрики с уникальными ФИО (и датой рождения у игроков).
+
+        keys - уже занятые сочетания, дополняется новыми.
+        """
+        people = []
+        while len(people) < amount:
+            person = person_factory.build(**kwargs)
+            key = (
+                person.surname,
+                person.name,
+                person.patronymic,
+                getattr(person, "birthday", None),
+            )
+            if key not in keys:
+                keys.add(key)
+                people.append(person)
+        return people
+
+    def create_staff(self, amount: int, teams: list[Team]) -> int:
+        """Сотрудники команд, каждый привязан к одной команде."""
+        keys = {
+            (*key, None)
+            for key in StaffMember.objects.values_list(
+                "surname",
+                "name",
+                "patronymic",
+            )
+        }
+        members = StaffMember.objects.bulk_create(
+            self.build_people(StaffMemberFactory, amount, keys),
+            batch_size=self.batch_size,
+        )
+        positions = [position for position, _ in STAFF_POSITION_CHOICES]
+        staff = StaffTeamMember.objects.bulk_create(
+            (
+                StaffTeamMemberFactory.build(
+                    staff_member=member,
+                    staff_position=self.random.choice(positions),
+                )
+                for member in members
+            ),
+            batch_size=self.batch_size,
+        )
+        StaffTeamMember.team.through.objects.bulk_create(
+            (
+                StaffTeamMember.team.through(
+                    staffteammember_id=member.pk,
+                    team_id=self.random.choice(teams).pk,
+                )
+                for member in staff
+            ),
+            batch_size=self.batch_size,
+        )
+        return len(staff)
+
+    def create_players(
+        self,
+        amount: int,
+        teams: list[Team],
+        diagnoses: list[int],
+    ) -> list[Player]:
+        """
+        Игроки, распределенные по командам.
+
+        Дисциплина игрока совпадает с дисциплиной команды, в каждой
+        команде первый игрок - капитан, второй - ассистент.
+        """
+        levels = defaultdict(list)
+        for pk, discipline_name_id in DisciplineLevel.objects.order_by(
+            "pk",
+        ).values_list("pk", "discipline_name_id"):
+            levels[discipline_name_id].append(pk)
+        keys = set(
+            Player.objects.values_list(
+                "surname",
+                "name",
+                "patronymic",
+                "birthday",
+            ),
+        )
+        players = self.build_people(
+            PlayerFactory,
+            amount,
+            keys,
+            diagnosis=None,
+            discipline_name=None,
+        )
+        player_teams = [self.random.choice(teams) for _ in players]
+        team_sizes: dict[int, int] = defaultdict(int)
+        for player, team in zip(players, player_teams, strict=True):
+            player.diagnosis_id = self.random.choice(diagnoses)
+            player.discipline_name_id = team.discipline_name_id
+            team_levels = levels[team.discipline_name_id]
+            player.discipline_level_id = (
+                self.random.choice(team_levels) if team_levels else None
+            )
+            player.is_captain = team_sizes[team.pk] == 0
+            player.is_assistent = team_sizes[team.pk] == 1
+            team_sizes[team.pk] += 1
+        players = Player.objects.bulk_create(
+            players,
+            batch_size=self.batch_size,
+        )
+        Player.team.through.objects.bulk_create(
+            (
+                Player.team.through(player_id=player.pk, team_id=team.pk)
+                for player, team in zip(players, player_teams, strict=True)
+            ),
+            batch_size=self.batch_size,
+        )
+        return players
+
+    def create_documents(self, amount: int, players: list[Player]) -> int:
+        """
+        Документы игроков.
+
+        Сохраняются только записи с уникальными путями файлов, сами
+        файлы не создаются.
+        """
+        documents = []
+        for index in range(amount):
+            player = players[index % len(players)]
+            name = f"{player.surname}-{self.random.randint(1000, 9999)}"
+            documents.append(
+                Document(
+                    name=name,
+                    player=player,
+                    file=f"players_documents/load-{player.pk}-{index}.png",
+                ),
+            )
+        Document.objects.bulk_create(documents, batch_size=self.batch_size)
+        return len(documents)
+
+    def create_competitions(
+        self,
+        amount: int,
+        cities: list[int],
+        teams: list[Team],
+    ) -> int:
+        """Соревнования с командами-участниками и дисциплинами."""
+        disciplines = list(
+            DisciplineName.objects.order_by("pk").values_list("pk", flat=True),
+        )
+        competitions = []
+        for _ in range(amount):
+            competition = CompetitionFactory.build(city=None)
+            competition.city_id = self.random.choice(cities)
+            competition.date_start = date.today() + timedelta(
+                days=self.random.randrange(-365, 365),
+            )
+            competition.date_end = competition.date_start + timedelta(
+                days=self.random.randrange(2, 10, 2),
+            )
+            competitions.append(competition)
+        competitions = Competition.objects.bulk_create(
+            competitions,
+            batch_size=self.batch_size,
+        )
+        team_links = []
+        discipline_links = []
+        for competition in competitions:
+            team_links.extend(
+                Competition.teams.through(
+                    competition_id=competition.pk,
+                    team_id=team.pk,
+                )
+                for team in self.sample(teams, COMPETITION_TEAMS)
+            )
+            discipline_links.extend(
+                Competition.disciplines.through(
+                    competition_id=competition.pk,
+                    disciplinename_id=discipline,
+                )
+                for discipline in self.sample(
+                    disciplines,
+                    COMPETITION_DISCIPLINES,
+                )
+            )
+        Competition.teams.through.objects.bulk_create(
+            team_links,
+            batch_size=self.batch_size,
+        )
+        Competition.disciplines.through.objects.bulk_create(
+            discipline_links,
+            batch_size=self.batch_size,
+        )
+        return len(competitions)
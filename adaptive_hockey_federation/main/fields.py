@@ -6,9 +6,11 @@ from django.forms import (
     ModelChoiceField,
     ModelMultipleChoiceField,
     MultipleChoiceField,
+    SelectMultiple,
     TextInput,
 )
 from django.shortcuts import get_object_or_404
+from django.urls import reverse_lazy
 
 from main.models import City, Diagnosis, StaffTeamMember, Team
 
@@ -39,6 +41,24 @@ class CustomModelMultipleChoiceField(ModelMultipleChoiceField):
         return qs
 
 
+class TeamTypeaheadSelect(SelectMultiple):
+    """
+    Список доступных команд, заполняемый автодополнением.
+
+    Варианты не выводятся при отрисовке формы: страница загружает их
+    порциями из typeahead_teams по мере ввода и прокрутки.
+    """
+
+    def __init__(self, attrs=None):
+        """Добавляет адрес автодополнения команд в атрибуты виджета."""
+        super().__init__(
+            attrs={
+                "data-typeahead": reverse_lazy("main:ajax_typeahead_teams"),
+                **(attrs or {}),
+            },
+        )
+
+
 class CustomDiagnosisChoiceField(ModelChoiceField):
     """Самодельное поле для ввода диагноза."""
 
@@ -55,6 +75,10 @@ class CustomDiagnosisChoiceField(ModelChoiceField):
                 attrs={
                     "list": "diagnosis",
                     "placeholder": "Введите название диагноза",
+                    "autocomplete": "off",
+                    "data-typeahead": reverse_lazy(
+                        "main:ajax_typeahead_diagnoses",
+                    ),
                 },
             ),
             error_messages={
@@ -91,6 +115,10 @@ class CityChoiceField(ModelChoiceField):
                 attrs={
                     "list": "cities",
                     "placeholder": "Введите или выберите название города",
+                    "autocomplete": "off",
+                    "data-typeahead": reverse_lazy(
+                        "main:ajax_typeahead_cities",
+                    ),
                 },
             ),
             required=True,
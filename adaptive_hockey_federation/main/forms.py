@@ -4,7 +4,6 @@ from django import forms
 from django.core.exceptions import ValidationError
 from django.forms import (
     ModelChoiceField,
-    ModelMultipleChoiceField,
     Select,
     TextInput,
 )
@@ -17,6 +16,7 @@ from main.fields import (
     CustomModelMultipleChoiceField,
     CustomMultipleChoiceField,
     StaffTeamMemberChoiceField,
+    TeamTypeaheadSelect,
 )
 from main.models import (
     City,
@@ -53,7 +53,8 @@ class PlayerForm(forms.ModelForm):
         label="Команды",
     )
     available_teams = CustomModelMultipleChoiceField(
-        queryset=None,
+        queryset=Team.objects.none(),
+        widget=TeamTypeaheadSelect(),
         required=False,
         help_text=FORM_HELP_TEXTS["available_teams"],
         label="Команды",
@@ -115,9 +116,6 @@ class PlayerForm(forms.ModelForm):
         """Инициализация формы для игрока."""
         super().__init__(*args, **kwargs)
         self.fields["team"].queryset = Team.objects.none()
-        self.fields[
-            "available_teams"
-        ].queryset = Team.objects.all().prefetch_related("city")
 
     def save(self, commit=True):
         """Метод создает и сохраняет объект игрока в базе данных."""
@@ -164,13 +162,12 @@ class PlayerUpdateForm(PlayerForm):
         """
         Метод инициализации экземпляра класса.
 
-        Расширяет team и available_teams кастомными полями выбора.
+        Заполняет team текущими командами игрока, доступные команды
+        загружаются автодополнением.
         """
         super(PlayerUpdateForm, self).__init__(*args, **kwargs)
-        queryset = self.instance.team.all().prefetch_related("city")
-        self.fields["team"].queryset = queryset
-        self.fields["available_teams"].queryset = (
-            Team.objects.all().prefetch_related("city").difference(queryset)
+        self.fields["team"].queryset = self.instance.team.select_related(
+            "city",
         )
         self.fields["nosology"].initial = self.instance.diagnosis.nosology
         self.fields["diagnosis"].initial = self.instance.diagnosis
@@ -333,8 +330,9 @@ class StaffTeamMemberTeamForm(forms.ModelForm):
 class StaffTeamMemberForm(forms.ModelForm):
     """Форма для сотрудников команд."""
 
-    available_teams = ModelMultipleChoiceField(
-        queryset=Team.objects.all().order_by("name"),
+    available_teams = CustomModelMultipleChoiceField(
+        queryset=Team.objects.none(),
+        widget=TeamTypeaheadSelect(),
         required=False,
         help_text=FORM_HELP_TEXTS["available_teams"],
         label="Команды",
@@ -366,7 +364,8 @@ class StaffTeamMemberEditForm(StaffTeamMemberForm):
         """
         Метод инициализации экземпляра класса.
 
-        Расширяет team и available_teams кастомными полями выбора.
+        Расширяет team кастомным полем выбора с текущими командами,
+        доступные команды загружаются автодополнением.
         """
         super(StaffTeamMemberForm, self).__init__(*args, **kwargs)
         if queryset := self.instance.team.all():
@@ -376,13 +375,6 @@ class StaffTeamMemberEditForm(StaffTeamMemberForm):
                 help_text=FORM_HELP_TEXTS["staff_teams"],
                 label="Команды",
             )
-        queryset_available = Team.objects.all().difference(queryset)
-        self.fields["available_teams"] = CustomModelMultipleChoiceField(
-            queryset=queryset_available,
-            required=False,
-            help_text=FORM_HELP_TEXTS["available_teams"],
-            label="Команды",
-        )
 
 
 class StaffMemberForm(forms.ModelForm):
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.13 on 2026-10-18 09:41
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_INDEXES = {
+    'main_player': 'main_player_search_gin',
+    'main_staffmember': 'main_staffmember_search_gin',
+    'main_team': 'main_team_search_gin',
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, index in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index} '
+            f'ON {table} USING gin (search_vector)',
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index in SEARCH_INDEXES.values():
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_delete_gamedataplayer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='player',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Индекс поиска'),
+        ),
+        migrations.AddField(
+            model_name='staffmember',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Индекс поиска'),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Индекс поиска'),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,41 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+TYPEAHEAD_TABLES = ('main_city', 'main_diagnosis', 'main_team')
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in TYPEAHEAD_TABLES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_name_trgm '
+            f'ON {table} USING gin (name gin_trgm_ops)',
+        )
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {table}_name_upper_trgm '
+            f'ON {table} USING gin ((UPPER(name::text)) gin_trgm_ops)',
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in TYPEAHEAD_TABLES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {table}_name_trgm')
+        schema_editor.execute(
+            f'DROP INDEX IF EXISTS {table}_name_upper_trgm',
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.13 on 2026-10-18 10:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_typeahead_trigram'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='player',
+            index=models.Index(fields=['surname', 'id'], name='player_surname_id_idx'),
+        ),
+    ]
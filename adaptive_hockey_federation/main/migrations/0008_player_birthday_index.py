@@ -0,0 +1,17 @@
+# Generated by Django 4.2.13 on 2026-10-18 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='player',
+            index=models.Index(fields=['birthday'], name='player_birthday_idx'),
+        ),
+    ]
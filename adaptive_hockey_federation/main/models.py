@@ -1,15 +1,24 @@
 from typing import TYPE_CHECKING
 
+from core.cache import dictionary_cache
+from core.changelog import record_changes
 from core.constants import (
     GENDER_CHOICES,
     PLAYER_POSITION_CHOICES,
     STAFF_POSITION_CHOICES,
+    ChangeAction,
     MainConstantsInt,
     MainConstantsStr,
 )
+from core.search import (
+    SEARCH_CHUNK_SIZE,
+    get_phone_search_terms,
+    update_search_vectors,
+)
 from core.validators import fio_validator, validate_date_birth
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch.dispatcher import receiver
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -43,12 +52,14 @@ class BaseUniqueName(models.Model):
 
     @classmethod
     def get_by_name(cls, name: str):
-        """Возвращает объект БД по наименованию (полю "name")."""
+        """
+        Возвращает объект БД по наименованию (полю "name").
+
+        Результат читается через кеш справочников.
+        """
         name = name.strip()
         res: QuerySet = cls.objects.filter(name=name)  # type: ignore
-        if res.exists():
-            return res.first()
-        return None
+        return dictionary_cache.get_or_set(cls, f"name:{name}", res.first)
 
 
 class City(BaseUniqueName):
@@ -181,6 +192,11 @@ class StaffMember(BasePerson):
         verbose_name=_("Актуальный номер телефона"),
         help_text=_("Номер телефона, допустимый формат - +7 ХХХ ХХХ ХХ ХХ"),
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name=_("Индекс поиска"),
+    )
 
     class Meta:
         verbose_name = "Сотрудник"
@@ -200,6 +216,13 @@ class StaffMember(BasePerson):
         """Метод, использующий полное ФИО для строкового представления."""
         return " ".join([self.surname, self.name, self.patronymic])
 
+    def get_search_document(self):
+        """Тексты для индекса поиска: ФИО, телефон."""
+        return (
+            (self.surname, self.name, self.patronymic),
+            get_phone_search_terms(self.phone),
+        )
+
 
 class Team(BaseUniqueName):
     """Модель команды."""
@@ -224,6 +247,11 @@ class Team(BaseUniqueName):
         help_text=_("Куратор команды"),
         related_name="team",
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name=_("Индекс поиска"),
+    )
 
     class Meta:
         default_related_name = "teams"
@@ -245,6 +273,13 @@ class Team(BaseUniqueName):
             return f"{self.name} - {self.city}"
         return self.name
 
+    def get_search_document(self):
+        """Тексты для индекса поиска: название, город и дисциплина."""
+        return (
+            (self.name,),
+            (self.city.name, self.discipline_name.name),
+        )
+
 
 class StaffTeamMember(models.Model):
     """Модель сотрудник команды."""
@@ -402,6 +437,11 @@ class Player(BasePerson):
         default=MainConstantsStr.EMPTY_VALUE_DISPLAY,
         blank=True,
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name=_("Индекс поиска"),
+    )
 
     class Meta(BasePerson.Meta):
         default_related_name = "players"
@@ -422,6 +462,16 @@ class Player(BasePerson):
                 ],
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=["surname", "id"],
+                name="player_surname_id_idx",
+            ),
+            models.Index(
+                fields=["birthday"],
+                name="player_birthday_idx",
+            ),
+        ]
         permissions = [
             ("list_view_player", "Can view list of Игрок"),
         ]
@@ -434,6 +484,28 @@ class Player(BasePerson):
         """Метод для получения строки с данными игрока и его позицией."""
         return f"{self.__str__()} ({self.position})"
 
+    def get_search_document(self):
+        """
+        Тексты для индекса поиска.
+
+        ФИО, затем команды, дисциплина и номер, затем дата рождения.
+        """
+        return (
+            (self.surname, self.name, self.patronymic),
+            (
+                *(team.name for team in self.team.all()),
+                self.discipline_name and self.discipline_name.name,
+                self.discipline_level and self.discipline_level.name,
+                str(self.number),
+            ),
+            (
+                str(self.birthday.year),
+                str(self.birthday.month),
+                str(self.birthday.day),
+                self.gender,
+            ),
+        )
+
 
 class Document(BaseUniqueName):
     """Модель Документы для загрузки."""
@@ -474,7 +546,123 @@ class Document(BaseUniqueName):
         return f"Документ игрока: {self.player}"
 
 
+SEARCH_DICTIONARY_LOOKUPS = {
+    Player: {
+        DisciplineName: "discipline_name",
+        DisciplineLevel: "discipline_level",
+    },
+    Team: {
+        City: "city",
+        DisciplineName: "discipline_name",
+    },
+}
+
+
 @receiver(post_delete, sender=Document)
 def document_file_delete(sender, instance, **kwargs):
     if instance.file:
         instance.file.delete(False)
+
+
+@receiver(post_save, sender=Player)
+@receiver(post_save, sender=StaffMember)
+def search_vector_update(sender, instance, raw, using, **kwargs):
+    if not raw:
+        update_search_vectors([instance], using)
+
+
+@receiver(post_save, sender=Team)
+def team_search_vector_update(sender, instance, raw, using, **kwargs):
+    if raw:
+        return
+    update_search_vectors([instance], using)
+    update_search_vectors(
+        instance.team_players.select_related(
+            "discipline_name",
+            "discipline_level",
+        ).prefetch_related("team"),
+        using,
+    )
+
+
+@receiver(post_save, sender=City)
+@receiver(post_save, sender=DisciplineName)
+@receiver(post_save, sender=DisciplineLevel)
+def dictionary_search_vector_update(
+    sender,
+    instance,
+    created,
+    raw,
+    using,
+    **kwargs,
+):
+    """Переименование справочника меняет документы игроков и команд."""
+    if raw or created:
+        return
+    querysets = (
+        (
+            Player.objects.select_related(
+                "discipline_name",
+                "discipline_level",
+            ).prefetch_related("team"),
+            SEARCH_DICTIONARY_LOOKUPS[Player],
+        ),
+        (
+            Team.objects.select_related("city", "discipline_name"),
+            SEARCH_DICTIONARY_LOOKUPS[Team],
+        ),
+    )
+    for queryset, lookups in querysets:
+        if sender in lookups:
+            update_search_vectors(
+                queryset.using(using)
+                .filter(**{lookups[sender]: instance.pk})
+                .order_by("pk")
+                .iterator(chunk_size=SEARCH_CHUNK_SIZE),
+                using,
+            )
+
+
+@receiver(m2m_changed, sender=Player.team.through)
+def player_team_search_vector_update(
+    sender,
+    instance,
+    action,
+    reverse,
+    pk_set,
+    using,
+    **kwargs,
+):
+    if action == "pre_clear" and reverse:
+        instance._search_players = list(
+            instance.team_players.values_list("pk", flat=True),
+        )
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        update_search_vectors([instance], using)
+        return
+    if pk_set is None:
+        pk_set = instance.__dict__.pop("_search_players", [])
+    update_search_vectors(
+        Player.objects.filter(pk__in=pk_set).prefetch_related("team"),
+        using,
+    )
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def dictionary_cache_invalidate(sender, **kwargs):
+    if issubclass(sender, BaseUniqueName):
+        dictionary_cache.invalidate(sender)
+
+
+@receiver(post_save, sender=StaffMember)
+def staff_member_change_log(sender, instance, created, using, **kwargs):
+    if not created:
+        record_changes(
+            StaffTeamMember,
+            instance.staffteammember_set.values_list("pk", flat=True),
+            ChangeAction.UPDATED,
+            using,
+        )
@@ -0,0 +1,455 @@
+import csv
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator
+
+from analytics.rollup import apply_rollup_delta, collect_rollup
+from core.changelog import record_changes
+from core.constants import (
+    GENDER_CHOICES,
+    PLAYER_POSITION_CHOICES,
+    ChangeAction,
+    ImportConstants,
+)
+from core.search import update_search_vectors
+from core.watermarks import touch_watermarks
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from main.models import (
+    Diagnosis,
+    DisciplineLevel,
+    DisciplineName,
+    Player,
+    Team,
+)
+from openpyxl import load_workbook
+
+IMPORT_FIELDS = (
+    "surname",
+    "name",
+    "patronymic",
+    "birthday",
+    "addition_date",
+    "gender",
+    "diagnosis",
+    "discipline_name",
+    "discipline_level",
+    "level_revision",
+    "position",
+    "number",
+    "is_captain",
+    "is_assistent",
+    "identity_document",
+    "team",
+)
+REQUIRED_FIELDS = ("surname", "name", "birthday")
+DATE_FIELDS = ("birthday", "addition_date")
+FLAG_FIELDS = ("is_captain", "is_assistent")
+LOOKUP_FIELDS = ("diagnosis", "discipline_name", "discipline_level", "team")
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%Y-%m-%d %H:%M:%S")
+TRUE_VALUES = frozenset(("да", "1", "true", "yes", "+", "x"))
+EMPTY_VALUES = frozenset(("", "none"))
+TEAM_SEPARATOR = ";"
+CSV_DELIMITERS = ",;\t"
+AMBIGUOUS = object()
+
+
+class PlayerImportError(Exception):
+    """Файл импорта нельзя разобрать."""
+
+
+@dataclass
+class RowError:
+    """Ошибка в строке файла импорта."""
+
+    row: int
+    column: str
+    message: str
+
+
+@dataclass
+class ImportResult:
+    """Итог импорта игроков."""
+
+    dry_run: bool
+    rows: int = 0
+    created: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+
+def get_header_aliases() -> dict[str, str]:
+    """Заголовки колонок (имя поля или подпись) -> имя поля игрока."""
+    aliases = {}
+    for name in IMPORT_FIELDS:
+        model_field = Player._meta.get_field(name)
+        aliases[name] = name
+        aliases[str(model_field.verbose_name).casefold()] = name
+    aliases["команды"] = "team"
+    return aliases
+
+
+def get_column_label(name: str) -> str:
+    """Подпись колонки для отчета об ошибках."""
+    return str(Player._meta.get_field(name).verbose_name)
+
+
+def iter_xlsx(path: str) -> Iterator[tuple]:
+    """Строки первого листа книги excel (потоковое чтение)."""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_csv(path: str) -> Iterator[list]:
+    """Строки CSV-файла с определением разделителя."""
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        sample = file.read(ImportConstants.CSV_SAMPLE_SIZE)
+        file.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=CSV_DELIMITERS)
+        except csv.Error:
+            dialect = csv.excel
+        yield from csv.reader(file, dialect)
+
+
+def iter_file_rows(path: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Строки файла импорта в виде (номер строки, {поле: значение}).
+
+    Строкой заголовков считается первая строка, где есть колонка
+    фамилии, поэтому подходят и файлы выгрузки игроков (с заголовком
+    таблицы над колонками). Пустые строки пропускаются.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".xlsx":
+        rows = iter_xlsx(path)
+    elif extension == ".csv":
+        rows = iter_csv(path)
+    else:
+        raise PlayerImportError("Поддерживаются файлы .xlsx и .csv")
+    aliases = get_header_aliases()
+    columns = None
+    for number, row in enumerate(rows, start=1):
+        if columns is None:
+            if number > ImportConstants.HEADER_SEARCH_ROWS:
+                break
+            names = [
+                aliases.get(str(value).strip().casefold())
+                if value is not None
+                else None
+                for value in row
+            ]
+            if "surname" in names:
+                columns = names
+                missing = set(REQUIRED_FIELDS) - set(names)
+                if missing:
+                    raise PlayerImportError(
+                        "Нет обязательных колонок: "
+                        + ", ".join(map(get_column_label, sorted(missing))),
+                    )
+            continue
+        values = {
+            name: value
+            for name, value in zip(columns, row, strict=False)
+            if name is not None
+        }
+        if any(not is_empty(value) for value in values.values()):
+            yield number, values
+    if columns is None:
+        raise PlayerImportError("Не найдена строка заголовков с фамилией")
+
+
+def is_empty(value: Any) -> bool:
+    """Пустая ли ячейка (в том числе "None" из выгрузки)."""
+    return value is None or str(value).strip().casefold() in EMPTY_VALUES
+
+
+def to_text(value: Any) -> str:
+    """Текст ячейки без пробелов по краям."""
+    return "" if is_empty(value) else str(value).strip()
+
+
+def to_date(value: Any) -> date:
+    """Дата из ячейки excel или текста."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(str(value).strip(), date_format).date()
+        except ValueError:
+            continue
+    raise ValueError("Дата должна быть в формате ГГГГ-ММ-ДД или ДД.ММ.ГГГГ")
+
+
+def to_choice(value: Any, choices: Iterable[tuple[str, str]]) -> str:
+    """Значение из списка вариантов без учета регистра."""
+    text = to_text(value).casefold()
+    for choice, _ in choices:
+        if choice.casefold() == text:
+            return choice
+    raise ValueError(
+        "Допустимые значения: " + ", ".join(choice for choice, _ in choices),
+    )
+
+
+class PlayerImporter:
+    """
+    Пакетный импорт игроков из файла.
+
+    Справочники (диагнозы, дисциплины, классификации, команды)
+    загружаются один раз в словари, строки проверяются и записываются
+    пачками по batch_size: уникальность по player_unique проверяется
+    одним запросом на пачку, игроки и их связи с командами сохраняются
+    через bulk_create. Строки с ошибками пропускаются и попадают в
+    отчет. При dry_run данные только проверяются.
+    """
+
+    def __init__(
+        self,
+        dry_run: bool = False,
+        batch_size: int = ImportConstants.BATCH_SIZE,
+    ):
+        """Загрузка справочников для разбора строк."""
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        self.seen: dict[tuple, int] = {}
+        self.created_ids: list[int] = []
+        self.load_lookups()
+
+    def load_lookups(self) -> None:
+        """Справочники по наименованию без учета регистра."""
+        self.diagnoses = {
+            name.casefold(): pk
+            for pk, name in Diagnosis.objects.values_list("pk", "name")
+        }
+        self.disciplines = {
+            name.casefold(): pk
+            for pk, name in DisciplineName.objects.values_list("pk", "name")
+        }
+        self.levels: dict[tuple, int] = {}
+        self.levels_by_name: dict[str, Any] = {}
+        for pk, name, discipline_id in DisciplineLevel.objects.values_list(
+            "pk",
+            "name",
+            "discipline_name_id",
+        ):
+            key = name.casefold()
+            self.levels[(discipline_id, key)] = pk
+            self.levels_by_name[key] = (
+                AMBIGUOUS if key in self.levels_by_name else pk
+            )
+        self.teams = {
+            name.casefold(): pk
+            for pk, name in Team.objects.values_list("pk", "name")
+        }
+
+    def run(self, rows: Iterable[tuple[int, dict]]) -> ImportResult:
+        """Импортировать строки, полученные из iter_file_rows."""
+        result = ImportResult(dry_run=self.dry_run)
+        with transaction.atomic():
+            batch = []
+            for number, values in rows:
+                result.rows += 1
+                parsed = self.parse_row(number, values, result.errors)
+                if parsed is not None:
+                    batch.append(parsed)
+                if len(batch) >= self.batch_size:
+                    self.save_batch(batch, result.errors)
+                    batch = []
+            self.save_batch(batch, result.errors)
+            if not self.dry_run:
+                self.after_create()
+        result.errors.sort(key=lambda error: error.row)
+        result.created = len(self.created_ids)
+        return result
+
+    def parse_row(
+        self,
+        number: int,
+        values: dict[str, Any],
+        errors: list[RowError],
+    ) -> tuple[int, Player, list[int]] | None:
+        """Игрок и команды из строки файла или None при ошибках."""
+        data, problems = self.convert_values(values)
+        team_ids: list[int] = []
+        try:
+            data.update(self.resolve_lookups(values))
+            team_ids = self.resolve_teams(values.get("team"))
+        except LookupError as error:
+            problems.append(error.args)
+        player = Player(**data)
+        if not problems:
+            try:
+                player.clean_fields(exclude=[*LOOKUP_FIELDS, "search_vector"])
+            except ValidationError as error:
+                problems.extend(
+                    (name, message)
+                    for name, messages in error.message_dict.items()
+                    for message in messages
+                )
+        if problems:
+            errors.extend(
+                RowError(number, get_column_label(name), message)
+                for name, message in problems
+            )
+            return None
+        return number, player, team_ids
+
+    def convert_values(
+        self,
+        values: dict[str, Any],
+    ) -> tuple[dict[str, Any], list[tuple[str, str]]]:
+        """Значения простых полей игрока и ошибки (поле, сообщение)."""
+        data: dict[str, Any] = {}
+        problems = []
+        for name in IMPORT_FIELDS:
+            value = values.get(name)
+            if name in LOOKUP_FIELDS or is_empty(value):
+                if name in REQUIRED_FIELDS:
+                    problems.append((name, "Обязательное поле."))
+                continue
+            try:
+                data[name] = self.convert(name, value)
+            except ValueError as error:
+                problems.append((name, str(error)))
+        return data, problems
+
+    def convert(self, name: str, value: Any) -> Any:
+        """Значение поля игрока из ячейки."""
+        if name in DATE_FIELDS:
+            return to_date(value)
+        if name in FLAG_FIELDS:
+            return to_text(value).casefold() in TRUE_VALUES
+        if name == "number":
+            try:
+                return int(float(str(value).strip().replace(",", ".")))
+            except ValueError:
+                raise ValueError("Номер должен быть целым числом.") from None
+        if name == "gender":
+            return to_choice(value, GENDER_CHOICES)
+        if name == "position":
+            return to_choice(value, PLAYER_POSITION_CHOICES)
+        return to_text(value)
+
+    def resolve_lookups(self, values: dict[str, Any]) -> dict[str, int]:
+        """Идентификаторы справочников по наименованиям из строки."""
+        data = {}
+        for name, lookup, label in (
+            ("diagnosis", self.diagnoses, "Диагноз"),
+            ("discipline_name", self.disciplines, "Дисциплина"),
+        ):
+            text = to_text(values.get(name))
+            if text:
+                if text.casefold() not in lookup:
+                    raise LookupError(name, f"{label} «{text}» не найден(а).")
+                data[f"{name}_id"] = lookup[text.casefold()]
+        level = to_text(values.get("discipline_level"))
+        if level:
+            key = level.casefold()
+            pk = self.levels.get((data.get("discipline_name_id"), key))
+            if pk is None:
+                pk = self.levels_by_name.get(key)
+            if pk is None or pk is AMBIGUOUS:
+                raise LookupError(
+                    "discipline_level",
+                    f"Классификация «{level}» не найдена для дисциплины.",
+                )
+            data["discipline_level_id"] = pk
+        return data
+
+    def resolve_teams(self, value: Any) -> list[int]:
+        """Идентификаторы команд, перечисленных через точку с запятой."""
+        team_ids = []
+        for name in to_text(value).split(TEAM_SEPARATOR):
+            name = name.strip()
+            if not name:
+                continue
+            if name.casefold() not in self.teams:
+                raise LookupError("team", f"Команда «{name}» не найдена.")
+            team_ids.append(self.teams[name.casefold()])
+        return list(dict.fromkeys(team_ids))
+
+    @staticmethod
+    def get_unique_key(player: Player) -> tuple:
+        """Значения полей ограничения player_unique."""
+        return (
+            player.name,
+            player.surname,
+            player.patronymic,
+            player.birthday,
+        )
+
+    def save_batch(
+        self,
+        batch: list[tuple[int, Player, list[int]]],
+        errors: list[RowError],
+    ) -> None:
+        """Проверить пачку на дубликаты и сохранить новых игроков."""
+        if not batch:
+            return
+        existing = set(
+            Player.objects.filter(
+                birthday__in={player.birthday for _, player, _ in batch},
+            ).values_list("name", "surname", "patronymic", "birthday"),
+        )
+        new = []
+        for number, player, team_ids in batch:
+            key = self.get_unique_key(player)
+            if key in existing:
+                message = "Игрок с такими ФИО и датой рождения уже есть."
+            elif key in self.seen:
+                message = f"Повторяет строку {self.seen[key]}."
+            else:
+                self.seen[key] = number
+                new.append((player, team_ids))
+                continue
+            errors.append(
+                RowError(number, get_column_label("surname"), message),
+            )
+        if self.dry_run or not new:
+            return
+        players = Player.objects.bulk_create(
+            [player for player, _ in new],
+            batch_size=self.batch_size,
+        )
+        Player.team.through.objects.bulk_create(
+            [
+                Player.team.through(player_id=player.pk, team_id=team_id)
+                for player, (_, team_ids) in zip(players, new, strict=True)
+                for team_id in team_ids
+            ],
+            batch_size=self.batch_size,
+        )
+        self.created_ids.extend(player.pk for player in players)
+
+    def after_create(self) -> None:
+        """
+        Действия сигналов сохранения для новых игроков.
+
+        bulk_create не отправляет сигналы, поэтому индекс поиска, сводка
+        аналитики, отметки изменений и журнал изменений обновляются
+        здесь, один раз на весь импорт.
+        """
+        if not self.created_ids:
+            return
+        players = Player.objects.filter(pk__in=self.created_ids)
+        update_search_vectors(
+            players.select_related(
+                "discipline_name",
+                "discipline_level",
+            ).prefetch_related("team"),
+        )
+        apply_rollup_delta(Counter(), collect_rollup(players))
+        touch_watermarks([Player, Team])
+        record_changes(Player, self.created_ids, ChangeAction.CREATED)
+
+
+def import_players(path: str, dry_run: bool = False) -> ImportResult:
+    """Импортировать игроков из файла .xlsx или .csv."""
+    return PlayerImporter(dry_run=dry_run).run(iter_file_rows(path))
@@ -1,4 +1,8 @@
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import connections
+from django.db.models import OuterRef, Prefetch, QuerySet
 from django.urls import reverse
+from main.models import Player, Team
 
 SEARCH_FIELDS: dict = {
     "surname": "surname",
@@ -12,6 +16,40 @@ SEARCH_FIELDS: dict = {
 }
 
 
+def get_players_list_queryset(queryset: QuerySet) -> QuerySet:
+    """
+    Выборка игроков для таблиц со связанными данными.
+
+    Справочники подтягиваются через JOIN, названия команд - одним
+    подзапросом-массивом на PostgreSQL или одним prefetch-запросом на
+    остальных СУБД. Число запросов не зависит от размера страницы.
+    """
+    queryset = queryset.select_related(
+        "diagnosis",
+        "discipline_name",
+        "discipline_level",
+    )
+    if connections[queryset.db].vendor == "postgresql":
+        return queryset.annotate(
+            team_names=ArraySubquery(
+                Team.objects.filter(team_players=OuterRef("pk"))
+                .order_by("name")
+                .values("name"),
+            ),
+        )
+    return queryset.prefetch_related(
+        Prefetch("team", queryset=Team.objects.only("id", "name")),
+    )
+
+
+def get_team_names(player: Player) -> list[str]:
+    """Названия команд игрока из аннотации или prefetch-кэша."""
+    team_names = getattr(player, "team_names", None)
+    if team_names is None:
+        team_names = sorted(team.name for team in player.team.all())
+    return team_names
+
+
 def get_player_table_data(context):
     table_data = [
         {
@@ -26,7 +64,7 @@ def get_player_table_data(context):
             "discipline_level": (
                 player.discipline_level if player.discipline_level else None
             ),
-            "team": ([team.name for team in player.team.all()]),
+            "team": get_team_names(player),
             "url": reverse("main:player_id", args=[player.id]),
             "id": player.pk,
         }
@@ -47,7 +47,9 @@ def get_staff_table(team):
                     "id": staff.id,
                 }
                 for i, staff in enumerate(
-                    team.team_members.filter(staff_position=staff_position[1]),
+                    team.team_members.filter(
+                        staff_position=staff_position[1],
+                    ).select_related("staff_member"),
                 )
             ],
         }
@@ -125,6 +125,21 @@ ajax_urlpatterns = [
         ajax.filter_discipline_search,
         name="ajax_filter_discipline_search",
     ),
+    path(
+        "typeahead/diagnoses/",
+        ajax.typeahead_diagnoses,
+        name="ajax_typeahead_diagnoses",
+    ),
+    path(
+        "typeahead/cities/",
+        ajax.typeahead_cities,
+        name="ajax_typeahead_cities",
+    ),
+    path(
+        "typeahead/teams/",
+        ajax.typeahead_teams,
+        name="ajax_typeahead_teams",
+    ),
 ]
 
 urlpatterns = [
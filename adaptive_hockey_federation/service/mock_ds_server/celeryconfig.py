@@ -1,10 +1,25 @@
-broker_url = "redis://localhost:6379/1"
-broker_transport_options = {
-    "visibility_timeout": 360,
-    "queue_order_strategy": "priority",
-}
-result_backend = broker_url
+import os
+
+from constants import BROKER_DIR, RESULTS_DIR
+
+# Для локального запуска достаточно брокера в файловой системе, для
+# запуска с Redis адрес задается в MOCK_DS_BROKER_URL.
+broker_url = os.getenv("MOCK_DS_BROKER_URL", "filesystem://")
+if broker_url.startswith("filesystem://"):
+    broker_transport_options = {
+        "data_folder_in": str(BROKER_DIR),
+        "data_folder_out": str(BROKER_DIR),
+        "store_processed": False,
+    }
+    result_backend = f"file://{RESULTS_DIR}"
+else:
+    broker_transport_options = {
+        "visibility_timeout": 360,
+        "queue_order_strategy": "priority",
+    }
+    result_backend = broker_url
 accept_content = ["application/json"]
 task_serializer = "json"
 result_serializer = "json"
+task_track_started = True
 broker_connection_retry_on_startup = True
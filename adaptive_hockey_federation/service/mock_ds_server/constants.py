@@ -1,5 +1,33 @@
+import os
+import tempfile
+import uuid
+from pathlib import Path
+
 # DELAY = 5 * 60 * 60  # в секундах
 DELAY = 10  # в секундах
 FRAMES_QUANTITY = 10
 MIN_FRAMES = 0
 MAX_FRAMES = 100_000
+
+# Каталог локального брокера, результатов и отметок о поставленных
+# задачах (при брокере filesystem://).
+DATA_DIR = Path(
+    os.getenv(
+        "MOCK_DS_DATA_DIR",
+        Path(tempfile.gettempdir()) / "mock_ds_server",
+    ),
+)
+BROKER_DIR = DATA_DIR / "broker"
+RESULTS_DIR = DATA_DIR / "results"
+JOBS_DIR = DATA_DIR / "jobs"
+# Состояние, которое сервер записывает в хранилище результатов перед
+# отправкой задачи брокеру. Пока задача ждет в очереди, статус PENDING
+# означает только то, что хранилище о задаче ничего не знает.
+JOB_SENT = "SENT"
+# Сколько секунд задача может оставаться без записи в хранилище
+# результатов, прежде чем считается потерянной и ставится заново.
+# Ограничивает время между отметкой о задаче и записью JOB_SENT
+# (обработчик запроса упал между ними) и не зависит от длины очереди.
+JOB_PENDING_TIMEOUT = int(os.getenv("MOCK_DS_JOB_PENDING_TIMEOUT", 60))
+# Пространство имен для идентификаторов задач по номеру игры.
+JOB_NAMESPACE = uuid.UUID("6f1d2a5e-3c47-4b8e-9a0d-5b7e1f2c8d40")
@@ -1,8 +1,16 @@
-from fastapi import FastAPI
+import os
+import time
+import uuid
+from http import HTTPStatus
+
+from celery import states
+from celery.result import AsyncResult
+from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse, HTMLResponse
 from pydantic import BaseModel
 
-from worker import mock_ds_process
+from constants import JOB_NAMESPACE, JOB_PENDING_TIMEOUT, JOB_SENT, JOBS_DIR
+from worker import app as celery_app, mock_ds_process
 
 app = FastAPI()
 
@@ -39,19 +47,154 @@ def version() -> JSONResponse:
     )
 
 
-@app.post("/process")
-async def process(request_data: RequestData) -> JSONResponse:
-    """Имитация распознавания видео."""
-    #  TODO раскомментировать после добавления celery
-    # task = mock_ds_process.apply_async(
-    #     kwargs={
-    #         "data": dict(request_data),
-    #     },
-    # )
-    # response = task.get()
-    data = {"data": request_data.model_dump()}
-    response = mock_ds_process(**data)
-    return JSONResponse(content=response)
+def get_job_id(game_id: int) -> str:
+    """Идентификатор задачи распознавания игры."""
+    return str(uuid.uuid5(JOB_NAMESPACE, str(game_id)))
+
+
+def create_marker(name: str) -> bool:
+    """Атомарно создать файл отметки, False - если он уже есть."""
+    try:
+        os.close(
+            os.open(JOBS_DIR / name, os.O_CREAT | os.O_EXCL | os.O_WRONLY),
+        )
+    except FileExistsError:
+        return False
+    return True
+
+
+def register_job(job_id: str) -> bool:
+    """
+    Отметить задачу как поставленную.
+
+    Отметка создается атомарно, поэтому из одновременных запросов по
+    одной игре задачу ставит только один. Возвращает False, если задача
+    уже была поставлена.
+    """
+    return create_marker(job_id)
+
+
+def get_attempt(job_id: str) -> int:
+    """Номер последней постановки задачи (0 - первая постановка)."""
+    attempt = 0
+    while (JOBS_DIR / f"{job_id}.{attempt + 1}").exists():
+        attempt += 1
+    return attempt
+
+
+def get_marker(job_id: str, attempt: int) -> str:
+    """Файл отметки постановки задачи с номером attempt."""
+    return job_id if not attempt else f"{job_id}.{attempt}"
+
+
+def is_job_lost(job_id: str, attempt: int, state: str) -> bool:
+    """
+    Хранилище результатов ничего не знает о задаче дольше таймаута.
+
+    Перед отправкой брокеру в хранилище записывается JOB_SENT, поэтому
+    статус PENDING не означает ожидание в очереди: задача не дошла до
+    брокера (обработчик упал после отметки) или ее результат истек.
+    Время отсчитывается от отметки о последней постановке задачи и
+    ограничено JOB_PENDING_TIMEOUT.
+    """
+    if state != states.PENDING:
+        return False
+    try:
+        registered = (JOBS_DIR / get_marker(job_id, attempt)).stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return time.time() - registered > JOB_PENDING_TIMEOUT
+
+
+def requeue_job(job_id: str, attempt: int) -> bool:
+    """
+    Занять повторную постановку задачи после попытки attempt.
+
+    Отметка следующей попытки создается атомарно, поэтому из
+    одновременных запросов задачу ставит заново только один.
+    """
+    return create_marker(get_marker(job_id, attempt + 1))
+
+
+def send_job(job_id: str, data: dict) -> None:
+    """
+    Отправить задачу брокеру.
+
+    Перед отправкой в хранилище результатов записывается JOB_SENT,
+    воркер затем заменяет его своим статусом. Если отправить задачу не
+    удалось, запись удаляется.
+    """
+    result = AsyncResult(job_id, app=celery_app)
+    result.backend.store_result(job_id, None, JOB_SENT)
+    try:
+        mock_ds_process.apply_async(kwargs={"data": data}, task_id=job_id)
+    except Exception:
+        result.forget()
+        raise
+
+
+def get_job_state(result: AsyncResult) -> str:
+    """Статус задачи для ответа: отправленная брокеру задача - PENDING."""
+    state = result.state
+    return states.PENDING if state == JOB_SENT else state
+
+
+@app.post("/process", status_code=HTTPStatus.ACCEPTED)
+def process(request_data: RequestData) -> JSONResponse:
+    """
+    Постановка задачи распознавания видео.
+
+    Сразу возвращает идентификатор задачи, результат запрашивается
+    через /jobs/{job_id}. Повторный запрос по той же игре возвращает
+    ту же задачу, упавшая или потерянная (см. is_job_lost) задача
+    ставится заново одним из одновременных запросов (см. requeue_job).
+    Если задачу не удалось передать брокеру, отметка о первой
+    постановке снимается. Обработчик синхронный: FastAPI выполняет его
+    в пуле потоков, и отправка задачи брокеру не блокирует остальные
+    запросы.
+    """
+    job_id = get_job_id(request_data.game_id)
+    if not register_job(job_id):
+        attempt = get_attempt(job_id)
+        result = AsyncResult(job_id, app=celery_app)
+        state = result.state
+        if (
+            state != states.FAILURE and not is_job_lost(job_id, attempt, state)
+        ) or not requeue_job(job_id, attempt):
+            return JSONResponse(
+                status_code=HTTPStatus.ACCEPTED,
+                content={"job_id": job_id, "status": get_job_state(result)},
+            )
+        result.forget()
+        send_job(job_id, request_data.model_dump())
+    else:
+        try:
+            send_job(job_id, request_data.model_dump())
+        except Exception:
+            (JOBS_DIR / job_id).unlink(missing_ok=True)
+            raise
+    return JSONResponse(
+        status_code=HTTPStatus.ACCEPTED,
+        content={"job_id": job_id, "status": states.PENDING},
+    )
+
+
+@app.get("/jobs/{job_id}")
+def job(job_id: uuid.UUID) -> JSONResponse:
+    """Статус задачи распознавания и ее результат."""
+    task_id = str(job_id)
+    if not (JOBS_DIR / task_id).exists():
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail="Задача не найдена",
+        )
+    result = AsyncResult(task_id, app=celery_app)
+    content = {"job_id": task_id, "status": get_job_state(result)}
+    if result.successful():
+        content["result"] = result.result
+    elif result.failed():
+        content["error"] = str(result.result)
+    return JSONResponse(content=content)
 
 
 @app.post("/clean")
@@ -2,14 +2,30 @@ import logging
 import random
 from time import sleep
 
-from constants import DELAY, FRAMES_QUANTITY, MAX_FRAMES, MIN_FRAMES
+from celery import Celery
+from constants import (
+    BROKER_DIR,
+    DELAY,
+    FRAMES_QUANTITY,
+    JOBS_DIR,
+    MAX_FRAMES,
+    MIN_FRAMES,
+    RESULTS_DIR,
+)
 from adaptive_hockey_federation.core.logging import configure_logging
 
 logger = logging.getLogger(__name__)
 
 configure_logging()
 
+for directory in (BROKER_DIR, RESULTS_DIR, JOBS_DIR):
+    directory.mkdir(parents=True, exist_ok=True)
 
+app = Celery("mock_ds_server")
+app.config_from_object("celeryconfig")
+
+
+@app.task(name="mock_ds_process")
 def mock_ds_process(*args, **kwargs) -> list[dict[str, int | list[int]]]:
     logger.info("Старт заглушки DS сервера")
     sleep(DELAY)
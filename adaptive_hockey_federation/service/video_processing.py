@@ -1,7 +1,30 @@
+import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Iterable, Iterator
+
 import cv2
+import numpy as np
+
+# Количество кадров, которое вырезается начиная с каждого кадра с игроком.
+CLIP_FRAMES = 5
+# Расстояние между ключевыми кадрами, при котором дешевле перемотать
+# (декодер начнет с ближайшего ключевого кадра), чем декодировать кадры
+# подряд до нужного. 50 кадров - 2 секунды при 25 кадрах в секунду.
+KEYFRAME_DISTANCE = 50
+FOURCC = "mp4v"
+# Кодек частей при параллельной нарезке: без потерь, чтобы итоговый
+# файл совпадал с последовательной нарезкой, и быстрый.
+SEGMENT_FOURCC = "HFYU"
+# Глубина очереди между потоками декодирования и кодирования: ограничивает
+# память на кадры, пока кодирование отстает.
+QUEUE_SIZE = 16
 
+FrameRange = tuple[int, int]
 
-# TODO моковая реализация для нарезки видео подключается к воркеру
 # Пример сигнатуры
 # input_file = os.path.join(
 #     os.path.dirname(__file__),
@@ -14,17 +37,486 @@ import cv2
 # frames = [i for i in range(15000, 15430, 5)]
 
 
-def slicing_video_with_player_frames(input_file, output_file, frames, fps=25):
-    cap = cv2.VideoCapture(input_file)
+def merge_frame_windows(
+    frames: Iterable[int],
+    length: int = CLIP_FRAMES,
+) -> list[FrameRange]:
+    """
+    Отрезки кадров [начало, конец) для нарезки.
+
+    Окна по length кадров от каждого кадра с игроком сортируются, а
+    пересекающиеся и соседние окна объединяются, поэтому каждый кадр
+    попадает в нарезку один раз.
+    """
+    ranges: list[list[int]] = []
+    for frame in sorted(set(frames)):
+        if ranges and frame <= ranges[-1][1]:
+            ranges[-1][1] = max(ranges[-1][1], frame + length)
+        else:
+            ranges.append([frame, frame + length])
+    return [(start, end) for start, end in ranges]
+
+
+def iter_frames(
+    cap: cv2.VideoCapture,
+    ranges: Iterable[FrameRange],
+    keyframe_distance: int = KEYFRAME_DISTANCE,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Кадры отрезков в виде пар (номер, изображение).
+
+    Видео декодируется последовательно: пропускаемые кадры только
+    захватываются (grab), изображение извлекается (retrieve) лишь для
+    нужных. Перемотка выполняется, только если до начала отрезка больше
+    keyframe_distance кадров. Отрезки должны идти по возрастанию и не
+    пересекаться (см. merge_frame_windows). Чтение заканчивается на
+    конце файла, непрочитанные кадры пропускаются.
+    """
+    position = 0
+    for start, end in ranges:
+        if start - position > keyframe_distance:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+            position = start
+        while position < start:
+            if not cap.grab():
+                return
+            position += 1
+        while position < end:
+            if not cap.grab():
+                return
+            ok, frame = cap.retrieve()
+            position += 1
+            if ok and frame is not None:
+                yield position - 1, frame
+
+
+def get_frame_size(
+    cap: cv2.VideoCapture,
+    scale: float = 1.0,
+) -> tuple[int, int]:
+    """Размер кадра исходного видео с учетом масштаба."""
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    output = cv2.VideoWriter(output_file, fourcc, fps, (width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def open_writer(
+    output_file: str,
+    size: tuple[int, int],
+    fps: float,
+    fourcc: str = FOURCC,
+) -> cv2.VideoWriter:
+    """Запись видео с размером кадра size."""
+    return cv2.VideoWriter(
+        output_file,
+        cv2.VideoWriter_fourcc(*fourcc),
+        fps,
+        size,
+    )
+
+
+def resize_frames(
+    frames: Iterator[tuple[int, np.ndarray]],
+    size: tuple[int, int],
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Уменьшение кадров до размера size."""
+    for number, frame in frames:
+        yield number, cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+
+def read_in_thread(
+    frames: Iterator[tuple[int, np.ndarray]],
+    queue_size: int = QUEUE_SIZE,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Чтение кадров в отдельном потоке.
+
+    Поток декодирования кладет кадры в очередь не длиннее queue_size и
+    ждет, пока кодирование их заберет, поэтому в памяти не больше
+    queue_size кадров. OpenCV отпускает GIL при декодировании и
+    кодировании, и они идут параллельно. Ошибка декодирования
+    пробрасывается в вызывающий поток.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors: list[Exception] = []
+
+    def decode():
+        try:
+            for item in frames:
+                if stop.is_set():
+                    return
+                buffer.put(item)
+        except Exception as error:
+            errors.append(error)
+        finally:
+            buffer.put(None)
+
+    thread = threading.Thread(target=decode, daemon=True)
+    thread.start()
+    try:
+        while (item := buffer.get()) is not None:
+            yield item
+    finally:
+        stop.set()
+        while thread.is_alive():
+            try:
+                buffer.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def get_targets(
+    clips: dict[str, Iterable[int]],
+    step: int = 1,
+) -> dict[int, list[str]]:
+    """
+    Выходные файлы, в которые нужно записать каждый кадр.
+
+    При step > 1 остается каждый step-й кадр исходного видео.
+    """
+    targets: dict[int, list[str]] = {}
+    for output_file, frames in clips.items():
+        for start, end in merge_frame_windows(frames):
+            for number in range(start + -start % step, end, step):
+                targets.setdefault(number, []).append(output_file)
+    return targets
+
+
+def split_segments(
+    ranges: list[FrameRange],
+    segments: int,
+) -> list[list[FrameRange]]:
+    """
+    Разбиение отрезков на части для параллельной нарезки.
+
+    Части примерно равны по длине исходного видео: от нее, а не от
+    числа нужных кадров, зависит время декодирования. Граница части
+    всегда приходится на начало отрезка, где последовательная нарезка
+    и так перематывает видео к ключевому кадру.
+    """
+    if not ranges:
+        return []
+    span = (ranges[-1][1] - ranges[0][0]) / segments
+    parts: list[list[FrameRange]] = [[]]
+    for start, end in ranges:
+        if (
+            parts[-1]
+            and len(parts) < segments
+            and start - parts[-1][0][0] >= span
+        ):
+            parts.append([])
+        parts[-1].append((start, end))
+    return parts
+
+
+def write_segment(
+    input_file: str,
+    ranges: list[FrameRange],
+    targets: dict[int, list[str]],
+    outputs: dict[str, str],
+    fps: float,
+    keyframe_distance: int,
+    fourcc: str = FOURCC,
+    scale: float = 1.0,
+    queue_size: int = QUEUE_SIZE,
+) -> dict[str, int]:
+    """
+    Нарезка отрезков видео в файлы outputs.
+
+    outputs - файл для записи по каждому выходному файлу из targets.
+    Кадры декодируются в отдельном потоке (при queue_size 0 - в
+    вызывающем). Возвращает количество записанных кадров по выходным
+    файлам.
+    """
+    written = dict.fromkeys(outputs, 0)
+    cap = cv2.VideoCapture(input_file)
+    size = get_frame_size(cap, scale)
+    writers = {
+        output_file: open_writer(path, size, fps, fourcc)
+        for output_file, path in outputs.items()
+    }
+    frames = iter_frames(cap, ranges, keyframe_distance)
+    if scale != 1:
+        frames = resize_frames(frames, size)
+    if queue_size:
+        frames = read_in_thread(frames, queue_size)
+    try:
+        for number, frame in frames:
+            for output_file in targets[number]:
+                writers[output_file].write(frame)
+                written[output_file] += 1
+    finally:
+        frames.close()
+        for writer in writers.values():
+            writer.release()
+        cap.release()
+    return written
+
+
+def iter_part_frames(parts: list[str]) -> Iterator[tuple[int, np.ndarray]]:
+    """Кадры частей нарезки по порядку."""
+    for part in parts:
+        cap = cv2.VideoCapture(part)
+        try:
+            while cap.grab():
+                ok, frame = cap.retrieve()
+                if ok:
+                    yield 0, frame
+        finally:
+            cap.release()
+
+
+def concat_parts(
+    output_file: str,
+    parts: list[str],
+    size: tuple[int, int],
+    fps: float,
+    queue_size: int = QUEUE_SIZE,
+) -> None:
+    """Склейка частей нарезки в итоговый файл."""
+    output = open_writer(output_file, size, fps)
+    frames = iter_part_frames(parts)
+    if queue_size:
+        frames = read_in_thread(frames, queue_size)
+    try:
+        for _, frame in frames:
+            output.write(frame)
+    finally:
+        frames.close()
+        output.release()
+
+
+def write_clips_parallel(
+    input_file: str,
+    targets: dict[int, list[str]],
+    output_files: list[str],
+    fps: float,
+    keyframe_distance: int,
+    workers: int,
+    scale: float = 1.0,
+    queue_size: int = QUEUE_SIZE,
+) -> dict[str, int]:
+    """
+    Параллельная нарезка по частям видео.
+
+    Каждая часть нарезается в отдельном процессе со своим
+    VideoCapture в промежуточные файлы без потерь, которые затем
+    склеиваются по порядку и кодируются в итоговые файлы; склейка
+    каждого итогового файла - тоже отдельная задача того же пула.
+    Кадры итоговых файлов совпадают с последовательной нарезкой.
+
+    Промежуточные файлы HuffYUV почти не сжаты и хранятся во временном
+    каталоге до конца нарезки: им нужно место на диске порядка
+    суммарного числа кадров всех клипов, умноженного на размер кадра
+    (после scale) - около 2-3 байт на пиксель.
+    """
+    segments = split_segments(merge_frame_windows(targets, 1), workers)
+    written = dict.fromkeys(output_files, 0)
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+        ) as executor,
+    ):
+        parts = [
+            {
+                output_file: os.path.join(
+                    directory,
+                    f"{index}_{position}.avi",
+                )
+                for position, output_file in enumerate(output_files)
+            }
+            for index in range(len(segments))
+        ]
+        futures = [
+            executor.submit(
+                write_segment,
+                input_file,
+                ranges,
+                {
+                    number: targets[number]
+                    for start, end in ranges
+                    for number in range(start, end)
+                },
+                outputs,
+                fps,
+                keyframe_distance,
+                fourcc=SEGMENT_FOURCC,
+                scale=scale,
+                queue_size=queue_size,
+            )
+            for ranges, outputs in zip(segments, parts, strict=True)
+        ]
+        for future in futures:
+            for output_file, frames in future.result().items():
+                written[output_file] += frames
+        cap = cv2.VideoCapture(input_file)
+        size = get_frame_size(cap, scale)
+        cap.release()
+        futures = [
+            executor.submit(
+                concat_parts,
+                output_file,
+                [outputs[output_file] for outputs in parts],
+                size,
+                fps,
+                queue_size,
+            )
+            for output_file in output_files
+        ]
+        for future in futures:
+            future.result()
+    return written
+
+
+def write_clips(
+    input_file: str,
+    clips: dict[str, Iterable[int]],
+    fps: float = 25,
+    keyframe_distance: int = KEYFRAME_DISTANCE,
+    workers: int = 1,
+    scale: float = 1.0,
+    step: int = 1,
+    queue_size: int = QUEUE_SIZE,
+) -> dict[str, int]:
+    """
+    Нарезка нескольких видео за одно декодирование исходного.
+
+    clips - кадры с игроком для каждого выходного файла. Видео
+    декодируется один раз по объединению отрезков всех файлов, каждый
+    кадр записывается во все файлы, которым он нужен. При workers > 1
+    части видео нарезаются параллельно. scale уменьшает кадры, step
+    оставляет каждый step-й кадр (для прежней длительности fps нужно
+    разделить на step). Возвращает количество записанных кадров по
+    файлам.
+    """
+    targets = get_targets(clips, step)
+    if workers > 1:
+        return write_clips_parallel(
+            input_file,
+            targets,
+            list(clips),
+            fps,
+            keyframe_distance,
+            workers,
+            scale=scale,
+            queue_size=queue_size,
+        )
+    return write_segment(
+        input_file,
+        merge_frame_windows(targets, 1),
+        targets,
+        {output_file: output_file for output_file in clips},
+        fps,
+        keyframe_distance,
+        scale=scale,
+        queue_size=queue_size,
+    )
+
+
+def slicing_video_with_player_frames(
+    input_file: str,
+    output_file: str,
+    frames: Iterable[int],
+    fps: float = 25,
+    keyframe_distance: int = KEYFRAME_DISTANCE,
+    workers: int = 1,
+    scale: float = 1.0,
+    step: int = 1,
+) -> int:
+    """
+    Нарезка видео с игроком.
+
+    frames - кадры, на которых распознан игрок. В выходной файл
+    попадают CLIP_FRAMES кадров начиная с каждого из них, параметры
+    нарезки - как у write_clips. Возвращает количество записанных
+    кадров.
+    """
+    return write_clips(
+        input_file,
+        {output_file: frames},
+        fps,
+        keyframe_distance,
+        workers,
+        scale,
+        step,
+    )[output_file]
+
+
+def get_player_clip_name(team: int, number: int) -> str:
+    """Имя файла нарезки с игроком."""
+    return f"team_{team}_player_{number}.mp4"
+
+
+def slicing_game_video(
+    input_file: str,
+    players: list[dict],
+    output_dir: str,
+    fps: float = 25,
+    keyframe_distance: int = KEYFRAME_DISTANCE,
+    workers: int = 1,
+    scale: float = 1.0,
+    step: int = 1,
+) -> dict[str, int]:
+    """
+    Нарезка видео со всеми игроками игры.
+
+    players - ответ DS сервера: список {"number", "team", "frames"}.
+    Нарезки всех игроков пишутся в output_dir за одно декодирование
+    видео игры, при workers > 1 - параллельно по частям видео.
+    Возвращает количество записанных кадров по файлам.
+    """
+    clips: dict[str, list[int]] = {}
+    for player in players:
+        output_file = os.path.join(
+            output_dir,
+            get_player_clip_name(player["team"], player["number"]),
+        )
+        clips.setdefault(output_file, []).extend(player["frames"])
+    return write_clips(
+        input_file,
+        clips,
+        fps,
+        keyframe_distance,
+        workers,
+        scale,
+        step,
+    )
+
+
+def make_synthetic_clip(
+    output_file: str,
+    frames: int,
+    width: int,
+    height: int,
+    fps: float = 25,
+) -> None:
+    """
+    Синтетическое видео для тестов и замеров.
 
-    for fr in range(len(frames)):  # frames - список фреймов с игроком
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frames[fr])
-        for _ in range(frames[fr], frames[fr] + 5):
-            _, frame = cap.read()
+    Яркость кадра равна его номеру по модулю 256, на кадре выведен
+    номер и сдвигается полоса, чтобы кодек не сжимал кадры в ноль.
+    """
+    output = open_writer(output_file, (width, height), fps)
+    try:
+        for index in range(frames):
+            frame = np.full((height, width, 3), index % 256, np.uint8)
+            left = index * 4 % width
+            frame[:, left : left + 8] = 255 - index % 256
+            cv2.putText(
+                frame,
+                str(index),
+                (8, height // 2),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (0, 0, 255),
+                2,
+            )
             output.write(frame)
-    output.release()
-    cap.release()
+    finally:
+        output.release()
@@ -0,0 +1,99 @@
+const TYPEAHEAD_DELAY = 250;
+
+class Typeahead {
+  // Автодополнение текстового поля: варианты datalist загружаются с сервера.
+  constructor(input) {
+    this.input = input;
+    this.list = document.getElementById(input.getAttribute('list'));
+    this.url = input.dataset.typeahead;
+    this.timer = null;
+    this.request = 0;
+
+    this.input.addEventListener('input', () => {
+      clearTimeout(this.timer);
+      this.timer = setTimeout(() => this.load(), TYPEAHEAD_DELAY);
+    });
+  }
+
+  load() {
+    const request = ++this.request;
+    const params = new URLSearchParams({q: this.input.value});
+    fetch(`${this.url}?${params}`)
+      .then(response => response.json())
+      .then(data => {
+        if (request !== this.request || !this.list) {
+          return;
+        }
+        this.list.innerHTML = '';
+        data.results.forEach(item => {
+          const option = document.createElement('option');
+          option.value = item.name;
+          this.list.appendChild(option);
+        });
+      });
+  }
+}
+
+class TypeaheadSelect {
+  // Список выбора, который заполняется порциями по фильтру и при прокрутке.
+  constructor(id_select, id_filter, id_current) {
+    this.select = document.getElementById(id_select);
+    this.input = document.getElementById(id_filter);
+    this.current = document.getElementById(id_current);
+    this.url = this.select.dataset.typeahead;
+    this.timer = null;
+    this.request = 0;
+    this.page = 1;
+    this.more = false;
+
+    this.addEventListeners();
+    this.load(false);
+  }
+
+  addEventListeners() {
+    this.input.addEventListener('input', () => {
+      clearTimeout(this.timer);
+      this.timer = setTimeout(() => this.load(false), TYPEAHEAD_DELAY);
+    });
+    this.select.addEventListener('scroll', () => {
+      const bottom = this.select.scrollHeight - this.select.clientHeight;
+      if (this.more && this.select.scrollTop >= bottom - 1) {
+        this.load(true);
+      }
+    });
+  }
+
+  load(append) {
+    const request = ++this.request;
+    const page = append ? this.page + 1 : 1;
+    this.more = false;
+    const exclude = Array.from(this.current.options, option => option.value);
+    const params = new URLSearchParams({
+      q: this.input.value,
+      page: page,
+      exclude: exclude.join(','),
+    });
+    fetch(`${this.url}?${params}`)
+      .then(response => response.json())
+      .then(data => {
+        if (request !== this.request) {
+          return;
+        }
+        if (!append) {
+          this.select.innerHTML = '';
+        }
+        data.results.forEach(item => {
+          const option = document.createElement('option');
+          option.value = item.id;
+          option.textContent = item.name;
+          this.select.appendChild(option);
+        });
+        this.page = page;
+        this.more = data.more;
+      });
+  }
+}
+
+document.querySelectorAll('input[data-typeahead]').forEach(input => {
+  new Typeahead(input);
+});
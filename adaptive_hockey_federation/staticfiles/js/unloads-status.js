@@ -0,0 +1,25 @@
+const unloadsStatusInterval = 2000;
+const unloadsActiveStatuses = ["pending", "in_progress"];
+
+function pollUnloadsStatus() {
+    const cells = $("[data-unload-status-url]");
+    if (!cells.length) {
+        return;
+    }
+    const requests = cells.map(function () {
+        const cell = $(this);
+        return $.getJSON(cell.attr("data-unload-status-url")).then(function (data) {
+            cell.text(`${data.status_display} (${data.progress}%)`);
+            return unloadsActiveStatuses.includes(data.status);
+        });
+    }).get();
+    $.when(...requests).then(function (...active) {
+        if (active.includes(false)) {
+            window.location.reload();
+        } else {
+            setTimeout(pollUnloadsStatus, unloadsStatusInterval);
+        }
+    });
+}
+
+setTimeout(pollUnloadsStatus, unloadsStatusInterval);
@@ -0,0 +1,205 @@
+from collections import Counter
+from datetime import date, datetime
+
+from analytics.models import PlayerRollup
+from analytics.rollup import (
+    apply_rollup_delta,
+    collect_rollup,
+    rebuild_rollup,
+)
+from analytics.services import get_dashboard, get_rollup_dashboard
+from core.constants import AgeLimits, AnalyticsConstants, Gender
+from dateutil.relativedelta import relativedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from main.data_factories.factories import NosologyFactory, PlayerFactory
+from main.models import City, DisciplineName, Nosology, Player, Team
+
+PLAYERS_AMOUNT = 6
+DASHBOARD_QUERIES = 2
+
+
+class AnalyticsTestData(TestCase):
+    """Общие тестовые данные для страницы аналитики."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        NosologyFactory.create_batch(2)
+        discipline = DisciplineName.objects.first()
+        cls.teams = [
+            Team.objects.create(
+                name=f"Команда {index}",
+                city=City.objects.create(name=f"Город {index}"),
+                discipline_name=discipline,
+            )
+            for index in range(2)
+        ]
+        for index, player in enumerate(
+            PlayerFactory.create_batch(PLAYERS_AMOUNT),
+        ):
+            player.team.set(cls.teams[: index % 3])
+
+
+class AnalyticsDashboardTest(AnalyticsTestData):
+    """Тесты сервиса агрегации данных для страницы аналитики."""
+
+    def test_dashboard_values(self):
+        """Показатели совпадают с подсчетом отдельными запросами."""
+        queryset = Player.objects.all()
+        date_adult = datetime.now() - relativedelta(
+            years=AgeLimits.ADULT_AGE,
+        )
+        dashboard = get_dashboard(queryset)
+        self.assertEqual(
+            dashboard["primary"],
+            [
+                ("игроков", queryset.count()),
+                (
+                    "команд",
+                    Team.objects.filter(team_players__in=queryset)
+                    .distinct()
+                    .count(),
+                ),
+                ("городов", len(self.teams)),
+            ],
+        )
+        self.assertEqual(
+            dashboard["secondary"],
+            [
+                ("мальчиков", queryset.filter(gender=Gender.MAN).count()),
+                ("девочек", queryset.filter(gender=Gender.WOMAN).count()),
+                (
+                    "младше 18",
+                    queryset.filter(birthday__gte=date_adult).count(),
+                ),
+                (
+                    "старше 18",
+                    queryset.filter(birthday__lt=date_adult).count(),
+                ),
+            ],
+        )
+        self.assertEqual(
+            dashboard["nosology"],
+            [
+                (
+                    nosology.name,
+                    queryset.filter(diagnosis__nosology=nosology).count(),
+                )
+                for nosology in Nosology.objects.filter(
+                    diagnosis__in=queryset.values("diagnosis"),
+                )
+                .distinct()
+                .order_by("name")
+            ],
+        )
+
+    def test_dashboard_filtered_by_team(self):
+        """Связи игроков учитываются полностью при фильтре по команде."""
+        queryset = Player.objects.filter(team=self.teams[1])
+        primary = dict(get_dashboard(queryset)["primary"])
+        self.assertEqual(primary["игроков"], queryset.count())
+        self.assertEqual(primary["команд"], len(self.teams))
+
+    def test_dashboard_query_count(self):
+        """Число запросов не зависит от количества нозологий и игроков."""
+        with self.assertNumQueries(DASHBOARD_QUERIES):
+            get_dashboard(Player.objects.all())
+        NosologyFactory.create_batch(3)
+        PlayerFactory.create_batch(PLAYERS_AMOUNT)
+        with self.assertNumQueries(DASHBOARD_QUERIES):
+            get_dashboard(Player.objects.all())
+
+
+class PlayerRollupTest(AnalyticsTestData):
+    """Тесты инкрементального обновления сводки по игрокам."""
+
+    def check_rollup_actual(self):
+        """Сводка совпадает с пересчетом по таблице игроков."""
+        actual = collect_rollup(Player.objects.all())
+        stored = {}
+        for row in PlayerRollup.objects.all():
+            key = (
+                row.discipline_id,
+                row.city_id,
+                row.nosology_id,
+                row.birth_year,
+                row.gender,
+                row.addition_month,
+                row.is_primary,
+            )
+            stored[key] = stored.get(key, 0) + row.players_count
+        self.assertEqual({k: v for k, v in stored.items() if v}, actual)
+
+    def check_dashboards_equal(self, dict_param, queryset):
+        """Дашборд по сводке совпадает с дашбордом по игрокам."""
+        self.assertEqual(
+            get_rollup_dashboard(dict_param, queryset),
+            get_dashboard(queryset),
+        )
+
+    def test_rollup_dashboard(self):
+        """Дашборд по сводке с фильтрами и без них."""
+        self.check_rollup_actual()
+        self.check_dashboards_equal({}, Player.objects.all())
+        city = self.teams[0].city
+        self.check_dashboards_equal(
+            {"city": [str(city.pk)]},
+            Player.objects.filter(team__city=city),
+        )
+
+    def test_rollup_follows_changes(self):
+        """Сводка обновляется при изменении игроков и их команд."""
+        player = Player.objects.filter(team=self.teams[0]).first()
+        player.team.remove(self.teams[0])
+        self.check_rollup_actual()
+        self.teams[1].team_players.add(player)
+        self.check_rollup_actual()
+        player.gender = (
+            Gender.WOMAN if player.gender == Gender.MAN else Gender.MAN
+        )
+        player.save()
+        self.check_rollup_actual()
+        self.teams[1].city = City.objects.create(name="Новый город")
+        self.teams[1].save()
+        self.check_rollup_actual()
+        self.teams[0].delete()
+        self.check_rollup_actual()
+        player.delete()
+        self.check_rollup_actual()
+
+    def test_rebuild_rollup(self):
+        """Полный пересчет восстанавливает сводку."""
+        PlayerRollup.objects.all().delete()
+        rebuild_rollup(Player.objects.all())
+        self.check_rollup_actual()
+
+    def test_delta_queries(self):
+        """Число запросов не зависит от числа групп в пачке."""
+        PlayerRollup.objects.all().delete()
+
+        def groups(amount, value=1):
+            month = date(2024, 1, 1)
+            return Counter(
+                {
+                    (None, None, None, year, Gender.MAN, month, True): value
+                    for year in range(1900, 1900 + amount)
+                },
+            )
+
+        queries = []
+        for amount in (2, AnalyticsConstants.ROLLUP_DELTA_BATCH_SIZE):
+            with CaptureQueriesContext(connection) as context:
+                apply_rollup_delta(Counter(), groups(amount))
+                apply_rollup_delta(groups(amount, 2), groups(amount))
+            queries.append(len(context.captured_queries))
+        self.assertEqual(queries[0], queries[1])
+        amount = AnalyticsConstants.ROLLUP_DELTA_BATCH_SIZE * 2 + 1
+        apply_rollup_delta(Counter(), groups(amount, 3))
+        apply_rollup_delta(groups(amount), Counter())
+        self.assertEqual(PlayerRollup.objects.count(), amount)
+        self.assertEqual(
+            set(PlayerRollup.objects.values_list("players_count", flat=True)),
+            {2},
+        )
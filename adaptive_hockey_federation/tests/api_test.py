@@ -0,0 +1,210 @@
+from core.constants import ChangeAction, Role
+from core.models import ChangeLogEntry
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from main.data_factories.factories import (
+    DiagnosisFactory,
+    PlayerFactory,
+    TeamFactory,
+)
+from main.models import Player
+from tests.fixture_user import test_email, test_password
+from users.models import User
+
+PLAYERS_AMOUNT = 5
+
+
+@override_settings(API_PAGE_SIZE=2)
+class RegistryApiTest(TestCase):
+    """Тесты API реестра."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        cls.user = User.objects.create_superuser(
+            email=test_email,
+            password=test_password,
+        )
+        DiagnosisFactory.create()
+        TeamFactory.create()
+        PlayerFactory.create_batch(PLAYERS_AMOUNT)
+        cls.url = reverse("api:players-list", kwargs={"version": "v1"})
+
+    def setUp(self):
+        """Авторизация пользователя."""
+        self.client.force_login(self.user)
+
+    def test_cursor_pagination(self):
+        """Все игроки отдаются по курсору без пропусков и повторов."""
+        ids, url = [], f"{self.url}?format=json"
+        while url:
+            data = self.client.get(url).json()
+            ids.extend(item["id"] for item in data["results"])
+            url = data["next"]
+        self.assertEqual(
+            ids,
+            list(Player.objects.order_by("pk").values_list("pk", flat=True)),
+        )
+
+    def test_sparse_fieldset(self):
+        """Параметр fields оставляет только запрошенные поля."""
+        response = self.client.get(
+            self.url,
+            {"format": "json", "fields": "id,surname,teams"},
+        )
+        self.assertEqual(
+            set(response.json()["results"][0]),
+            {"id", "surname", "teams"},
+        )
+        response = self.client.get(
+            self.url,
+            {"format": "json", "fields": "id,password"},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_filter_by_ids(self):
+        """Параметр ids ограничивает список указанными записями."""
+        ids = list(Player.objects.values_list("pk", flat=True)[:2])
+        response = self.client.get(
+            self.url,
+            {"format": "json", "ids": ",".join(map(str, ids))},
+        )
+        self.assertEqual(
+            sorted(item["id"] for item in response.json()["results"]),
+            sorted(ids),
+        )
+
+    def test_queries_do_not_depend_on_page_size(self):
+        """Связи загружаются заранее, а не для каждой записи."""
+        with override_settings(API_PAGE_SIZE=PLAYERS_AMOUNT):
+            self.client.get(self.url, {"format": "json"})
+            with self.assertNumQueries(5):
+                response = self.client.get(self.url, {"format": "json"})
+        self.assertEqual(len(response.json()["results"]), PLAYERS_AMOUNT)
+
+    def test_not_modified(self):
+        """Повторный запрос с ETag получает 304."""
+        response = self.client.get(self.url, {"format": "json"})
+        response = self.client.get(
+            self.url,
+            {"format": "json"},
+            HTTP_IF_NONE_MATCH=response.headers["ETag"],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_permissions(self):
+        """Список доступен только с разрешением на страницу списка."""
+        self.client.logout()
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        user = User.objects.create_user(
+            password=test_password,
+            role=Role.AGENT,
+            email="agent@example.com",
+        )
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(
+            self.client.get(
+                reverse("api:competitions-list", kwargs={"version": "v1"}),
+            ).status_code,
+            403,
+        )
+        self.assertEqual(
+            self.client.get(
+                reverse("api:players-list", kwargs={"version": "v2"}),
+            ).status_code,
+            404,
+        )
+
+    def test_endpoints(self):
+        """Списки всех разделов и карточка игрока доступны."""
+        for basename in (
+            "players",
+            "teams",
+            "staff_team_members",
+            "competitions",
+        ):
+            with self.subTest(basename=basename):
+                response = self.client.get(
+                    reverse(f"api:{basename}-list", kwargs={"version": "v1"}),
+                    {"format": "json"},
+                )
+                self.assertEqual(response.status_code, 200)
+        player = Player.objects.first()
+        response = self.client.get(
+            reverse(
+                "api:players-detail",
+                kwargs={"version": "v1", "pk": player.pk},
+            ),
+            {"format": "json"},
+        )
+        self.assertEqual(response.json()["surname"], player.surname)
+
+
+@override_settings(CHANGE_FEED_LAG=0)
+class ChangeFeedTest(TestCase):
+    """Тесты ленты изменений."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        cls.user = User.objects.create_superuser(
+            email=test_email,
+            password=test_password,
+        )
+        DiagnosisFactory.create()
+        TeamFactory.create()
+        cls.url = reverse("api:changes", kwargs={"version": "v1"})
+
+    def setUp(self):
+        """Авторизация пользователя."""
+        self.client.force_login(self.user)
+
+    def get_feed(self, **params):
+        """Страница ленты изменений."""
+        return self.client.get(self.url, {"format": "json", **params}).json()
+
+    def test_feed_with_tombstones(self):
+        """Создание, изменение и удаление попадают в ленту по порядку."""
+        since = self.get_feed()["next_since"]
+        player = PlayerFactory.create()
+        player.number = 99
+        player.save()
+        player_id = player.pk
+        player.delete()
+        data = self.get_feed(since=since, models="main.player")
+        self.assertFalse(data["more"])
+        changes = [
+            (item["object_id"], item["action"]) for item in data["results"]
+        ]
+        self.assertEqual(changes[0], (player_id, ChangeAction.CREATED))
+        self.assertEqual(changes[-1], (player_id, ChangeAction.DELETED))
+        self.assertIn((player_id, ChangeAction.UPDATED), changes)
+        self.assertEqual(
+            self.get_feed(since=data["next_since"])["results"],
+            [],
+        )
+
+    def test_feed_paging(self):
+        """Лента отдается страницами от номера since."""
+        PlayerFactory.create_batch(3)
+        entries = list(ChangeLogEntry.objects.order_by("pk"))
+        data = self.get_feed(page_size=2)
+        self.assertTrue(data["more"])
+        self.assertEqual(data["next_since"], entries[1].pk)
+        data = self.get_feed(since=data["next_since"], page_size=100)
+        self.assertEqual(
+            [item["seq"] for item in data["results"]],
+            [entry.pk for entry in entries[2:]],
+        )
+
+    def test_entries_written_in_transaction(self):
+        """Записи журнала пишутся и откатываются вместе с изменением."""
+        PlayerFactory.create()
+        self.assertTrue(ChangeLogEntry.objects.exists())
+        count = ChangeLogEntry.objects.count()
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            PlayerFactory.create()
+            raise RuntimeError
+        self.assertEqual(ChangeLogEntry.objects.count(), count)
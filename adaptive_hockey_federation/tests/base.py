@@ -29,7 +29,7 @@ from main.models import (
 )
 from tests.fixture_user import test_role_user
 from tests.url_test import TEST_GROUP_NAME
-from tests.utils import render_url
+from tests.utils import fill_team, render_url
 from users.factories import UserFactory
 from users.models import ProxyGroup, User
 
@@ -81,6 +81,7 @@ class BaseTestClass(TestCase):
         cls.player = PlayerFactory.create()
         cls.staff = StaffTeamMemberFactory.create()
         cls.document = DocumentFactory.create(player=cls.player)
+        fill_team(cls.team)
 
 
 class UrlTestMixin:
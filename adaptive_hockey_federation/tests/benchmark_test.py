@@ -0,0 +1,55 @@
+from core.benchmark import (
+    BenchmarkCase,
+    BenchmarkResult,
+    find_regressions,
+    get_percentile,
+    measure_case,
+)
+from django.test import TestCase
+from users.models import User
+
+
+def make_result(**metrics) -> BenchmarkResult:
+    """Результат замера со значениями по умолчанию."""
+    values = {
+        "p50_ms": 10.0,
+        "p90_ms": 20.0,
+        "p99_ms": 30.0,
+        "queries": 5,
+        "peak_memory_kb": 100,
+        **metrics,
+    }
+    return BenchmarkResult(name="players", **values)
+
+
+class BenchmarkTest(TestCase):
+    """Тесты замеров скорости представлений."""
+
+    def test_percentile(self):
+        """Перцентили по выборке замеров."""
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(get_percentile(values, 50), 50.5)
+        self.assertEqual(get_percentile([7.0], 99), 7.0)
+
+    def test_regressions(self):
+        """Ухудшение сверх допуска и лишние запросы к БД."""
+        baseline = {"results": {"players": vars(make_result())}}
+        self.assertEqual(
+            find_regressions(baseline, [make_result(p50_ms=11.9)], 0.2),
+            [],
+        )
+        regressions = find_regressions(
+            baseline,
+            [make_result(p90_ms=25.0, queries=6)],
+            0.2,
+        )
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("players: p90_ms"))
+        self.assertTrue(regressions[1].startswith("players: queries"))
+
+    def test_measure_case(self):
+        """Число запросов к БД - максимум по замерам."""
+        case = BenchmarkCase("users", lambda: list(User.objects.all()))
+        result = measure_case(case, repeat=3, warmup=1)
+        self.assertEqual(result.queries, 1)
+        self.assertLessEqual(result.p50_ms, result.p99_ms)
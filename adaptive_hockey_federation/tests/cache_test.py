@@ -0,0 +1,87 @@
+from core.cache import DictionaryCache, dictionary_cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from main.models import City
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "dictionary-cache-test",
+    },
+}
+DATABASE_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+    },
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, DICTIONARY_CACHE_LOCAL_SIZE=2)
+class DictionaryCacheTest(TestCase):
+    """Тесты кеша справочников."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        cls.city = City.objects.create(name="Тверь")
+
+    def setUp(self):
+        """Пустые кеши перед каждым тестом."""
+        dictionary_cache.clear_local()
+        dictionary_cache.shared.clear()
+        self.addCleanup(dictionary_cache.clear_local)
+
+    def test_get_by_name_cached(self):
+        """Повторный поиск по имени не обращается к БД."""
+        with self.assertNumQueries(1):
+            self.assertEqual(City.get_by_name(" Тверь "), self.city)
+            self.assertEqual(City.get_by_name("Тверь"), self.city)
+        dictionary_cache.clear_local()
+        with self.assertNumQueries(0):
+            self.assertEqual(City.get_by_name("Тверь"), self.city)
+
+    def test_missing_name_cached(self):
+        """Отсутствие объекта тоже кешируется до изменения справочника."""
+        with self.assertNumQueries(1):
+            self.assertIsNone(City.get_by_name("Псков"))
+            self.assertIsNone(City.get_by_name("Псков"))
+        city = City.objects.create(name="Псков")
+        self.assertEqual(City.get_by_name("Псков"), city)
+
+    def test_invalidated_on_save_and_delete(self):
+        """Изменение и удаление записи сбрасывают кеш справочника."""
+        City.get_by_name("Тверь")
+        self.city.name = "Старая Тверь"
+        self.city.save()
+        self.assertIsNone(City.get_by_name("Тверь"))
+        self.assertEqual(City.get_by_name("Старая Тверь"), self.city)
+        self.city.delete()
+        self.assertIsNone(City.get_by_name("Старая Тверь"))
+
+    def test_local_cache_size(self):
+        """Кеш процесса хранит не больше DICTIONARY_CACHE_LOCAL_SIZE."""
+        for name in ("Тверь", "Псков", "Пермь"):
+            City.get_by_name(name)
+        self.assertEqual(len(dictionary_cache._local), 2)
+
+
+@override_settings(
+    CACHES=DATABASE_CACHES,
+    DICTIONARY_CACHE_VERSION_TTL=0,
+)
+class SharedDictionaryCacheTest(TestCase):
+    """Тесты кеша справочников в общей для процессов таблице БД."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание таблицы кеша."""
+        call_command("createcachetable", verbosity=0)
+
+    def test_other_process_sees_changes(self):
+        """Изменение справочника в одном процессе видно в другом."""
+        other = DictionaryCache()
+        self.addCleanup(dictionary_cache.clear_local)
+        self.assertIsNone(other.get_or_set(City, "Псков", lambda: None))
+        city = City.objects.create(name="Псков")
+        self.assertEqual(other.get_or_set(City, "Псков", lambda: city), city)
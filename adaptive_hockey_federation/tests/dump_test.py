@@ -0,0 +1,102 @@
+import datetime
+import io
+import shutil
+import tempfile
+
+from core.dump import (
+    dump_database,
+    get_dump_models,
+    load_restore_state,
+    restore_database,
+    save_restore_state,
+)
+from django.core.management import call_command
+from django.test import TestCase
+from main.data_factories.factories import TeamFactory
+from main.models import StaffMember, Team
+from tests.fixture_user import test_email, test_password
+from unloads.models import Unload
+from users.models import User
+
+
+class DumpTest(TestCase):
+    """Тесты дампа и восстановления БД."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание данных для дампа."""
+        user = User.objects.create_superuser(
+            email=test_email,
+            password=test_password,
+        )
+        TeamFactory.create_batch(3)
+        StaffMember.objects.create(
+            name="Иван",
+            surname="Петров",
+            patronymic="Сергеевич",
+            phone="+79161234567",
+        )
+        Unload.objects.filter(
+            pk=Unload.objects.create(user=user, page_name="players").pk,
+        ).update(date=datetime.date(2020, 1, 1))
+
+    def setUp(self):
+        """Каталог дампа."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_models_in_dependency_order(self):
+        """Модели идут после моделей, на которые ссылаются."""
+        models = get_dump_models()
+        for index, model in enumerate(models):
+            for field in model._meta.concrete_fields:
+                if field.is_relation and field.related_model is not model:
+                    with self.subTest(field=str(field)):
+                        self.assertIn(field.related_model, models[:index])
+
+    def test_round_trip(self):
+        """Восстановленная БД совпадает с выгруженной."""
+        teams = list(Team.objects.order_by("pk").values())
+        staff = list(StaffMember.objects.order_by("pk").values())
+        unloads = list(Unload.objects.order_by("pk").values())
+        call_command(
+            "export-db",
+            output=self.directory,
+            workers=1,
+            chunk_rows=2,
+            stdout=io.StringIO(),
+        )
+        Team.objects.all().delete()
+        StaffMember.objects.all().delete()
+        Unload.objects.all().delete()
+        call_command("import-db", input=self.directory, stdout=io.StringIO())
+        self.assertEqual(list(Team.objects.order_by("pk").values()), teams)
+        self.assertEqual(
+            list(StaffMember.objects.order_by("pk").values()),
+            staff,
+        )
+        self.assertEqual(list(Unload.objects.order_by("pk").values()), unloads)
+        self.assertEqual(unloads[0]["date"], datetime.date(2020, 1, 1))
+        self.assertEqual(load_restore_state(self.directory), set())
+
+    def test_resume(self):
+        """Продолжение импорта пропускает загруженные части."""
+        manifest = dump_database(self.directory, workers=1, chunk_rows=2)
+        chunks = next(
+            entry["chunks"]
+            for entry in manifest["models"]
+            if entry["model"] == "main.team"
+        )
+        restore_database(self.directory)
+        Team.objects.filter(
+            pk__in=Team.objects.order_by("pk").values("pk")[2:],
+        ).delete()
+        completed = {
+            name
+            for entry in manifest["models"]
+            for name in entry["chunks"]
+            if name not in chunks[1:]
+        }
+        save_restore_state(self.directory, completed)
+        restore_database(self.directory, resume=True)
+        self.assertEqual(Team.objects.count(), 3)
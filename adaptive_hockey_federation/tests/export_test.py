@@ -0,0 +1,264 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from core.config.openpyxl.settings import COLUMN_WIDTH_PADDING, ROWS_FILL
+from core.constants import ExportConstants, Role, UnloadStatus
+from core.utils import append_rows, export_excel
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.signals import request_started
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from main.data_factories.factories import DiagnosisFactory, PlayerFactory
+from main.models import Player
+from openpyxl import Workbook, load_workbook
+from tests.fixture_user import test_email, test_password
+from unloads.jobs import (
+    RESUME_DISPATCH_UID,
+    claim_unload,
+    drain_unloads,
+    process_unload,
+    resume_on_startup,
+)
+from unloads.models import Unload
+from users.models import User
+
+PLAYER_FIELDS_ORDER = [
+    "surname",
+    "name",
+    "diagnosis",
+    "is_captain",
+    "birthday",
+]
+PLAYERS_AMOUNT = 5
+
+
+class ExportExcelTest(TestCase):
+    """Тесты потоковой выгрузки данных в excel."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        DiagnosisFactory.create()
+        PlayerFactory.create_batch(PLAYERS_AMOUNT)
+        Player.objects.filter(
+            pk=Player.objects.order_by("pk").first().pk,
+        ).update(is_captain=True)
+
+    def setUp(self):
+        """Временная директория для файлов выгрузки."""
+        self.media_root = tempfile.mkdtemp()
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, True)
+
+    def load_sheet(self, filename):
+        """Открыть лист созданного файла выгрузки."""
+        path = os.path.join(self.media_root, "unloads_data", filename)
+        return load_workbook(path)["Лист1"]
+
+    def test_export_players(self):
+        """Выгрузка содержит заголовки, данные и подписи связей."""
+        queryset = Player.objects.order_by("pk")
+        filename = export_excel(
+            queryset,
+            "players.xlsx",
+            "Данные игроков",
+            ["id"],
+            PLAYER_FIELDS_ORDER,
+        )
+        ws = self.load_sheet(filename)
+        rows = list(ws.iter_rows(values_only=True))
+        self.assertEqual(rows[0][1], "Данные игроков")
+        self.assertEqual(
+            rows[1],
+            ("Фамилия", "Имя", "Диагноз", "Капитан", "Дата рождения"),
+        )
+        self.assertEqual(len(rows), queryset.count() + 2)
+        for row, player in zip(rows[2:], queryset, strict=True):
+            self.assertEqual(row[0], player.surname)
+            self.assertEqual(row[2], str(player.diagnosis))
+            self.assertEqual(row[3], "да" if player.is_captain else None)
+            self.assertEqual(row[4], str(player.birthday))
+
+    def test_export_styles_and_widths(self):
+        """Ширина колонок и заливка строк задаются за один проход."""
+        filename = export_excel(
+            Player.objects.order_by("pk"),
+            "players.xlsx",
+            "Данные игроков",
+            ["id"],
+            PLAYER_FIELDS_ORDER,
+        )
+        ws = self.load_sheet(filename)
+        max_surname = max(
+            len(value)
+            for value in Player.objects.values_list("surname", flat=True)
+        )
+        self.assertEqual(
+            ws.column_dimensions["A"].width,
+            max(max_surname, len("Фамилия")) + COLUMN_WIDTH_PADDING,
+        )
+        self.assertEqual(ws["A3"].fill.fgColor.rgb, ROWS_FILL.fgColor.rgb)
+        self.assertNotEqual(ws["A4"].fill.fgColor.rgb, ROWS_FILL.fgColor.rgb)
+
+    def test_heartbeat_while_writing(self):
+        """При записи книги heartbeat вызывается после каждой порции."""
+        ws = Workbook(write_only=True).create_sheet()
+        heartbeat = mock.Mock()
+        append_rows(
+            ws,
+            [["строка"]] * (ExportConstants.CHUNK_SIZE * 2 + 1),
+            heartbeat,
+        )
+        ws.close()
+        self.assertEqual(heartbeat.call_count, 2)
+
+    def test_export_queries_do_not_depend_on_rows(self):
+        """Количество запросов не зависит от числа выгружаемых записей."""
+        with self.assertNumQueries(2):
+            export_excel(
+                Player.objects.all(),
+                "players.xlsx",
+                "Данные игроков",
+                ["id"],
+                ["surname", "diagnosis"],
+            )
+
+    def test_export_empty_queryset(self):
+        """Для пустой выборки выгружается только заголовок."""
+        filename = export_excel(
+            Player.objects.none(),
+            "players.xlsx",
+            "Данные игроков",
+        )
+        rows = list(self.load_sheet(filename).iter_rows(values_only=True))
+        self.assertEqual(rows, [(None, "Данные игроков")])
+
+
+@override_settings(UNLOADS_RUN_IN_PROCESS=False)
+class UnloadJobTest(TestCase):
+    """Тесты фоновых задач выгрузки."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        DiagnosisFactory.create()
+        PlayerFactory.create_batch(PLAYERS_AMOUNT)
+        cls.user = User.objects.create_user(
+            password=test_password,
+            role=Role.AGENT,
+            email=test_email,
+        )
+
+    def setUp(self):
+        """Временная директория для файлов выгрузки."""
+        self.media_root = tempfile.mkdtemp()
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, True)
+
+    def test_export_view_enqueues_unload(self):
+        """Запрос выгрузки ставит задачу в очередь и не формирует файл."""
+        self.client.force_login(self.user)
+        response = self.client.get("/unloads/players/")
+        self.assertRedirects(
+            response,
+            "/unloads/",
+            fetch_redirect_response=False,
+        )
+        unload = Unload.objects.get()
+        self.assertEqual(unload.status, UnloadStatus.PENDING)
+        self.assertEqual(unload.page_name, "players")
+        self.assertFalse(unload.unload_file_slug)
+        self.user.user_permissions.add(
+            Permission.objects.get(codename="list_view_unload"),
+        )
+        self.assertContains(
+            self.client.get("/unloads/"),
+            "поставлена в очередь",
+        )
+
+    def test_process_unload(self):
+        """Задача захватывается один раз и формирует файл выгрузки."""
+        unload = Unload.objects.create(user=self.user, page_name="players")
+        self.assertTrue(claim_unload(unload.pk))
+        self.assertFalse(claim_unload(unload.pk))
+        process_unload(Unload.objects.get(pk=unload.pk))
+        unload.refresh_from_db()
+        self.assertEqual(unload.status, UnloadStatus.READY)
+        self.assertEqual(unload.progress, 100)
+        self.assertEqual(unload.rows_count, Player.objects.count())
+        self.assertIsNotNone(unload.duration)
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(self.media_root, unload.unload_file_slug.name),
+            ),
+        )
+
+    def test_process_unload_failure(self):
+        """Ошибка формирования сохраняется в задаче."""
+        unload = Unload.objects.create(user=self.user, page_name="unknown")
+        process_unload(unload)
+        unload.refresh_from_db()
+        self.assertEqual(unload.status, UnloadStatus.FAILED)
+        self.assertTrue(unload.error)
+
+    def test_reclaimed_unload_not_saved(self):
+        """Результат не сохраняется, если задачу забрал другой исполнитель."""
+        unload = Unload.objects.create(user=self.user, page_name="players")
+        claim_unload(unload.pk)
+        stamp = timezone.now() + timedelta(seconds=1)
+
+        def reclaim(*args, **kwargs):
+            Unload.objects.filter(pk=unload.pk).update(locked_at=stamp)
+            return "players_all.xlsx"
+
+        with mock.patch("unloads.jobs.export_excel", side_effect=reclaim):
+            process_unload(Unload.objects.get(pk=unload.pk))
+        unload.refresh_from_db()
+        self.assertEqual(unload.status, UnloadStatus.IN_PROGRESS)
+        self.assertEqual(unload.locked_at, stamp)
+        self.assertFalse(unload.unload_file_slug)
+
+    @override_settings(UNLOADS_RUN_IN_PROCESS=True)
+    def test_resume_on_startup(self):
+        """Очередь разбирается после первого запроса, а не в каждом."""
+        request_started.connect(
+            resume_on_startup,
+            dispatch_uid=RESUME_DISPATCH_UID,
+        )
+        self.addCleanup(
+            request_started.disconnect,
+            dispatch_uid=RESUME_DISPATCH_UID,
+        )
+        self.client.force_login(self.user)
+        with mock.patch("unloads.jobs.get_executor") as executor:
+            for _ in range(2):
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.client.get("/unloads/")
+        executor.return_value.submit.assert_called_once_with(drain_unloads)
+
+    def test_stale_unload_reclaimed(self):
+        """Зависшая после перезапуска задача формируется заново."""
+        timeout = timedelta(seconds=settings.UNLOADS_LOCK_TIMEOUT + 1)
+        stale, active = (
+            Unload.objects.create(
+                user=self.user,
+                page_name="players",
+                status=UnloadStatus.IN_PROGRESS,
+                locked_at=locked_at,
+            )
+            for locked_at in (timezone.now() - timeout, timezone.now())
+        )
+        self.assertEqual(drain_unloads(), 1)
+        stale.refresh_from_db()
+        active.refresh_from_db()
+        self.assertEqual(stale.status, UnloadStatus.READY)
+        self.assertIsNone(stale.locked_at)
+        self.assertEqual(active.status, UnloadStatus.IN_PROGRESS)
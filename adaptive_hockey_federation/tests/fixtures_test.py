@@ -0,0 +1,29 @@
+import io
+import json
+
+from core.fixtures import iter_json_array
+from django.test import SimpleTestCase
+
+
+class IterJsonArrayTest(SimpleTestCase):
+    """Тесты потокового чтения JSON-массива."""
+
+    def test_items_across_chunks(self):
+        """Элементы, разрезанные границей порции, читаются целиком."""
+        data = [
+            {"id": index, "name": "]" * index, "values": [index, 2.5]}
+            for index in range(20)
+        ] + [12345, -1.5e3, "текст", None, True]
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+        for read_size in (1, 7, len(text)):
+            with self.subTest(read_size=read_size):
+                self.assertEqual(
+                    list(iter_json_array(io.StringIO(text), read_size)),
+                    data,
+                )
+
+    def test_invalid_json(self):
+        """Обрезанный файл и не-массив вызывают ValueError."""
+        for text in ('[{"id": 1}', '{"id": 1}'):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                list(iter_json_array(io.StringIO(text), 4))
@@ -0,0 +1,59 @@
+import io
+
+from core.constants import ScaleConstants
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.test import TestCase
+from main.data_factories.bulk import MassDataGenerator
+from main.data_factories.factories import PlayerFactory
+from main.models import Player, Team
+from tests.fixture_user import test_email, test_password
+from users.models import User
+
+
+class MassDataTest(TestCase):
+    """Тесты массовой генерации тестовых данных."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание куратора команд."""
+        User.objects.create_superuser(email=test_email, password=test_password)
+
+    def test_scale(self):
+        """Игроки распределены по командам, в команде один капитан."""
+        call_command("fill-test-db", scale=1, stdout=io.StringIO())
+        self.assertEqual(Player.objects.count(), ScaleConstants.PLAYERS)
+        self.assertEqual(Team.objects.count(), ScaleConstants.TEAMS)
+        self.assertFalse(Player.objects.filter(team=None).exists())
+        self.assertEqual(
+            set(
+                Team.objects.annotate(
+                    captains=Count(
+                        "team_players",
+                        filter=Q(team_players__is_captain=True),
+                    ),
+                    players=Count("team_players"),
+                )
+                .filter(players__gt=0)
+                .values_list("captains", flat=True),
+            ),
+            {1},
+        )
+
+    def test_seed(self):
+        """Одинаковый seed дает одинаковые данные."""
+        people = [
+            [
+                (player.surname, player.name, player.birthday)
+                for player in MassDataGenerator(seed).build_people(
+                    PlayerFactory,
+                    50,
+                    set(),
+                    diagnosis=None,
+                    discipline_name=None,
+                )
+            ]
+            for seed in (1, 1, 2)
+        ]
+        self.assertEqual(people[0], people[1])
+        self.assertNotEqual(people[0], people[2])
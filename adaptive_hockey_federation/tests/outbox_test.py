@@ -0,0 +1,116 @@
+from unittest import mock
+
+from core.constants import MailStatus
+from core.models import OutgoingEmail
+from core.outbox import drain_outbox, queue_emails
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+from django.template import loader
+from django.test import SimpleTestCase, TestCase, override_settings
+from users.utilits.render import render_email_message, render_email_messages
+
+MESSAGES_AMOUNT = 3
+
+
+def make_message(index: int) -> EmailMultiAlternatives:
+    """Письмо с HTML-версией."""
+    message = EmailMultiAlternatives(
+        subject=f"Письмо {index}",
+        body="Текст",
+        from_email="noreply@example.com",
+        to=[f"user{index}@example.com"],
+    )
+    message.attach_alternative(f"<p>Письмо {index}</p>", "text/html")
+    return message
+
+
+@override_settings(
+    MAIL_OUTBOX_RUN_IN_PROCESS=False,
+    MAIL_OUTBOX_MAX_ATTEMPTS=2,
+)
+class MailOutboxTest(TestCase):
+    """Тесты очереди исходящих писем."""
+
+    def test_queue_does_not_send(self):
+        """Постановка в очередь не отправляет письма."""
+        with self.assertNumQueries(1):
+            queue_emails(make_message(index) for index in range(2))
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(
+            OutgoingEmail.objects.filter(status=MailStatus.PENDING).count(),
+            2,
+        )
+
+    def test_drain_uses_one_connection(self):
+        """Очередь отправляется через одно соединение."""
+        queue_emails(make_message(index) for index in range(MESSAGES_AMOUNT))
+        with mock.patch(
+            "core.outbox.get_connection",
+            wraps=mail.get_connection,
+        ) as get_connection:
+            self.assertEqual(drain_outbox(), MESSAGES_AMOUNT)
+        get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), MESSAGES_AMOUNT)
+        self.assertEqual(
+            mail.outbox[0].alternatives,
+            [("<p>Письмо 0</p>", "text/html")],
+        )
+        self.assertFalse(
+            OutgoingEmail.objects.exclude(status=MailStatus.SENT).exists(),
+        )
+
+    def test_retry_with_backoff(self):
+        """Ошибка отправки откладывает письмо, затем помечает его ошибкой."""
+        email = queue_emails([make_message(0)])[0]
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=OSError("Сервер недоступен"),
+        ):
+            self.assertEqual(drain_outbox(), 0)
+            email.refresh_from_db()
+            self.assertEqual(email.status, MailStatus.PENDING)
+            self.assertEqual(email.attempts, 1)
+            self.assertGreater(email.next_attempt_at, email.created_at)
+            OutgoingEmail.objects.update(next_attempt_at=email.created_at)
+            drain_outbox()
+        email.refresh_from_db()
+        self.assertEqual(email.status, MailStatus.FAILED)
+        self.assertEqual(email.error, "Сервер недоступен")
+
+
+class RenderEmailMessagesTest(SimpleTestCase):
+    """Тесты визуализации писем пачкой."""
+
+    template = "emailing/welcome_letter.html"
+
+    def test_bulk_matches_single(self):
+        """Шаблон загружается один раз, письма совпадают с одиночными."""
+        common_context = {"competition": {"title": "Кубок"}}
+        recipients = [
+            ([f"user{index}@example.com"], {"link_to_info": f"/{index}/"})
+            for index in range(MESSAGES_AMOUNT)
+        ]
+        with mock.patch(
+            "users.utilits.render.get_template",
+            wraps=loader.get_template,
+        ) as get_template:
+            messages = render_email_messages(
+                "Тема",
+                recipients,
+                "noreply@example.com",
+                self.template,
+                common_context,
+            )
+        get_template.assert_called_once_with(self.template)
+        self.assertEqual(len(messages), MESSAGES_AMOUNT)
+        for message, (to, context) in zip(messages, recipients, strict=True):
+            single = render_email_message(
+                "Тема",
+                {**common_context, **context},
+                "noreply@example.com",
+                to,
+                self.template,
+            )
+            self.assertEqual(message.to, to)
+            self.assertEqual(message.alternatives, single.alternatives)
+            self.assertIn(context["link_to_info"], message.alternatives[0][0])
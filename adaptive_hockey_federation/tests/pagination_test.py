@@ -0,0 +1,125 @@
+from core.pagination import KeysetPaginator
+from django.core.paginator import InvalidPage
+from django.test import TestCase
+from main.models import DisciplineLevel, DisciplineName
+from tests.fixture_user import test_email, test_password
+from unloads.models import Unload
+from users.models import User
+
+LEVELS_AMOUNT = 7
+PER_PAGE = 3
+
+
+class KeysetPaginatorTest(TestCase):
+    """Тесты keyset-пагинации."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Уровни дисциплины с повторяющимися названиями."""
+        discipline = DisciplineName.objects.create(name="Тестовая")
+        DisciplineLevel.objects.bulk_create(
+            DisciplineLevel(
+                name=f"Уровень {index // 2}",
+                discipline_name=discipline,
+            )
+            for index in range(LEVELS_AMOUNT)
+        )
+        cls.levels = DisciplineLevel.objects.filter(
+            discipline_name=discipline,
+        )
+
+    def setUp(self):
+        """Пагинатор по названию уровня."""
+        self.paginator = KeysetPaginator(self.levels, PER_PAGE, ["name"])
+
+    def walk_forward(self):
+        """Все страницы от первой к последней."""
+        pages = [self.paginator.page(None)]
+        while pages[-1].has_next():
+            pages.append(self.paginator.page(pages[-1].next_cursor))
+        return pages
+
+    def test_forward_covers_all_rows(self):
+        """Страницы вперед содержат все записи по порядку без повторов."""
+        pages = self.walk_forward()
+        rows = [level.pk for page in pages for level in page]
+        self.assertEqual(
+            rows,
+            list(
+                self.levels.order_by("name", "pk").values_list(
+                    "pk",
+                    flat=True,
+                ),
+            ),
+        )
+        self.assertFalse(pages[0].has_previous())
+        self.assertTrue(pages[-1].has_previous())
+
+    def test_descending(self):
+        """Обратная сортировка листается в обратном порядке."""
+        self.paginator = KeysetPaginator(self.levels, PER_PAGE, ["-name"])
+        rows = [level.pk for page in self.walk_forward() for level in page]
+        self.assertEqual(
+            rows,
+            list(
+                self.levels.order_by("-name", "-pk").values_list(
+                    "pk",
+                    flat=True,
+                ),
+            ),
+        )
+
+    def test_backward_returns_previous_page(self):
+        """Курсор назад возвращает ту же предыдущую страницу."""
+        pages = self.walk_forward()
+        for previous, page in zip(pages, pages[1:], strict=False):
+            back = self.paginator.page(page.previous_cursor)
+            self.assertEqual(list(back), list(previous))
+            self.assertTrue(back.has_next())
+
+    def test_page_queries(self):
+        """Любая страница выбирается одним запросом."""
+        cursor = self.walk_forward()[-1].previous_cursor
+        with self.assertNumQueries(1):
+            self.paginator.page(cursor)
+
+    def test_invalid_cursor(self):
+        """Испорченный курсор вызывает InvalidPage."""
+        for cursor in ("abc", "W10=", "WyJ4IiwgW11d"):
+            with self.assertRaises(InvalidPage):
+                self.paginator.page(cursor)
+
+
+class KeysetListViewTest(TestCase):
+    """Тесты keyset-пагинации в списках."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание пользователя."""
+        cls.user = User.objects.create_superuser(
+            email=test_email,
+            password=test_password,
+        )
+
+    def setUp(self):
+        """Авторизация пользователя."""
+        self.client.force_login(self.user)
+
+    def test_unloads_list(self):
+        """Список выгрузок листается курсором, а не номером страницы."""
+        Unload.objects.bulk_create(
+            Unload(user=self.user, unload_name=f"Выгрузка {index}")
+            for index in range(LEVELS_AMOUNT + PER_PAGE + 1)
+        )
+        response = self.client.get("/unloads/")
+        self.assertTrue(response.context["keyset_pagination"])
+        page = response.context["page_obj"]
+        self.assertTrue(page.has_next())
+        response = self.client.get(f"/unloads/?{page.next_query}")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["page_obj"].has_previous())
+
+    def test_invalid_cursor(self):
+        """Неверный курсор в адресе дает 404."""
+        response = self.client.get("/unloads/", {"cursor": "abc"})
+        self.assertEqual(response.status_code, 404)
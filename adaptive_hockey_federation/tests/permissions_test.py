@@ -48,6 +48,8 @@ class TestPermissions(BaseTestClass):
                 self.assertEqual(fact, estimated, message)
             elif isinstance(estimated, (list, tuple)):
                 self.assertIn(fact, estimated, message)
+        for fact, limit, message in url_to_test.budget_results:
+            self.assertLessEqual(fact, limit, message)
 
     def batch_url_test(self, urls_to_test: Iterable[UrlToTest]):
         """Проводит sub-тесты для нескольких урл."""
@@ -0,0 +1,125 @@
+import csv
+import os
+import shutil
+import tempfile
+from datetime import date
+
+from django.core.management import call_command
+from django.test import TestCase
+from main.data_factories.factories import DiagnosisFactory, TeamFactory
+from main.models import Diagnosis, Player, Team
+from main.player_import import import_players
+from openpyxl import Workbook
+from tests.fixture_user import test_email, test_password
+from users.models import User
+
+HEADERS = (
+    "Фамилия",
+    "Имя",
+    "Отчество",
+    "Дата рождения",
+    "Пол",
+    "Игровая позиция",
+    "Диагноз",
+    "Команда",
+    "Капитан",
+)
+
+
+class PlayerImportTest(TestCase):
+    """Тесты пакетного импорта игроков."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание справочников."""
+        User.objects.create_superuser(email=test_email, password=test_password)
+        DiagnosisFactory.create()
+        TeamFactory.create()
+        cls.diagnosis = Diagnosis.objects.first().name
+        cls.team = Team.objects.first().name
+        cls.birthday = date(date.today().year - 10, 1, 1)
+
+    def setUp(self):
+        """Временная директория для файлов импорта."""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def make_row(self, surname, values=None):
+        """Строка файла импорта."""
+        row = {
+            "Фамилия": surname,
+            "Имя": "Иван",
+            "Отчество": "Иванович",
+            "Дата рождения": self.birthday.strftime("%d.%m.%Y"),
+            "Пол": "мужской",
+            "Игровая позиция": "Вратарь",
+            "Диагноз": self.diagnosis,
+            "Команда": self.team,
+            "Капитан": "",
+        }
+        row.update(values or {})
+        return [row[header] for header in HEADERS]
+
+    def write_csv(self, rows):
+        """CSV-файл с разделителем "точка с запятой"."""
+        path = os.path.join(self.directory, "players.csv")
+        with open(path, "w", encoding="utf-8-sig", newline="") as file:
+            writer = csv.writer(file, delimiter=";")
+            writer.writerow(HEADERS)
+            writer.writerows(rows)
+        return path
+
+    def test_import_csv(self):
+        """Корректные строки сохраняются, ошибочные попадают в отчет."""
+        path = self.write_csv(
+            [
+                self.make_row("Петров", {"Капитан": "да"}),
+                self.make_row("Сидоров"),
+                self.make_row("Петров"),
+                self.make_row("Smith"),
+                self.make_row("Орлов", {"Диагноз": "Неизвестный"}),
+                self.make_row("Волков", {"Дата рождения": "вчера"}),
+            ],
+        )
+        result = import_players(path)
+        self.assertEqual(result.rows, 6)
+        self.assertEqual(result.created, 2)
+        self.assertEqual(
+            [(error.row, error.column) for error in result.errors],
+            [
+                (4, "Фамилия"),
+                (5, "Фамилия"),
+                (6, "Диагноз"),
+                (7, "Дата рождения"),
+            ],
+        )
+        player = Player.objects.get(surname="Петров")
+        self.assertTrue(player.is_captain)
+        self.assertEqual(player.gender, "Мужской")
+        self.assertEqual(
+            list(player.team.values_list("name", flat=True)),
+            [self.team],
+        )
+
+    def test_dry_run(self):
+        """Проверка без сохранения находит дубликаты в файле."""
+        path = self.write_csv([self.make_row("Петров")] * 2)
+        result = import_players(path, dry_run=True)
+        self.assertEqual(result.created, 0)
+        self.assertEqual(len(result.errors), 1)
+        self.assertFalse(Player.objects.exists())
+
+    def test_import_xlsx_command(self):
+        """Команда импортирует книгу excel с заголовком над таблицей."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append((None, "Данные игроков"))
+        sheet.append(HEADERS)
+        for surname in ("Петров", "Сидоров"):
+            row = self.make_row(surname)
+            row[3] = self.birthday
+            sheet.append(row)
+        path = os.path.join(self.directory, "players.xlsx")
+        workbook.save(path)
+        call_command("import-players", path, stdout=open(os.devnull, "w"))
+        self.assertEqual(Player.objects.count(), 2)
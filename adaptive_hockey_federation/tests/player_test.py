@@ -1,9 +1,20 @@
 from datetime import datetime
 from typing import Any
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from main.data_factories.factories import DiagnosisFactory, PlayerFactory
-from main.models import Diagnosis, DisciplineLevel, DisciplineName, Player
+from main.models import (
+    City,
+    Diagnosis,
+    DisciplineLevel,
+    DisciplineName,
+    Player,
+    Team,
+)
+from tests.fixture_user import test_email, test_password
+from users.models import User
 
 
 class TestUser(TestCase):
@@ -118,3 +129,59 @@ class TestUser(TestCase):
         """Тест - удаление игрока."""
         delete_result = self.delete_player(self.player.id)
         self.assertTrue(delete_result, "Ошибка при удалении игрока")
+
+
+class TestPlayersListQueries(TestCase):
+    """Число запросов списка игроков не зависит от размера страницы."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        DiagnosisFactory.create()
+        cls.user = User.objects.create_superuser(
+            email=test_email,
+            password=test_password,
+        )
+        discipline = DisciplineName.objects.first()
+        cls.teams = [
+            Team.objects.create(
+                name=f"Команда {index}",
+                city=City.objects.create(name=f"Город {index}"),
+                discipline_name=discipline,
+            )
+            for index in range(2)
+        ]
+
+    def create_players(self, amount):
+        """Создать игроков с командами, уровнем и дисциплиной."""
+        for player in PlayerFactory.create_batch(amount):
+            player.discipline_level = DisciplineLevel.objects.create(
+                name=f"Уровень {player.pk}",
+                discipline_name=player.discipline_name,
+            )
+            player.save()
+            player.team.set(self.teams)
+
+    def count_queries(self, url):
+        """Количество запросов к БД при открытии страницы."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context)
+
+    def test_list_queries_do_not_depend_on_page_size(self):
+        """Списки игроков и аналитики, карточка игрока."""
+        self.client.force_login(self.user)
+        self.create_players(2)
+        urls = (
+            "/players/",
+            "/analytics/",
+            f"/players/{Player.objects.first().pk}/",
+        )
+        small_page = [self.count_queries(url) for url in urls]
+        self.create_players(8)
+        self.assertGreater(Player.objects.count(), 2)
+        self.assertEqual(
+            [self.count_queries(url) for url in urls],
+            small_page,
+        )
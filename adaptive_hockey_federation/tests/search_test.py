@@ -0,0 +1,153 @@
+from unittest import mock
+
+from core.constants import Role, TypeaheadConstants
+from core.search import (
+    SEARCH_CONFIG,
+    SEARCH_RANK,
+    build_search_query,
+    order_by_rank,
+    search_queryset,
+)
+from django.contrib.postgres.search import SearchQuery
+from django.test import TestCase
+from django.urls import reverse
+from main.data_factories.factories import (
+    CityFactory,
+    DiagnosisFactory,
+    PlayerFactory,
+    TeamFactory,
+)
+from main.models import City, Player, Team
+from tests.fixture_user import test_email, test_password
+from unloads.utils import players_get_queryset, teams_get_queryset
+from users.models import User
+
+PLAYERS_AMOUNT = 5
+
+
+class SearchTest(TestCase):
+    """Тесты поиска по индексу и запасного поиска по вхождению."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        DiagnosisFactory.create()
+        PlayerFactory.create_batch(PLAYERS_AMOUNT)
+        cls.player = Player.objects.order_by("pk").first()
+        cls.team = TeamFactory.create(
+            discipline_name=cls.player.discipline_name,
+            curator=None,
+        )
+        cls.team.team_players.add(cls.player)
+
+    def test_build_search_query(self):
+        """Каждое слово строки ищется как префикс."""
+        query = build_search_query("Иван, Петр-")
+        self.assertEqual(
+            query,
+            SearchQuery(
+                "Иван:* & Петр:*",
+                search_type="raw",
+                config=SEARCH_CONFIG,
+            ),
+        )
+        self.assertIsNone(build_search_query(" ,.- "))
+        self.assertEqual(
+            build_search_query("Иван", weights="A"),
+            SearchQuery("Иван:*A", search_type="raw", config=SEARCH_CONFIG),
+        )
+
+    def test_search_index_not_supported(self):
+        """Без PostgreSQL индекс поиска не используется."""
+        self.assertIsNone(search_queryset(Player.objects.all(), "Иван"))
+        self.assertNotIn(
+            SEARCH_RANK,
+            order_by_rank(Player.objects.all(), "surname").query.annotations,
+        )
+
+    def test_players_search_all_fallback(self):
+        """Поиск по всем полям находит игрока по вхождению фамилии."""
+        queryset = players_get_queryset(
+            Player,
+            {
+                "search_column": ["все"],
+                "search": [self.player.surname[1:]],
+            },
+            None,
+        )
+        self.assertIn(self.player, queryset)
+
+    def test_teams_name_fallback(self):
+        """Фильтр команд по названию находит команду по вхождению."""
+        queryset = teams_get_queryset(
+            Team,
+            {"name": [self.team.name[1:]]},
+            None,
+        )
+        self.assertIn(self.team, queryset)
+
+    def test_dictionary_rename_reindexes(self):
+        """Переименование дисциплины пересчитывает индекс игроков и команд."""
+        discipline = self.player.discipline_name
+        indexed = []
+        with mock.patch(
+            "main.models.update_search_vectors",
+            side_effect=lambda instances, using: indexed.extend(instances),
+        ):
+            discipline.name = "Новая дисциплина"
+            discipline.save()
+        self.assertCountEqual(
+            indexed,
+            [
+                *Player.objects.filter(discipline_name=discipline),
+                *Team.objects.filter(discipline_name=discipline),
+            ],
+        )
+        self.assertIn(self.player, indexed)
+        self.assertIn(self.team, indexed)
+
+
+class TypeaheadTest(TestCase):
+    """Тесты автодополнения справочников."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        CityFactory.create(name="Тверь")
+        CityFactory.create(name="Старая Тверь")
+        CityFactory.create_batch(TypeaheadConstants.PAGE_SIZE + 1)
+        cls.user = User.objects.create_user(
+            password=test_password,
+            role=Role.AGENT,
+            email=test_email,
+        )
+        cls.url = reverse("main:ajax_typeahead_cities")
+
+    def setUp(self):
+        """Авторизация пользователя."""
+        self.client.force_login(self.user)
+
+    def test_prefix_matches_first(self):
+        """Совпадения с начала названия идут раньше остальных."""
+        data = self.client.get(self.url, {"q": "Твер"}).json()
+        self.assertEqual(
+            [item["name"] for item in data["results"]],
+            ["Тверь", "Старая Тверь"],
+        )
+        self.assertFalse(data["more"])
+
+    def test_pages(self):
+        """Варианты отдаются страницами фиксированного размера."""
+        first = self.client.get(self.url).json()
+        second = self.client.get(self.url, {"page": 2}).json()
+        self.assertEqual(len(first["results"]), TypeaheadConstants.PAGE_SIZE)
+        self.assertTrue(first["more"])
+        self.assertEqual(
+            len(first["results"]) + len(second["results"]),
+            City.objects.count(),
+        )
+
+    def test_login_required(self):
+        """Автодополнение недоступно без авторизации."""
+        self.client.logout()
+        self.assertEqual(self.client.get(self.url).status_code, 302)
@@ -1,3 +1,4 @@
+MAX_QUERIES = "max_queries"
 PERMISSION_REQUIRED = "permission_required"
 URL = "url"
 
@@ -179,13 +180,33 @@ COMPETITION_POST_URLS = (
 )
 
 PLAYER_GET_URLS = (
-    {URL: "/players/", PERMISSION_REQUIRED: "list_view_player"},
-    {URL: "/players/<int:pk>/", PERMISSION_REQUIRED: "view_player"},
-    {URL: "/players/<int:pk>/edit/", PERMISSION_REQUIRED: "change_player"},
-    {URL: "/players/create/", PERMISSION_REQUIRED: "add_player"},
+    {
+        URL: "/players/",
+        PERMISSION_REQUIRED: "list_view_player",
+        MAX_QUERIES: 7,
+    },
+    {
+        URL: "/players/<int:pk>/",
+        PERMISSION_REQUIRED: "view_player",
+        MAX_QUERIES: 7,
+    },
+    {
+        URL: "/players/<int:pk>/edit/",
+        PERMISSION_REQUIRED: "change_player",
+        MAX_QUERIES: 13,
+    },
+    {
+        URL: "/players/create/",
+        PERMISSION_REQUIRED: "add_player",
+        MAX_QUERIES: 7,
+    },
 )
 PLAYER_POST_URLS = (
-    {URL: "/players/1/delete/", PERMISSION_REQUIRED: "delete_player"},
+    {
+        URL: "/players/1/delete/",
+        PERMISSION_REQUIRED: "delete_player",
+        MAX_QUERIES: 22,
+    },
     # TODO: Тест на данный урл выдает TemplateDoesNotExist. Необходимо
     #   раскомментировать, когда будет починен player_id_deleted() в
     #   main.views или вообще удалить, если эта страница не нужна.
@@ -207,18 +228,50 @@ STAFF_POST_URLS = (
     },
 )
 TEAM_GET_URLS = (
-    {URL: "/teams/", PERMISSION_REQUIRED: "list_view_team"},
-    {URL: "/teams/<int:team_id>/", PERMISSION_REQUIRED: "view_team"},
-    {URL: "/teams/<int:team_id>/edit/", PERMISSION_REQUIRED: "change_team"},
-    {URL: "/teams/create/", PERMISSION_REQUIRED: "add_team"},
+    {
+        URL: "/teams/",
+        PERMISSION_REQUIRED: "list_view_team",
+        MAX_QUERIES: 12,
+    },
+    {
+        URL: "/teams/<int:team_id>/",
+        PERMISSION_REQUIRED: "view_team",
+        MAX_QUERIES: 14,
+    },
+    {
+        URL: "/teams/<int:team_id>/edit/",
+        PERMISSION_REQUIRED: "change_team",
+        MAX_QUERIES: 10,
+    },
+    {
+        URL: "/teams/create/",
+        PERMISSION_REQUIRED: "add_team",
+        MAX_QUERIES: 6,
+    },
 )
 TEAM_POST_URLS = (
-    {URL: "/teams/<int:team_id>/delete/", PERMISSION_REQUIRED: "delete_team"},
+    {
+        URL: "/teams/<int:team_id>/delete/",
+        PERMISSION_REQUIRED: "delete_team",
+        MAX_QUERIES: 24,
+    },
 )
 USER_GET_URLS = (
-    {URL: "/users/", PERMISSION_REQUIRED: "list_view_user"},
-    {URL: "/users/<int:pk>/edit/", PERMISSION_REQUIRED: "change_user"},
-    {URL: "/users/create/", PERMISSION_REQUIRED: "add_user"},
+    {
+        URL: "/users/",
+        PERMISSION_REQUIRED: "list_view_user",
+        MAX_QUERIES: 6,
+    },
+    {
+        URL: "/users/<int:pk>/edit/",
+        PERMISSION_REQUIRED: "change_user",
+        MAX_QUERIES: 10,
+    },
+    {
+        URL: "/users/create/",
+        PERMISSION_REQUIRED: "add_user",
+        MAX_QUERIES: 7,
+    },
     {
         URL: "/users/set_password/<uidb64>/<token>/",
         PERMISSION_REQUIRED: None,
@@ -226,9 +279,19 @@ USER_GET_URLS = (
     },
 )
 USER_POST_URLS = (
-    {URL: "/users/<int:pk>/delete/", PERMISSION_REQUIRED: "delete_user"},
+    {
+        URL: "/users/<int:pk>/delete/",
+        PERMISSION_REQUIRED: "delete_user",
+        MAX_QUERIES: 13,
+    },
+)
+UNLOAD_URLS = (
+    {
+        URL: "/unloads/",
+        PERMISSION_REQUIRED: "list_view_unload",
+        MAX_QUERIES: 5,
+    },
 )
-UNLOAD_URLS = ({URL: "/unloads/", PERMISSION_REQUIRED: "list_view_unload"},)
 
 # Страницы админки, которые должны возвращать 200(ОК) для пользователя,
 # обладающего правами администратора:
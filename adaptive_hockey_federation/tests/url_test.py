@@ -21,7 +21,7 @@ from tests.fixture_user import (
     test_role_admin,
     test_role_user,
 )
-from tests.utils import UrlToTest
+from tests.utils import UrlToTest, fill_team
 from users.models import ProxyGroup, User
 
 TEST_GROUP_NAME = "no_permission_group"
@@ -117,6 +117,7 @@ class TestUrls(TestCase):
         cls.player.team.clear()
         cls.player_2.team.clear()
         cls.player_2.team.add(cls.team_2)
+        fill_team(cls.team)
 
     def setUp(self):
         """Метод для базовой настройки тестов класса."""
@@ -180,21 +181,35 @@ class TestUrls(TestCase):
         UrlToTest в список urls (см. документацию к классу UrlToTest).
         """
         urls = [
-            UrlToTest("/"),
+            UrlToTest("/", max_queries=2),
             UrlToTest(
                 "/admin/",
                 admin_only=True,
                 unauthorized_code_estimated=HTTPStatus.FOUND,
+                max_queries=5,
+            ),
+            UrlToTest(
+                "/auth/login/",
+                authorized_only=False,
+                max_queries=0,
             ),
-            UrlToTest("/auth/login/", authorized_only=False),
             UrlToTest(
                 "/auth/logout/",
                 code_estimated=HTTPStatus.FOUND,
                 use_post=True,
+                max_queries=4,
+            ),
+            UrlToTest("/auth/password_change/", max_queries=2),
+            UrlToTest(
+                "/auth/password_reset/",
+                authorized_only=False,
+                max_queries=0,
+            ),
+            UrlToTest(
+                "/analytics/",
+                permission_required="list_view_player",
+                max_queries=14,
             ),
-            UrlToTest("/auth/password_change/"),
-            UrlToTest("/auth/password_reset/", authorized_only=False),
-            UrlToTest("/analytics/", permission_required="list_view_player"),
             # TODO Нужно доработать тесты соревнования согласно правам доступа.
             # UrlToTest(
             # "/competitions/", permission_required="list_view_competition"
@@ -206,22 +221,70 @@ class TestUrls(TestCase):
             # ),
             # TODO Раскомментировать при доработке пермишенов для страниц с
             #  игроками.
-            UrlToTest("/players/create/", permission_required="add_player"),
-            UrlToTest("/players/", permission_required="list_view_player"),
+            UrlToTest(
+                "/players/create/",
+                permission_required="add_player",
+                max_queries=7,
+            ),
+            UrlToTest(
+                "/players/",
+                permission_required="list_view_player",
+                max_queries=7,
+            ),
             # TODO Раскомментировать при доработке пермишенов для страниц с
             #  игроками.
-            UrlToTest("/players/1/", permission_required="view_player"),
-            UrlToTest("/players/1/edit/", permission_required="change_player"),
-            UrlToTest("/teams/", permission_required="list_view_team"),
-            UrlToTest("/teams/1/", permission_required="view_team"),
-            UrlToTest("/teams/1/edit/", permission_required="change_team"),
-            UrlToTest("/teams/create/", permission_required="add_team"),
-            UrlToTest("/unloads/", permission_required="list_view_unload"),
+            UrlToTest(
+                "/players/1/",
+                permission_required="view_player",
+                max_queries=7,
+            ),
+            UrlToTest(
+                "/players/1/edit/",
+                permission_required="change_player",
+                max_queries=13,
+            ),
+            UrlToTest(
+                "/teams/",
+                permission_required="list_view_team",
+                max_queries=12,
+            ),
+            UrlToTest(
+                "/teams/1/",
+                permission_required="view_team",
+                max_queries=14,
+            ),
+            UrlToTest(
+                "/teams/1/edit/",
+                permission_required="change_team",
+                max_queries=10,
+            ),
+            UrlToTest(
+                "/teams/create/",
+                permission_required="add_team",
+                max_queries=6,
+            ),
+            UrlToTest(
+                "/unloads/",
+                permission_required="list_view_unload",
+                max_queries=5,
+            ),
             # TODO Раскомментировать при доработке пермишенов для страниц с
             #  пользователями.
-            UrlToTest("/users/create/", permission_required="add_user"),
-            UrlToTest("/users/", permission_required="list_view_user"),
-            UrlToTest("/users/1/edit/", permission_required="change_user"),
+            UrlToTest(
+                "/users/create/",
+                permission_required="add_user",
+                max_queries=7,
+            ),
+            UrlToTest(
+                "/users/",
+                permission_required="list_view_user",
+                max_queries=6,
+            ),
+            UrlToTest(
+                "/users/1/edit/",
+                permission_required="change_user",
+                max_queries=10,
+            ),
         ]
         urls_responses_results = []
 
@@ -235,6 +298,11 @@ class TestUrls(TestCase):
                 elif isinstance(estimated, (list, tuple)):
                     self.assertIn(fact, estimated, message)
 
+        for url in urls:
+            for fact, limit, message in url.budget_results:
+                with self.subTest(msg=message, fact=fact, limit=limit):
+                    self.assertLessEqual(fact, limit, message)
+
     def test_agent_has_access(self):
         """Доступ представителя к своей команде, ее игрокам и т.д."""
         # TODO: Добавить урлы тренеров и пушер-тьюторов по аналогии,
@@ -1,12 +1,24 @@
 import re
+import time
 from http import HTTPStatus
 from typing import Any
 
 from django.contrib.auth.models import Permission
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from core.constants import StaffPosition
+from main.data_factories.factories import (
+    PlayerFactory,
+    StaffTeamMemberFactory,
+)
+from main.models import Team
 from users.models import User
 
+DEFAULT_MAX_DURATION = 2.0
+TEAM_MEMBERS_AMOUNT = 2
+
 
 class UrlToTest:
     """
@@ -78,7 +90,22 @@ class UrlToTest:
             оставшихся подстановок возьмется последний элемент. Если в примере
             выше передать строку "1" или кортеж ("1",), то урл преобразуется в
             "/competitions/1/teams/1/add/". Если в урл нет динамических
-            идентификаторов, данный параметр не имеет значения.
+            идентификаторов, данный параметр не имеет значения;
+        max_queries:
+            наибольшее допустимое количество запросов к БД при одном
+            обращении к странице. Бюджет задается по фактическому числу
+            запросов на тестовых данных, в которых у команды несколько
+            игроков и сотрудников (см. fill_team), поэтому лишний запрос
+            (например, запрос в цикле по объектам) сразу приводит к
+            падению теста.
+            По умолчанию - None (не проверяется);
+        max_duration:
+            наибольшее допустимое время ответа страницы в секундах.
+            По умолчанию - DEFAULT_MAX_DURATION.
+
+    Результаты проверки бюджетов накапливаются в атрибуте budget_results
+    в виде кортежей (фактическое значение, предел, сообщение) для всех
+    запросов, выполненных execute_tests.
     """
 
     def __init__(
@@ -92,6 +119,8 @@ class UrlToTest:
         admin_only: bool = False,
         use_post: bool = False,
         path_render_subs: str | tuple[str, ...] | list[str] = "1",
+        max_queries: int | None = None,
+        max_duration: float = DEFAULT_MAX_DURATION,
     ):
         """
         Метод инициализации экземпляра класса.
@@ -123,11 +152,37 @@ class UrlToTest:
         self.request_method = ("GET", "POST")[self.use_post]
         self.path_for_message = f"{self.request_method}-запрос по адресу {url}"
         self.path = render_url(url, path_render_subs)
+        self.max_queries = max_queries
+        self.max_duration = max_duration
+        self.budget_results: list[tuple[float, float, str]] = []
 
     def _get_response(self, client: Client):
-        if self.use_post:
-            return client.post(self.path)
-        return client.get(self.path)
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            if self.use_post:
+                response = client.post(self.path)
+            else:
+                response = client.get(self.path)
+            duration = time.perf_counter() - started
+        queries = len(context.captured_queries)
+        if self.max_queries is not None:
+            self.budget_results.append(
+                (
+                    queries,
+                    self.max_queries,
+                    f"{self.path_for_message} выполнил {queries} запросов "
+                    f"к БД при бюджете {self.max_queries}.",
+                ),
+            )
+        self.budget_results.append(
+            (
+                duration,
+                self.max_duration,
+                f"{self.path_for_message} выполнялся {duration:.3f} с "
+                f"при бюджете {self.max_duration} с.",
+            ),
+        )
+        return response
 
     def _get_auth_response(
         self,
@@ -271,6 +326,7 @@ class UrlToTest:
         Возвращает список кортежей (ответ, ожидаемый ответ, сообщение)
         для всех вариантов GET-запросов к конкретному url.
         """
+        self.budget_results = []
         res = [self.unauthorized_test(client)]
         if self.permission and isinstance(self.permission, Permission):
             res.append(self.user_with_permission_test(client, user))
@@ -296,3 +352,22 @@ def render_url(url: str, subs: tuple | str | list):
     if re.search(pattern, url):
         url = re.sub(pattern, subs[-1], url)
     return url
+
+
+def fill_team(team: Team, amount: int = TEAM_MEMBERS_AMOUNT) -> None:
+    """
+    Добавить в команду amount игроков и сотрудников каждого статуса.
+
+    Бюджеты запросов max_queries рассчитаны на данные, в которых у
+    команды и в списках несколько записей: иначе запрос в цикле по
+    записям не увеличивает число запросов и не ловится тестом.
+    """
+    for player in PlayerFactory.create_batch(amount):
+        player.team.set([team])
+    for position in StaffPosition:
+        for staff in StaffTeamMemberFactory.create_batch(
+            amount,
+            staff_position=position,
+            staff_member__phone="",
+        ):
+            staff.team.set([team])
@@ -0,0 +1,163 @@
+import os
+import tempfile
+import unittest
+
+import cv2
+from service.video_processing import (
+    iter_frames,
+    make_synthetic_clip,
+    get_player_clip_name,
+    merge_frame_windows,
+    read_in_thread,
+    slicing_game_video,
+    slicing_video_with_player_frames,
+    split_segments,
+    write_clips,
+)
+
+CLIP_LENGTH = 60
+
+
+def read_frames(path: str) -> list:
+    """Все кадры видео."""
+    cap = cv2.VideoCapture(path)
+    frames = [frame for _, frame in iter(cap.read, (False, None))]
+    cap.release()
+    return frames
+
+
+class VideoProcessingTest(unittest.TestCase):
+    """Тесты нарезки видео с игроком."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Создание синтетического видео."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.input_file = os.path.join(cls.directory.name, "game.mp4")
+        make_synthetic_clip(cls.input_file, CLIP_LENGTH, 64, 48)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Удаление видео."""
+        cls.directory.cleanup()
+
+    def test_merge_frame_windows(self):
+        """Окна сортируются и объединяются без повторов кадров."""
+        self.assertEqual(
+            merge_frame_windows([40, 10, 12, 10, 15, 21], 5),
+            [(10, 20), (21, 26), (40, 45)],
+        )
+
+    def test_iter_frames(self):
+        """Кадры читаются верно и с перемоткой, и без нее."""
+        decoded = read_frames(self.input_file)
+        ranges = merge_frame_windows([10, 12, 40, 58], 5)
+        expected = [*range(10, 17), *range(40, 45), 58, 59]
+        for keyframe_distance in (0, CLIP_LENGTH):
+            with self.subTest(keyframe_distance=keyframe_distance):
+                cap = cv2.VideoCapture(self.input_file)
+                frames = list(iter_frames(cap, ranges, keyframe_distance))
+                cap.release()
+                self.assertEqual([number for number, _ in frames], expected)
+                for number, frame in frames:
+                    self.assertTrue((frame == decoded[number]).all())
+
+    def test_slicing(self):
+        """После конца видео кадры не записываются."""
+        output_file = os.path.join(self.directory.name, "player.mp4")
+        written = slicing_video_with_player_frames(
+            self.input_file,
+            output_file,
+            [CLIP_LENGTH - 2, CLIP_LENGTH + 10],
+        )
+        self.assertEqual(written, 2)
+        cap = cv2.VideoCapture(output_file)
+        self.assertEqual(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), 2)
+        cap.release()
+
+    def test_slicing_game(self):
+        """Общие кадры игроков попадают в нарезку каждого из них."""
+        written = slicing_game_video(
+            self.input_file,
+            [
+                {"number": 7, "team": 1, "frames": [10, 30]},
+                {"number": 9, "team": 2, "frames": [12, CLIP_LENGTH - 1]},
+            ],
+            self.directory.name,
+        )
+        first, second = (
+            os.path.join(self.directory.name, get_player_clip_name(*key))
+            for key in ((1, 7), (2, 9))
+        )
+        self.assertEqual(written, {first: 10, second: 6})
+        for output_file, frames in written.items():
+            cap = cv2.VideoCapture(output_file)
+            self.assertEqual(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), frames)
+            cap.release()
+
+    def test_parallel(self):
+        """Параллельная нарезка совпадает с последовательной."""
+        self.assertEqual(
+            split_segments([(0, 5), (10, 15), (30, 35), (50, 55)], 2),
+            [[(0, 5), (10, 15)], [(30, 35), (50, 55)]],
+        )
+        players = [
+            {"number": 7, "team": 1, "frames": [3, 10, 33, 50]},
+            {"number": 9, "team": 1, "frames": [12, 40, CLIP_LENGTH - 1]},
+        ]
+        clips = {}
+        for workers in (1, 3):
+            output_dir = os.path.join(self.directory.name, str(workers))
+            os.mkdir(output_dir)
+            written = slicing_game_video(
+                self.input_file,
+                players,
+                output_dir,
+                workers=workers,
+            )
+            clips[workers] = {
+                os.path.basename(path): (frames, read_frames(path))
+                for path, frames in written.items()
+            }
+        self.assertEqual(clips[1].keys(), clips[3].keys())
+        for name, (frames, decoded) in clips[1].items():
+            parallel_frames, parallel_decoded = clips[3][name]
+            self.assertEqual(frames, parallel_frames)
+            self.assertEqual(len(decoded), len(parallel_decoded))
+            for frame, parallel_frame in zip(
+                decoded,
+                parallel_decoded,
+                strict=True,
+            ):
+                self.assertTrue((frame == parallel_frame).all())
+
+    def test_pipeline(self):
+        """Кадры через очередь совпадают с чтением в одном потоке."""
+        output_files = [
+            os.path.join(self.directory.name, f"{name}.mp4")
+            for name in ("inline", "queued")
+        ]
+        for output_file, queue_size in zip(output_files, (0, 2), strict=True):
+            written = write_clips(
+                self.input_file,
+                {output_file: [3, 20, 40]},
+                scale=0.5,
+                step=2,
+                queue_size=queue_size,
+            )
+            self.assertEqual(written, {output_file: 8})
+        inline, queued = (read_frames(path) for path in output_files)
+        self.assertEqual(inline[0].shape, (24, 32, 3))
+        self.assertEqual(len(inline), len(queued))
+        for frame, queued_frame in zip(inline, queued, strict=True):
+            self.assertTrue((frame == queued_frame).all())
+
+    def test_pipeline_error(self):
+        """Ошибка потока декодирования пробрасывается в вызывающий."""
+
+        def frames():
+            yield 0, None
+            raise ValueError("decode")
+
+        with self.assertRaisesRegex(ValueError, "decode"):
+            list(read_in_thread(frames(), 1))
@@ -0,0 +1,130 @@
+from datetime import date
+from unittest import mock
+
+from core.constants import Role
+from core.models import ChangeWatermark
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from django.urls import reverse
+from main.data_factories.factories import CityFactory
+from main.models import City, DisciplineName, Nosology
+from tests.fixture_user import test_email, test_password
+from users.models import User
+
+
+class ConditionalGetTest(TestCase):
+    """Тесты ETag и 304 Not Modified по отметкам изменений."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создание тестовых данных."""
+        cls.user = User.objects.create_superuser(
+            email=test_email,
+            password=test_password,
+        )
+        cls.url = reverse("main:teams")
+
+    def setUp(self):
+        """Авторизация пользователя."""
+        self.client.force_login(self.user)
+
+    def freeze_watermarks(self):
+        """Не менять отметки: вход сам по себе обновляет пользователя."""
+        patcher = mock.patch(
+            "core.watermarks.get_watermark",
+            return_value=("", None),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_not_modified(self):
+        """Повторный запрос с ETag отдается без отрисовки страницы."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_modified_after_change(self):
+        """Изменение данных модели меняет ETag."""
+        etag = self.client.get(self.url).headers["ETag"]
+        CityFactory.create(name="Тверь")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertTrue(
+            ChangeWatermark.objects.filter(
+                model=City._meta.label_lower,
+            ).exists(),
+        )
+
+    def test_etag_depends_on_query(self):
+        """Разные страницы и фильтры получают разные ETag."""
+        first = self.client.get(self.url).headers["ETag"]
+        second = self.client.get(self.url, {"page": 1}).headers["ETag"]
+        self.assertNotEqual(first, second)
+
+    def test_modified_after_login(self):
+        """Новый вход меняет ETag: на странице новый CSRF-токен."""
+        self.freeze_watermarks()
+        etag = self.client.get(self.url).headers["ETag"]
+        self.client.logout()
+        self.client.login(email=test_email, password=test_password)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_modified_after_permission_change(self):
+        """Изменение прав пользователя меняет ETag."""
+        self.freeze_watermarks()
+        user = User.objects.create_user(
+            email="agent@example.com",
+            password=test_password,
+            role=Role.AGENT,
+        )
+        self.client.force_login(user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code,
+            304,
+        )
+        user.user_permissions.add(
+            Permission.objects.get(codename="add_team"),
+        )
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code,
+            200,
+        )
+
+    def test_ajax_not_modified(self):
+        """AJAX-список дисциплин отвечает 304, пока дисциплины не менялись."""
+        url = reverse("main:ajax_filter_discipline_search")
+        etag = self.client.get(url).headers["ETag"]
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            304,
+        )
+        DisciplineName.objects.create(name="Новая дисциплина")
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            200,
+        )
+
+    def test_analytics_etag(self):
+        """ETag аналитики зависит от нозологий, городов и текущей даты."""
+        url = reverse("analytics:analytics")
+        etag = self.client.get(url).headers["ETag"]
+        Nosology.objects.create(name="Новая нозология")
+        changed = self.client.get(url).headers["ETag"]
+        self.assertNotEqual(changed, etag)
+        CityFactory.create(name="Тверь")
+        self.assertNotEqual(self.client.get(url).headers["ETag"], changed)
+        etag = self.client.get(url).headers["ETag"]
+        with mock.patch(
+            "analytics.views.timezone.localdate",
+            return_value=date(2000, 1, 1),
+        ):
+            self.assertNotEqual(self.client.get(url).headers["ETag"], etag)
@@ -5,7 +5,16 @@ from unloads.models import Unload
 class UnloadAdmin(admin.ModelAdmin):
     """Админка для модели Выгрузки."""
 
-    list_display = ("unload_name", "date", "user", "unload_file_slug")
+    list_display = (
+        "unload_name",
+        "date",
+        "user",
+        "status",
+        "rows_count",
+        "duration",
+        "unload_file_slug",
+    )
+    list_filter = ("status",)
     search_fields = ("name",)
     ordering = ["date"]
 
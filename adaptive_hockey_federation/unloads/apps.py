@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
 
 
 class UnloadsConfig(AppConfig):
@@ -7,3 +8,12 @@ class UnloadsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "unloads"
     verbose_name = "Выгрузки"
+
+    def ready(self):
+        """Разбор оставшейся очереди выгрузок после запуска процесса."""
+        from unloads.jobs import RESUME_DISPATCH_UID, resume_on_startup
+
+        request_started.connect(
+            resume_on_startup,
+            dispatch_uid=RESUME_DISPATCH_UID,
+        )
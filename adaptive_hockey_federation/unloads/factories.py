@@ -4,6 +4,7 @@ from typing import Tuple
 
 import factory
 from competitions.models import Competition
+from core.constants import ExportConstants, UnloadStatus
 from core.utils import export_excel
 from django.db.models import QuerySet
 from main.models import Player, Team
@@ -21,6 +22,8 @@ class UnloadFactory(factory.django.DjangoModelFactory):
     date = factory.Faker("date_object")
     user = factory.SubFactory(UserFactory)
     unload_file_slug = factory.LazyAttribute(lambda o: "")
+    status = UnloadStatus.READY
+    progress = ExportConstants.PROGRESS_DONE
 
     @factory.post_generation
     def create_excel_file(self, create, extracted, **kwargs):
@@ -0,0 +1,287 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from core.constants import Directory, ExportConstants, UnloadStatus
+from core.utils import export_excel
+from django.apps import apps
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import close_old_connections, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from unloads.mapping import model_mapping
+from unloads.models import Unload
+from unloads.utils import model_get_queryset
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FIELDS = {
+    "User": (
+        ["id", "password", "is_active", "is_staff"],
+        [
+            "last_name",
+            "first_name",
+            "patronymic",
+            "email",
+            "phone",
+            "role",
+            "date_joined",
+        ],
+    ),
+    "Player": (
+        ["id"],
+        [
+            "surname",
+            "name",
+            "patronymic",
+            "diagnosis",
+            "discipline_name",
+            "discipline_level",
+            "birthday",
+            "addition_date",
+            "gender",
+            "level_revision",
+            "position",
+            "number",
+            "is_captain",
+            "is_assistent",
+            "identity_document",
+        ],
+    ),
+}
+
+RESUME_DISPATCH_UID = "unloads_resume_on_startup"
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_unload_filename(page_name: str, query_params: dict) -> str:
+    """Имя файла выгрузки (без отметки времени)."""
+    if query_params:
+        return page_name + "_search.xlsx"
+    return page_name + "_all.xlsx"
+
+
+def get_export_queryset(
+    page_name: str,
+    query_params: dict,
+) -> tuple[QuerySet | None, str, list[str], list[str]]:
+    """
+    Выборка и параметры колонок для выгрузки страницы.
+
+    Возвращает кортеж (queryset, заголовок, исключенные поля, порядок
+    полей).
+    """
+    if page_name not in model_mapping:
+        raise ValueError("Для данной страницы выгрузка не предусмотрена.")
+    app_label, model_name, title = model_mapping[page_name]
+    model = apps.get_model(app_label, model_name)
+    if query_params:
+        queryset = model_get_queryset(page_name, model, query_params, None)
+    else:
+        queryset = model.objects.all()
+    excluded_fields, fields_order = EXPORT_FIELDS.get(model_name, ([], []))
+    return queryset, title, excluded_fields, fields_order
+
+
+def get_claimable_filter() -> Q:
+    """
+    Условие задач, которые можно взять в работу.
+
+    Кроме задач в очереди берутся задачи, зависшие в формировании
+    дольше UNLOADS_LOCK_TIMEOUT: их исполнитель был остановлен
+    (например, при перезапуске веб-процесса).
+    """
+    stale = timezone.now() - timedelta(seconds=settings.UNLOADS_LOCK_TIMEOUT)
+    return Q(status=UnloadStatus.PENDING) | Q(
+        Q(locked_at__isnull=True) | Q(locked_at__lt=stale),
+        status=UnloadStatus.IN_PROGRESS,
+    )
+
+
+def claim_unload(pk: int) -> bool:
+    """
+    Захватить задачу выгрузки для выполнения.
+
+    Условный UPDATE гарантирует, что задачу возьмет только один
+    исполнитель, даже если их запущено несколько.
+    """
+    return bool(
+        Unload.objects.filter(get_claimable_filter(), pk=pk).update(
+            status=UnloadStatus.IN_PROGRESS,
+            locked_at=timezone.now(),
+        ),
+    )
+
+
+def get_pending_unload_ids(limit: int) -> list[int]:
+    """Идентификаторы задач, которые можно взять, от старых к новым."""
+    return list(
+        Unload.objects.filter(get_claimable_filter())
+        .order_by("pk")
+        .values_list("pk", flat=True)[:limit],
+    )
+
+
+class UnloadLockLostError(Exception):
+    """Задачу выгрузки забрал другой исполнитель."""
+
+
+def process_unload(unload: Unload) -> Unload:
+    """
+    Сформировать файл выгрузки и сохранить результат в задаче.
+
+    Пока файл формируется, locked_at обновляется и при чтении записей,
+    и при записи книги. Все изменения задачи - условные UPDATE по
+    статусу и отметке locked_at, с которыми задача была взята: если
+    задачу забрал другой исполнитель, формирование прерывается, а
+    результат не сохраняется.
+    """
+    started = time.monotonic()
+    status = unload.status
+
+    def get_owned() -> QuerySet:
+        return Unload.objects.filter(
+            pk=unload.pk,
+            status=status,
+            locked_at=unload.locked_at,
+        )
+
+    def heartbeat(**fields) -> None:
+        locked_at = timezone.now()
+        if not get_owned().update(locked_at=locked_at, **fields):
+            raise UnloadLockLostError(unload.pk)
+        unload.locked_at = locked_at
+
+    try:
+        queryset, title, excluded_fields, fields_order = get_export_queryset(
+            unload.page_name,
+            unload.query_params,
+        )
+        total = queryset.count() if queryset is not None else 0
+
+        def report_progress(rows_done: int) -> None:
+            percent = ExportConstants.PROGRESS_DONE - 1
+            if total:
+                percent = min(percent, rows_done * percent // total)
+            heartbeat(progress=percent, rows_count=rows_done)
+            unload.rows_count = rows_done
+
+        filename = export_excel(
+            queryset,
+            get_unload_filename(unload.page_name, unload.query_params),
+            title,
+            excluded_fields,
+            fields_order,
+            progress=report_progress,
+            heartbeat=heartbeat,
+        )
+    except UnloadLockLostError:
+        logger.warning("Выгрузку %s забрал другой исполнитель", unload.pk)
+        return unload
+    except Exception as error:
+        logger.exception("Ошибка при формировании выгрузки %s", unload.pk)
+        unload.status = UnloadStatus.FAILED
+        unload.error = str(error)
+    else:
+        unload.status = UnloadStatus.READY
+        unload.progress = ExportConstants.PROGRESS_DONE
+        unload.unload_name = filename
+        unload.unload_file_slug = os.path.join(Directory.UNLOAD_DIR, filename)
+    unload.duration = timedelta(seconds=time.monotonic() - started)
+    owned = get_owned()
+    unload.locked_at = None
+    if not owned.update(
+        **{
+            field: getattr(unload, field)
+            for field in (
+                "status",
+                "locked_at",
+                "progress",
+                "rows_count",
+                "duration",
+                "error",
+                "unload_name",
+                "unload_file_slug",
+            )
+        },
+    ):
+        logger.warning("Выгрузку %s забрал другой исполнитель", unload.pk)
+    return unload
+
+
+def run_unload(pk: int) -> Unload | None:
+    """Выполнить задачу выгрузки, если она еще не взята другим исполнителем."""
+    close_old_connections()
+    try:
+        if not claim_unload(pk):
+            return None
+        return process_unload(Unload.objects.get(pk=pk))
+    finally:
+        close_old_connections()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Пул потоков процесса для фонового формирования выгрузок."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.UNLOADS_WORKERS,
+                thread_name_prefix="unloads",
+            )
+    return _executor
+
+
+def drain_unloads() -> int:
+    """Выполнять задачи выгрузки, пока очередь не опустеет."""
+    total = 0
+    while pending := get_pending_unload_ids(settings.UNLOADS_WORKERS):
+        done = [
+            unload for pk in pending if (unload := run_unload(pk)) is not None
+        ]
+        if not done:
+            break
+        total += len(done)
+    return total
+
+
+def resume_unloads() -> None:
+    """
+    Разобрать очередь выгрузок пулом потоков веб-процесса.
+
+    Подхватывает и задачи, оставшиеся в очереди или зависшие в
+    формировании после перезапуска процесса.
+    """
+    if settings.UNLOADS_RUN_IN_PROCESS:
+        transaction.on_commit(lambda: get_executor().submit(drain_unloads))
+
+
+def resume_on_startup(**kwargs) -> None:
+    """
+    Разобрать очередь, оставшуюся с прошлого запуска веб-процесса.
+
+    Подключается к request_started в UnloadsConfig.ready (обращаться к
+    БД при загрузке приложений нельзя) и отключается после первого
+    запроса. Задачи, блокировка которых еще не истекла, подхватит
+    следующая постановка выгрузки или команда unloads-worker.
+    """
+    request_started.disconnect(dispatch_uid=RESUME_DISPATCH_UID)
+    resume_unloads()
+
+
+def enqueue_unload(unload: Unload) -> None:
+    """
+    Поставить выгрузку в очередь.
+
+    Задача уже сохранена в БД со статусом "В очереди", поэтому очередью
+    служит сама таблица выгрузок. Если UNLOADS_RUN_IN_PROCESS включен,
+    очередь сразу после коммита разбирается пулом потоков веб-процесса,
+    иначе задачу заберет команда unloads-worker.
+    """
+    resume_unloads()
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.13 on 2026-10-18 09:29
+
+import core.constants
+from django.db import migrations, models
+
+
+def mark_existing_ready(apps, schema_editor):
+    Unload = apps.get_model('unloads', 'Unload')
+    Unload.objects.all().update(status='ready', progress=100)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('unloads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unload',
+            name='duration',
+            field=models.DurationField(blank=True, null=True, verbose_name='Время формирования'),
+        ),
+        migrations.AddField(
+            model_name='unload',
+            name='error',
+            field=models.TextField(blank=True, verbose_name='Ошибка'),
+        ),
+        migrations.AddField(
+            model_name='unload',
+            name='page_name',
+            field=models.CharField(blank=True, max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], verbose_name='Страница выгрузки'),
+        ),
+        migrations.AddField(
+            model_name='unload',
+            name='progress',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Прогресс, %'),
+        ),
+        migrations.AddField(
+            model_name='unload',
+            name='query_params',
+            field=models.JSONField(blank=True, default=dict, verbose_name='Параметры поиска'),
+        ),
+        migrations.AddField(
+            model_name='unload',
+            name='rows_count',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Количество строк'),
+        ),
+        migrations.AddField(
+            model_name='unload',
+            name='status',
+            field=models.CharField(choices=[(core.constants.UnloadStatus['PENDING'], 'В очереди'), (core.constants.UnloadStatus['IN_PROGRESS'], 'Формируется'), (core.constants.UnloadStatus['READY'], 'Готово'), (core.constants.UnloadStatus['FAILED'], 'Ошибка')], db_index=True, default=core.constants.UnloadStatus['PENDING'], max_length=core.constants.MainConstantsInt['CHAR_FIELD_LENGTH'], verbose_name='Статус'),
+        ),
+        migrations.AlterField(
+            model_name='unload',
+            name='unload_file_slug',
+            field=models.FileField(blank=True, upload_to='unloads_data/', verbose_name='Ссылка на файл'),
+        ),
+        migrations.RunPython(
+            mark_existing_ready,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.13 on 2026-10-18 10:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('unloads', '0002_unload_job_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='unload',
+            index=models.Index(fields=['date', 'id'], name='unload_date_id_idx'),
+        ),
+    ]
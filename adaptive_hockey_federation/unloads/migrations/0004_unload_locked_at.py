@@ -0,0 +1,18 @@
+# Generated by Django 4.2.13 on 2026-10-18 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('unloads', '0003_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unload',
+            name='locked_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Взята в работу'),
+        ),
+    ]
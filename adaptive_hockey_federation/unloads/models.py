@@ -1,4 +1,9 @@
-from core.constants import Directory, MainConstantsInt
+from core.constants import (
+    UNLOAD_STATUS_CHOICES,
+    Directory,
+    MainConstantsInt,
+    UnloadStatus,
+)
 from django.db import models
 from django.db.models.signals import post_delete
 from django.dispatch.dispatcher import receiver
@@ -26,12 +31,56 @@ class Unload(models.Model):
     unload_file_slug = models.FileField(
         verbose_name=_("Ссылка на файл"),
         upload_to=Directory.UNLOAD_DIR + "/",
+        blank=True,
+    )
+    page_name = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        verbose_name=_("Страница выгрузки"),
+        blank=True,
+    )
+    query_params = models.JSONField(
+        verbose_name=_("Параметры поиска"),
+        default=dict,
+        blank=True,
+    )
+    status = models.CharField(
+        max_length=MainConstantsInt.CHAR_FIELD_LENGTH,
+        choices=UNLOAD_STATUS_CHOICES,
+        default=UnloadStatus.PENDING,
+        verbose_name=_("Статус"),
+        db_index=True,
+    )
+    progress = models.PositiveSmallIntegerField(
+        verbose_name=_("Прогресс, %"),
+        default=0,
+    )
+    rows_count = models.PositiveIntegerField(
+        verbose_name=_("Количество строк"),
+        null=True,
+        blank=True,
+    )
+    duration = models.DurationField(
+        verbose_name=_("Время формирования"),
+        null=True,
+        blank=True,
+    )
+    error = models.TextField(
+        verbose_name=_("Ошибка"),
+        blank=True,
+    )
+    locked_at = models.DateTimeField(
+        verbose_name=_("Взята в работу"),
+        null=True,
+        blank=True,
     )
 
     class Meta:
         verbose_name = "Выгрузку"
         verbose_name_plural = "Выгрузки"
         ordering = ("date",)
+        indexes = [
+            models.Index(fields=["date", "id"], name="unload_date_id_idx"),
+        ]
         permissions = [
             ("list_view_unload", "Can view list of Выгрузку"),
         ]
@@ -40,6 +89,11 @@ class Unload(models.Model):
         """Метод, использующий unload_name для строкового представления."""
         return f"{self.unload_name}"
 
+    @property
+    def is_ready(self) -> bool:
+        """Файл выгрузки сформирован и доступен для скачивания."""
+        return self.status == UnloadStatus.READY
+
 
 @receiver(post_delete, sender=Unload)
 def document_file_delete(sender, instance, **kwargs):
@@ -15,6 +15,11 @@ unloads_urlpattern = [
         views.DeleteUnloadView.as_view(),
         name="delete_unload",
     ),
+    path(
+        "<int:pk>/status/",
+        views.UnloadStatusView.as_view(),
+        name="unload_status",
+    ),
 ]
 
 urlpatterns = [
@@ -1,4 +1,5 @@
 from analytics.schema import ANALYTICS_SEARCH_FIELDS
+from core.search import search_queryset
 from django.db.models import Q
 from main.schemas.player_schema import SEARCH_FIELDS
 
@@ -24,12 +25,27 @@ def create_lookup_all(dict_param) -> Q:
     return or_lookup_all
 
 
+def search_all_players(queryset, dict_param):
+    """
+    Функция поиска игроков по всем полям.
+
+    Использует индекс поиска с ранжированием (PostgreSQL), на остальных
+    СУБД - поиск по вхождению подстроки.
+    """
+    found = search_queryset(queryset, dict_param["search"][0])
+    if found is not None:
+        return found
+    return queryset.filter(create_lookup_all(dict_param))
+
+
 def players_get_queryset(model, dict_param, queryset):
     """Функция создания запроса для игроков."""
+    if queryset is None:
+        queryset = model.objects.all()
     or_lookup: Q = Q()
     search_column_name: str = dict_param["search_column"][0]
     if search_column_name.lower() in ["все", "all"]:
-        or_lookup |= create_lookup_all(dict_param)
+        return search_all_players(queryset, dict_param)
     elif search_column_name == "birthday":
         for choice in SEARCH_FIELDS["birthday"]:
             if choice in dict_param:
@@ -50,10 +66,7 @@ def players_get_queryset(model, dict_param, queryset):
             (f"{SEARCH_FIELDS[search_column_name]}__icontains", search),
         )
 
-    if queryset:
-        return queryset.filter(or_lookup)
-    else:
-        return model.objects.filter(or_lookup)
+    return queryset.filter(or_lookup)
 
 
 def analytics_get_queryset(model, dict_param, queryset):
@@ -63,7 +76,7 @@ def analytics_get_queryset(model, dict_param, queryset):
         if key in dict_param:
             or_lookup &= Q((value, checking_value(dict_param[key][0])))
 
-    if queryset:
+    if queryset is not None:
         queryset = queryset.filter(or_lookup)
     else:
         queryset = model.objects.filter(or_lookup)
@@ -76,6 +89,11 @@ def users_get_queryset(model, dict_param, queryset):
         search = dict_param["search"][0]
         search_column = dict_param["search_column"][0]
         if not search_column or search_column.lower() in ["все", "all"]:
+            if queryset is None:
+                queryset = model.objects.all()
+            found = search_queryset(queryset, search)
+            if found is not None:
+                return found
             or_lookup = (
                 Q(first_name__icontains=search)
                 | Q(last_name__icontains=search)
@@ -85,10 +103,7 @@ def users_get_queryset(model, dict_param, queryset):
                 | Q(email__icontains=search)
                 | Q(phone__icontains=search)
             )
-            if queryset:
-                queryset = queryset.filter(or_lookup)
-            else:
-                model.objects.filter(or_lookup)
+            queryset = queryset.filter(or_lookup)
         else:
             search_fields = {
                 "date": "date_joined",
@@ -97,7 +112,7 @@ def users_get_queryset(model, dict_param, queryset):
                 "phone": "phone",
             }
             lookup = {f"{search_fields[search_column]}__icontains": search}
-            if queryset:
+            if queryset is not None:
                 queryset = queryset.filter(**lookup)
             else:
                 queryset = model.objects.filter(**lookup)
@@ -105,10 +120,15 @@ def users_get_queryset(model, dict_param, queryset):
 
 
 def teams_get_queryset(model, dict_param, queryset):
+    """
+    Функция создания запроса для команд.
+
+    Название ищется по индексу поиска (только по группе с названием
+    команды), на остальных СУБД - по вхождению подстроки.
+    """
     filter = {
         "city": "city__id",
         "discipline": "discipline_name__in",
-        "name": "name__icontains",
     }
     lookup = {}
     for param_key, param_value in dict_param.items():
@@ -116,10 +136,16 @@ def teams_get_queryset(model, dict_param, queryset):
             param = filter.get(param_key)
             if param is not None:
                 lookup[param] = param_value[0]
-    if queryset:
+    if queryset is not None:
         queryset = queryset.filter(**lookup)
     else:
         queryset = model.objects.filter(**lookup)
+    name = dict_param.get("name", [""])[0]
+    if name:
+        found = search_queryset(queryset, name, weights="A")
+        if found is not None:
+            return found
+        queryset = queryset.filter(name__icontains=name)
 
     return queryset
 
@@ -1,28 +1,30 @@
-import os
+from datetime import timedelta
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
-from core.utils import export_excel
-from django.apps import apps
+from core.constants import UNLOAD_ACTIVE_STATUSES
+from core.pagination import KeysetPaginationMixin
 from django.conf import settings
+from django.contrib import messages
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
 )
-from django.http import FileResponse
-from django.shortcuts import get_object_or_404
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
 from django.views import View
 from django.views.generic.edit import DeleteView
 from django.views.generic.list import ListView
+from unloads.jobs import enqueue_unload, get_unload_filename
 from unloads.mapping import model_mapping
 from unloads.models import Unload
-from unloads.utils import model_get_queryset
 
 
 class UnloadListView(
     LoginRequiredMixin,
     PermissionRequiredMixin,
+    KeysetPaginationMixin,
     ListView,
 ):
     """Список выгрузок."""
@@ -35,7 +37,19 @@ class UnloadListView(
     )
     context_object_name = "unloads"
     paginate_by = 10
-    ordering = ["date"]
+    ordering = ["date", "pk"]
+    keyset_ordering = ("date",)
+
+    def get_queryset(self):
+        """Выгрузки вместе с авторами одним запросом."""
+        return super().get_queryset().select_related("user")
+
+    @staticmethod
+    def format_duration(duration: timedelta | None) -> str:
+        """Время формирования выгрузки в секундах."""
+        if duration is None:
+            return ""
+        return f"{duration.total_seconds():.1f} с"
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """Получить словарь context для шаблона страницы."""
@@ -43,19 +57,30 @@ class UnloadListView(
         unloads = context["unloads"]
         table_data = []
         for unload in unloads:
+            if unload.is_ready:
+                file_cell = {
+                    "name": "Посмотреть/Excel",
+                    "type": "button",
+                    "url": f"{settings.MEDIA_URL}/{unload.unload_file_slug}",
+                }
+            else:
+                file_cell = ""
             table_data.append(
                 {
                     "pk": unload.pk,
                     "date": unload.date,
                     "unload_name": unload.unload_name,
                     "user": unload.user,
-                    "_ref_": {
-                        "name": "Посмотреть/Excel",
-                        "type": "button",
-                        "url": (
-                            f"{settings.MEDIA_URL}/{unload.unload_file_slug}"
-                        ),
+                    "_status_": {
+                        "display": unload.get_status_display(),
+                        "progress": unload.progress,
+                        "active": unload.status in UNLOAD_ACTIVE_STATUSES,
                     },
+                    "rows_count": (
+                        "" if unload.rows_count is None else unload.rows_count
+                    ),
+                    "duration": self.format_duration(unload.duration),
+                    "_ref_": file_cell,
                 },
             )
         context["table_head"] = {
@@ -63,9 +88,15 @@ class UnloadListView(
             "date": "Дата",
             "unload_name": "Наименование",
             "user": "Автор",
+            "status": "Статус",
+            "rows_count": "Строк",
+            "duration": "Время",
             "unload_file_slug": "Просмотр/Excel",
         }
         context["table_data"] = table_data
+        context["has_active_unloads"] = any(
+            row["_status_"]["active"] for row in table_data
+        )
         return context
 
 
@@ -87,86 +118,46 @@ class DeleteUnloadView(
 
 
 class DataExportView(LoginRequiredMixin, View):
-    """Выгрузка данных в Excel."""
+    """Постановка выгрузки данных в Excel в очередь."""
 
     def get(self, request, *args, **kwargs):
         """Обработчиков GET-запросов."""
         page_name = kwargs.get("page_name")
-        if page_name in model_mapping:
-            app_label, model_name, title = model_mapping[page_name]
-            model = apps.get_model(app_label, model_name)
-            last_url = request.META.get("HTTP_REFERER")
-            parsed = urlparse(last_url)
-            params = parse_qs(parsed.query)
-            if len(params) >= 1:
-                queryset = model_get_queryset(page_name, model, params, None)
-                filename = page_name + "_search.xlsx"
-            else:
-                queryset = model.objects.all()
-                filename = page_name + "_all.xlsx"
-            if model_name == "User":
-                excluded_fields = ["id", "password", "is_active", "is_staff"]
-                fields_order = [
-                    "last_name",
-                    "first_name",
-                    "patronymic",
-                    "email",
-                    "phone",
-                    "role",
-                    "date_joined",
-                ]
-            elif model_name == "Player":
-                excluded_fields = ["id"]
-                fields_order = [
-                    "surname",
-                    "name",
-                    "patronymic",
-                    "diagnosis",
-                    "discipline_name",
-                    "discipline_level",
-                    "birthday",
-                    "addition_date",
-                    "gender",
-                    "level_revision",
-                    "position",
-                    "number",
-                    "is_captain",
-                    "is_assistent",
-                    "identity_document",
-                ]
-            else:
-                excluded_fields = []
-                fields_order = []
-            filename = export_excel(
-                queryset,
-                filename,
-                title,
-                excluded_fields,
-                fields_order,
-            )
+        if page_name not in model_mapping:
+            raise Http404("Для данной страницы выгрузка не предусмотрена.")
+        last_url = request.META.get("HTTP_REFERER")
+        query_params = parse_qs(urlparse(last_url).query) if last_url else {}
+        unload = Unload.objects.create(
+            unload_name=get_unload_filename(page_name, query_params),
+            user=request.user,
+            page_name=page_name,
+            query_params=query_params,
+        )
+        enqueue_unload(unload)
+        messages.info(
+            request,
+            f"Выгрузка «{model_mapping[page_name][2]}» поставлена в очередь. "
+            f"Файл появится в списке выгрузок после формирования.",
+        )
+        return redirect("unloads:unloads")
 
-            file_slug = f"unloads_data/{filename}"
 
-            unload_record = Unload(
-                unload_name=filename,
-                user=request.user,
-                unload_file_slug=file_slug,
-            )
-            unload_record.save()
+class UnloadStatusView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """Состояние задачи выгрузки в формате JSON."""
 
-            file_path = os.path.join(
-                settings.MEDIA_ROOT,
-                "unloads_data",
-                filename,
-            )
-            if os.path.exists(file_path):
-                file_unload = open(file_path, "rb")
-                response = FileResponse(file_unload)
-                response["Content-Disposition"] = (
-                    f'attachment; filename="{filename}"'
-                )
-                return response
-            else:
-                raise FileNotFoundError("Файл для выгрузки не найден.")
-        else:
-            raise Exception("Для данной страницы выгрузка не предусмотрена.")
+    permission_required = "unloads.list_view_unload"
+
+    def get(self, request, *args, **kwargs):
+        """Обработчик GET-запросов."""
+        unload = get_object_or_404(Unload, pk=kwargs["pk"])
+        return JsonResponse(
+            {
+                "status": unload.status,
+                "status_display": unload.get_status_display(),
+                "progress": unload.progress,
+                "rows_count": unload.rows_count,
+                "url": (
+                    unload.unload_file_slug.url if unload.is_ready else None
+                ),
+            },
+        )
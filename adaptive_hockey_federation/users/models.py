@@ -1,6 +1,7 @@
 from typing import Iterable
 
 from core.constants import GROUPS_BY_ROLE, ROLES_CHOICES, Role, UserConstans
+from core.search import get_phone_search_terms, update_search_vectors
 from core.validators import fio_validator
 from django.contrib.auth.models import (
     AbstractBaseUser,
@@ -9,8 +10,11 @@ from django.contrib.auth.models import (
 )
 from django.core.exceptions import ValidationError
 from django.core.mail import send_mail
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import EmailValidator
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.http import Http404
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -19,6 +23,18 @@ from phonenumber_field.validators import validate_international_phonenumber
 from users.managers import CustomUserManager
 from users.validators import zone_code_without_seven_hundred
 
+USER_SEARCH_FIELDS = frozenset(
+    (
+        "first_name",
+        "last_name",
+        "patronymic",
+        "email",
+        "phone",
+        "role",
+        "date_joined",
+    ),
+)
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     """
@@ -89,6 +105,11 @@ class User(AbstractBaseUser, PermissionsMixin):
         default=True,
         verbose_name=_("Показывает статус он-лайн."),
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name=_("Индекс поиска"),
+    )
 
     objects = CustomUserManager()
 
@@ -113,6 +134,18 @@ class User(AbstractBaseUser, PermissionsMixin):
         """Использует метод get_initials() для строкового представления."""
         return self.get_initials()
 
+    def get_search_document(self):
+        """Тексты для индекса поиска: ФИО, контакты и роль, дата."""
+        return (
+            (self.last_name, self.first_name, self.patronymic),
+            (self.email, *get_phone_search_terms(self.phone), self.role),
+            (
+                str(self.date_joined.year),
+                str(self.date_joined.month),
+                str(self.date_joined.day),
+            ),
+        )
+
     def get_initials(self) -> str:
         """
         Возвращает фамилию и инициалы пользователя.
@@ -225,3 +258,17 @@ class ProxyGroup(Group):
         if (obj := cls.objects.filter(name=name)).exists():
             return obj.first()
         return None
+
+
+@receiver(post_save, sender=User)
+def user_search_vector_update(
+    sender,
+    instance,
+    raw,
+    using,
+    update_fields,
+    **kwargs,
+):
+    if raw or (update_fields and USER_SEARCH_FIELDS.isdisjoint(update_fields)):
+        return
+    update_search_vectors([instance], using)
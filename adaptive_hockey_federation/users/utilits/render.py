@@ -1,18 +1,19 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.template import Context
+from django.template.loader import get_template
 
+Recipient = Tuple[List[str], Dict[str, Any]]
 
-def render_email_message(
+
+def build_email_message(
     subject: str,
-    context: Dict[str, Any],
+    html_body: str,
     from_email: str,
     to: List[str],
-    template: str,
 ) -> EmailMultiAlternatives:
-    """Функция визуализации электронного письма из html-шаблона."""
-    html_body = render_to_string(template, context)
+    """Письмо с готовой HTML-версией."""
     email = EmailMultiAlternatives(
         subject=subject,
         from_email=from_email,
@@ -20,3 +21,50 @@ def render_email_message(
     )
     email.attach_alternative(html_body, "text/html")
     return email
+
+
+def render_email_message(
+    subject: str,
+    context: Dict[str, Any],
+    from_email: str,
+    to: List[str],
+    template: str,
+) -> EmailMultiAlternatives:
+    """Функция визуализации электронного письма из html-шаблона."""
+    return render_email_messages(
+        subject,
+        [(to, context)],
+        from_email,
+        template,
+    )[0]
+
+
+def render_email_messages(
+    subject: str,
+    recipients: Iterable[Recipient],
+    from_email: str,
+    template: str,
+    common_context: Dict[str, Any] | None = None,
+) -> List[EmailMultiAlternatives]:
+    """
+    Визуализация писем многим получателям по одному html-шаблону.
+
+    recipients - пары (адреса, контекст получателя). Шаблон загружается
+    и компилируется один раз, контекст common_context общий для всех
+    писем, а контекст получателя накладывается на него только на время
+    отрисовки его письма. Результат можно отправить одним вызовом
+    send_messages или поставить в очередь через queue_emails.
+    """
+    compiled = get_template(template)
+    context = Context(
+        common_context,
+        autoescape=compiled.backend.engine.autoescape,
+    )
+    messages = []
+    for to, recipient_context in recipients:
+        with context.update(recipient_context):
+            html_body = compiled.template.render(context)
+        messages.append(
+            build_email_message(subject, html_body, from_email, to),
+        )
+    return messages
@@ -4,6 +4,7 @@ import sys
 
 from competitions.models import Competition
 from core.config import dev_settings
+from core.outbox import queue_email
 from django.contrib.auth.tokens import default_token_generator
 from django.core.mail import send_mail
 from django.urls import reverse
@@ -19,7 +20,7 @@ def send_password_reset_email(
     message: str | None = None,
     template: str | None = None,
 ) -> None:
-    """Отправка письма с ссылкой восстановления пароля."""
+    """Постановка в очередь письма с ссылкой восстановления пароля."""
     if template is None:
         template = "emailing/password_reset_email.html"
     reset_link = get_password_reset_link(instance)
@@ -36,7 +37,7 @@ def send_password_reset_email(
         ],
         template=template,
     )
-    email.send(fail_silently=False)
+    queue_email(email)
 
 
 def get_password_reset_link(instance: User) -> str:
@@ -69,7 +70,7 @@ def send_welcome_mail(
     competition: Competition,
     curator_email: str,
 ) -> None:
-    """Отправка пригласительного письма."""
+    """Постановка в очередь пригласительного письма."""
     template = "emailing/welcome_letter.html"
     link = reverse(
         "competitions:competition_id",
@@ -90,13 +91,14 @@ def send_welcome_mail(
             ],
             template=template,
         )
-        email.send(fail_silently=False)
+        queue_email(email)
         logger.info(
-            f"Электронное письмо успешно отправлено на адрес {curator_email}",
+            "Электронное письмо поставлено в очередь на адрес "
+            f"{curator_email}",
         )
     except Exception as e:
         logger.error(
-            "Произошла ошибка при отправке электронного письма"
+            "Произошла ошибка при подготовке электронного письма"
             f" на {curator_email}: {e}",
         )
 
@@ -1,3 +1,4 @@
+from core.search import order_by_rank, search_queryset
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
@@ -40,6 +41,9 @@ class UsersListView(
         search = search_params.get("search")
         if search_column:
             if search_column and search_column.lower() in ["все", "all"]:
+                found = search_queryset(queryset, search)
+                if found is not None:
+                    return order_by_rank(found, "last_name")
                 or_lookup = (
                     Q(first_name__icontains=search)
                     | Q(last_name__icontains=search)